@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""
+SeqAlignX - Benchmark de Desempenho
+
+Mede o tempo (e, opcionalmente, o pico de memória) de cada motor de
+alinhamento para pares sintéticos de tamanhos e similaridades variados,
+gerados com as mesmas funções de generate_test_data.py e semente fixa.
+Os resultados são gravados em JSON para comparação entre commits; com
+--baseline, a execução falha se algum motor ficar mais lento que o limite.
+"""
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Indisponível no Windows
+    resource = None
+
+import main
+from generate_test_data import generate_sequence, generate_related_sequences
+
+DEFAULT_LENGTHS = [100, 1000, 10000, 100000]
+DEFAULT_SIMILARITIES = [0.2, 0.5, 0.8, 1.0]
+DEFAULT_SEED = 42
+
+# Orçamentos de células (m * n) acima dos quais a medição é pulada
+DEFAULT_MAX_CELLS = 25_000_000
+DEFAULT_MAX_MATRIX_CELLS = 4_000_000
+
+# Abaixo desta similaridade a faixa do motor banded tende à matriz inteira
+BANDED_MIN_SIMILARITY = 0.9
+
+
+def parse_args(args: list) -> argparse.Namespace:
+    """
+    Analisa os argumentos da linha de comando.
+
+    Args:
+        args: Lista de argumentos (ex: sys.argv[1:])
+
+    Returns:
+        argparse.Namespace: Objeto com os argumentos analisados
+    """
+    parser = argparse.ArgumentParser(
+        description="SeqAlignX - Benchmark de desempenho dos motores"
+    )
+    parser.add_argument(
+        "--lengths", type=int, nargs="+", default=DEFAULT_LENGTHS,
+        help="Tamanhos das sequências em bp (padrão: 100 1000 10000 100000)"
+    )
+    parser.add_argument(
+        "--similarities", type=float, nargs="+", default=DEFAULT_SIMILARITIES,
+        help="Similaridades entre 0 e 1 (padrão: 0.2 0.5 0.8 1.0)"
+    )
+    parser.add_argument(
+        "--engines", nargs="+", default=None,
+        help="Motores a medir (padrão: todos os disponíveis)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=DEFAULT_SEED,
+        help=f"Semente dos pares sintéticos (padrão: {DEFAULT_SEED})"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Repetições por medição; vale o menor tempo (padrão: 3)"
+    )
+    parser.add_argument(
+        "--max-cells", type=int, default=DEFAULT_MAX_CELLS,
+        help="Pula motores de memória linear acima deste número de células "
+             f"(padrão: {DEFAULT_MAX_CELLS})"
+    )
+    parser.add_argument(
+        "--max-matrix-cells", type=int, default=DEFAULT_MAX_MATRIX_CELLS,
+        help="Pula motores que guardam a matriz inteira acima deste número "
+             f"de células (padrão: {DEFAULT_MAX_MATRIX_CELLS})"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true",
+        help="Não mede o pico de memória com tracemalloc"
+    )
+    parser.add_argument(
+        "--output", default="benchmark.json",
+        help="Arquivo JSON de saída (padrão: benchmark.json)"
+    )
+    parser.add_argument(
+        "--baseline", default=None,
+        help="JSON de uma execução anterior para detectar regressões"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=10.0,
+        help="Lentidão máxima tolerada em relação ao baseline, em %% "
+             "(padrão: 10)"
+    )
+    return parser.parse_args(args)
+
+
+def generate_pair(length: int, similarity: float, seed: int) -> tuple:
+    """
+    Gera um par sintético determinístico.
+
+    A semente combina o valor base com o tamanho e a similaridade, de modo
+    que cada par é o mesmo em qualquer execução, independentemente de
+    quais outros pares foram pedidos.
+
+    Args:
+        length: Tamanho da primeira sequência
+        similarity: Probabilidade de manter cada base
+        seed: Semente base
+
+    Returns:
+        tuple: (seq1, seq2)
+    """
+    random.seed(f"{seed}-{length}-{similarity}")
+    seq1 = generate_sequence(length)
+    seq2 = generate_related_sequences(seq1, similarity)
+    return seq1, seq2
+
+
+def _full_matrix_phases(seq1: str, seq2: str) -> list:
+    """Fases do motor de matriz completa, cada uma medida separadamente."""
+    def new_matrix():
+        return main.create_score_matrix(seq1, seq2)
+
+    def filled_matrix():
+        return main.fill_score_matrix(new_matrix(), seq1, seq2)
+
+    return [
+        ("create_score_matrix", None, lambda _: new_matrix()),
+        ("fill_score_matrix", new_matrix,
+         lambda matrix: main.fill_score_matrix(matrix, seq1, seq2)),
+        ("traceback", filled_matrix,
+         lambda matrix: main.traceback(matrix, seq1, seq2)),
+    ]
+
+
+def engine_phases(engine: str, seq1: str, seq2: str) -> list:
+    """
+    Retorna as fases mensuráveis de um motor para um par.
+
+    Cada fase tem uma preparação opcional (não cronometrada) cujo
+    resultado é passado à função medida.
+
+    Args:
+        engine: Nome do motor
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+
+    Returns:
+        list: Tuplas (nome da fase, preparação ou None, função)
+    """
+    if engine == "full":
+        return _full_matrix_phases(seq1, seq2)
+
+    single_phase = {
+        "numpy": ("fill_score_matrix_numpy",
+                  lambda _: main.fill_score_matrix_numpy(seq1, seq2)),
+        "needleman_wunsch": ("needleman_wunsch",
+                             lambda _: main.needleman_wunsch(seq1, seq2)),
+        # Distância de edição (match 0, mismatch -1, gap -1): bit-paralelo
+        "bitparallel": ("myers_edit_distance",
+                        lambda _: main.needleman_wunsch(seq1, seq2, 0, -1, -1)),
+        "hirschberg": ("hirschberg", lambda _: main.hirschberg(seq1, seq2)),
+        "banded": ("banded_needleman_wunsch",
+                   lambda _: main.banded_needleman_wunsch(seq1, seq2)),
+        "pointers": ("pointer_needleman_wunsch",
+                     lambda _: main.pointer_needleman_wunsch(seq1, seq2)),
+        "checkpoint": ("checkpoint_alignment",
+                       lambda _: main.checkpoint_alignment(seq1, seq2)),
+        # Heurístico: DP apenas entre as âncoras encadeadas
+        "anchored": ("anchored_alignment",
+                     lambda _: main.anchored_alignment(seq1, seq2)),
+        # Blocos em paralelo só acima de WAVEFRONT_MIN_CELLS células
+        "wavefront": ("wavefront_last_row",
+                      lambda _: main.wavefront_last_row(seq1, seq2)),
+        "gotoh": ("gotoh_score",
+                  lambda _: main.gotoh_score(seq1, seq2, 1, -1, -2, -1)),
+    }
+    if engine not in single_phase:
+        raise ValueError(f"Motor desconhecido: {engine}")
+    phase, func = single_phase[engine]
+    return [(phase, None, func)]
+
+
+def available_engines() -> list:
+    """Lista os motores disponíveis neste ambiente."""
+    engines = ["needleman_wunsch", "bitparallel", "full", "pointers",
+               "hirschberg", "banded", "gotoh", "wavefront", "checkpoint",
+               "anchored"]
+    if main.np is not None:
+        engines.append("numpy")
+    return engines
+
+
+def should_skip(engine: str, cells: int, similarity: float,
+                args: argparse.Namespace) -> bool:
+    """
+    Decide se uma medição excede o orçamento configurado.
+
+    Args:
+        engine: Nome do motor
+        cells: Número de células (m * n) do par
+        similarity: Similaridade do par
+        args: Argumentos do benchmark
+
+    Returns:
+        bool: True se a medição deve ser pulada
+    """
+    if engine in ("full", "numpy"):
+        return cells > args.max_matrix_cells
+    if engine in ("banded", "anchored") and similarity >= BANDED_MIN_SIMILARITY:
+        return False
+    if engine == "bitparallel":
+        # Uma operação inteira por coluna: cabe no benchmark completo
+        return False
+    return cells > args.max_cells
+
+
+def measure(func, repeat: int = 3, memory: bool = True, setup=None) -> tuple:
+    """
+    Mede o menor tempo de `repeat` execuções e, opcionalmente, o pico de
+    memória alocada (tracemalloc) em uma execução adicional.
+
+    Args:
+        func: Função a medir; recebe o resultado de `setup` (ou None)
+        repeat: Número de execuções cronometradas
+        memory: Se True, mede o pico de memória
+        setup: Preparação executada antes de cada execução, fora da medição
+
+    Returns:
+        tuple: (segundos, pico em bytes ou None)
+    """
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        data = setup() if setup else None
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if memory:
+        data = setup() if setup else None
+        tracemalloc.start()
+        try:
+            func(data)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return best, peak
+
+
+def max_rss_kb():
+    """Retorna o pico de memória residente do processo em KiB, se disponível."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # No macOS ru_maxrss é medido em bytes; no Linux, em KiB
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def git_commit():
+    """Retorna o hash do commit atual, se o diretório for um repositório git."""
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"],
+                                capture_output=True, text=True, check=True)
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    """
+    Executa todas as medições pedidas.
+
+    Args:
+        args: Argumentos do benchmark
+
+    Returns:
+        dict: {"meta": {...}, "results": [...]}
+    """
+    engines = args.engines or available_engines()
+    results = []
+
+    for length in args.lengths:
+        for similarity in args.similarities:
+            seq1, seq2 = generate_pair(length, similarity, args.seed)
+            cells = len(seq1) * len(seq2)
+            for engine in engines:
+                if should_skip(engine, cells, similarity, args):
+                    print(f"[--] {engine:<18} {length:>7} bp  "
+                          f"{similarity:.0%}  pulado (orçamento)")
+                    continue
+                for phase, setup, func in engine_phases(engine, seq1, seq2):
+                    seconds, peak = measure(func, args.repeat,
+                                            not args.no_memory, setup)
+                    results.append({
+                        "engine": engine,
+                        "phase": phase,
+                        "length": length,
+                        "similarity": similarity,
+                        "cells": cells,
+                        "seconds": seconds,
+                        "cells_per_second": (cells / seconds if seconds
+                                             else None),
+                        "peak_bytes": peak,
+                        "max_rss_kb": max_rss_kb(),
+                    })
+                    print(f"[OK] {engine:<18} {length:>7} bp  "
+                          f"{similarity:.0%}  {phase:<24} {seconds:9.4f} s")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+
+def _result_key(result: dict) -> tuple:
+    return (result["engine"], result["phase"], result["length"],
+            result["similarity"])
+
+
+def find_regressions(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Compara duas execuções e lista as medições mais lentas que o limite.
+
+    Args:
+        baseline: Resultado de uma execução anterior
+        current: Resultado da execução atual
+        threshold: Lentidão máxima tolerada, em porcentagem
+
+    Returns:
+        list: Tuplas (chave, segundos antes, segundos agora, % de variação)
+    """
+    previous = {_result_key(r): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        old = previous.get(_result_key(result))
+        if not old:
+            continue
+        change = (result["seconds"] - old) / old * 100
+        if change > threshold:
+            regressions.append((_result_key(result), old, result["seconds"],
+                                change))
+    return regressions
+
+
+def main_benchmark(argv: list = None) -> int:
+    """
+    Executa o benchmark pela linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        int: Código de saída (1 se houver regressão)
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    # Lido antes de gravar a saída, que pode ser o mesmo arquivo
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    print("=" * 70)
+    print("SeqAlignX - Benchmark de Desempenho")
+    print("=" * 70)
+
+    report = run_benchmark(args)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n[OK] Resultados salvos em: {args.output}")
+
+    if baseline is not None:
+        regressions = find_regressions(baseline, report, args.threshold)
+        for key, old, new, change in regressions:
+            print(f"[REGRESSÃO] {' / '.join(str(k) for k in key)}: "
+                  f"{old:.4f} s -> {new:.4f} s (+{change:.1f}%)")
+        if regressions:
+            return 1
+        print(f"[OK] Nenhuma regressão acima de {args.threshold}%")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_benchmark())
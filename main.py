@@ -11,12 +11,222 @@ alinhamento possível entre duas sequências.
 import argparse
 import sys
 import os
+import io
+import gzip
+import itertools
+import math
+import operator
+import mmap
+import re
+import functools
+import bisect
+import contextlib
+import cProfile
+import platform
+import tracemalloc
+import hashlib
+import heapq
+import json
+import sqlite3
+import time
+import zlib
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: o backend Python puro é o padrão
+    np = None
 
 # Constantes de pontuação (Globais para referência, mas podem ser sobrescritas)
 MATCH_SCORE = 1
 MISMATCH_SCORE = -1
 GAP_SCORE = -1
 
+# Orçamento padrão de células da matriz completa antes de trocar para o
+# modo de espaço linear (Hirschberg) automaticamente
+DEFAULT_MAX_CELLS = 10_000_000
+
+# Abaixo deste número de células o Hirschberg resolve o subproblema com a
+# matriz completa (caso base da recursão)
+HIRSCHBERG_BASE_CELLS = 4096
+
+ENGINES = ("auto", "full", "hirschberg", "banded", "pointers", "wavefront",
+           "checkpoint", "anchored")
+
+# Motores que aceitam gaps afins (Gotoh completo, por checkpoints ou âncoras)
+AFFINE_ENGINES = ("auto", "full", "checkpoint", "anchored")
+
+# Motores dos modos local e semi-global (precisam das linhas da matriz)
+LOCAL_ENGINES = ("auto", "full", "checkpoint")
+
+# Meia-largura inicial da faixa do motor banded (dobrada quando necessário)
+DEFAULT_BAND = 16
+
+# Lado dos blocos (tiles) do motor wavefront; abaixo de WAVEFRONT_MIN_CELLS
+# o subproblema é preenchido no próprio processo
+DEFAULT_TILE = 1024
+WAVEFRONT_MIN_CELLS = 4_000_000
+
+# Tamanho das sementes (k-mers únicos nas duas sequências) do motor anchored
+DEFAULT_SEED = 15
+
+# Códigos de direção (2 bits) do motor pointers
+MOVE_DIAG, MOVE_UP, MOVE_LEFT = 0, 1, 2
+
+# Sentinela para células fora da faixa calculada (cabe em array('i'))
+NEG_INF = -(1 << 30)
+
+BACKENDS = ("auto", "python", "numpy")
+
+BATCH_MODES = ("pairwise", "query", "all")
+
+# Modos de alinhamento: global (Needleman-Wunsch), local (Smith-Waterman) e
+# semi-global (gaps nas extremidades sem custo)
+MODES = ("global", "local", "semiglobal")
+
+MODE_TITLES = {
+    "global": "Alinhamento Global (Needleman-Wunsch)",
+    "local": "Alinhamento Local (Smith-Waterman)",
+    "semiglobal": "Alinhamento Semi-global",
+}
+
+# Tamanho do buffer de leitura dos arquivos FASTA (1 MiB)
+FASTA_BUFFER_SIZE = 1 << 20
+
+# Assinatura dos arquivos comprimidos com gzip
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Maior matriz (em células) exibida como texto sem --matrix-window
+MAX_PRINT_CELLS = 10_000
+
+# Bytes acumulados antes de cada escrita do dump binário da matriz
+MATRIX_DUMP_CHUNK = 1 << 20
+
+# Janela "i0:i1,j0:j1" de --matrix-window (limites opcionais)
+WINDOW_RE = re.compile(r"^(\d*):(\d*),(\d*):(\d*)$")
+
+# Formatos de saída: texto legível ou registros estruturados, um por par
+OUTPUT_FORMATS = ("text", "tsv", "jsonl", "cigar")
+RECORD_FIELDS = ("seq1", "seq2", "score", "start1", "end1", "start2", "end2",
+                 "cigar")
+BATCH_RECORD_FIELDS = ("seq1", "seq2", "score")
+
+# Cache persistente de resultados (sqlite3). CACHE_VERSION entra em todas
+# as chaves: incrementá-lo invalida entradas de versões anteriores
+CACHE_VERSION = 2
+CACHE_FILE_NAME = "alignments.sqlite3"
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"),
+                                                     ".cache"),
+    "seqalignx")
+DEFAULT_CACHE_ENTRIES = 100_000
+CACHE_MEMORY_ENTRIES = 1024
+# Escritas acumuladas antes de um commit (e da remoção das entradas antigas)
+CACHE_FLUSH_INTERVAL = 256
+
+# Códigos de 2 bits de PackedSequence; demais caracteres viram exceções
+PACKED_BASES = b"ACGT"
+PACKED_EXCEPTION_RE = re.compile(r"[^ACGT]+")
+PACKED_LOWER_RE = re.compile(r"[a-z]+")
+
+# Intervalo opcional em "arquivo.fasta:registro:início-fim"
+REGION_RE = re.compile(r"^(\d+)-(\d+)$")
+
+# Matrizes de substituição embutidas (formato NCBI)
+BLOSUM62_TEXT = """\
+#  Matrix made by matblas from blosum62.iij
+#  BLOSUM Clustered Scoring Matrix in 1/2 Bit Units
+   A  R  N  D  C  Q  E  G  H  I  L  K  M  F  P  S  T  W  Y  V  B  Z  X  *
+A  4 -1 -2 -2  0 -1 -1  0 -2 -1 -1 -1 -1 -2 -1  1  0 -3 -2  0 -2 -1  0 -4
+R -1  5  0 -2 -3  1  0 -2  0 -3 -2  2 -1 -3 -2 -1 -1 -3 -2 -3 -1  0 -1 -4
+N -2  0  6  1 -3  0  0  0  1 -3 -3  0 -2 -3 -2  1  0 -4 -2 -3  3  0 -1 -4
+D -2 -2  1  6 -3  0  2 -1 -1 -3 -4 -1 -3 -3 -1  0 -1 -4 -3 -3  4  1 -1 -4
+C  0 -3 -3 -3  9 -3 -4 -3 -3 -1 -1 -3 -1 -2 -3 -1 -1 -2 -2 -1 -3 -3 -2 -4
+Q -1  1  0  0 -3  5  2 -2  0 -3 -2  1  0 -3 -1  0 -1 -2 -1 -2  0  3 -1 -4
+E -1  0  0  2 -4  2  5 -2  0 -3 -3  1 -2 -3 -1  0 -1 -3 -2 -2  1  4 -1 -4
+G  0 -2  0 -1 -3 -2 -2  6 -2 -4 -4 -2 -3 -3 -2  0 -2 -2 -3 -3 -1 -2 -1 -4
+H -2  0  1 -1 -3  0  0 -2  8 -3 -3 -1 -2 -1 -2 -1 -2 -2  2 -3  0  0 -1 -4
+I -1 -3 -3 -3 -1 -3 -3 -4 -3  4  2 -3  1  0 -3 -2 -1 -3 -1  3 -3 -3 -1 -4
+L -1 -2 -3 -4 -1 -2 -3 -4 -3  2  4 -2  2  0 -3 -2 -1 -2 -1  1 -4 -3 -1 -4
+K -1  2  0 -1 -3  1  1 -2 -1 -3 -2  5 -1 -3 -1  0 -1 -3 -2 -2  0  1 -1 -4
+M -1 -1 -2 -3 -1  0 -2 -3 -2  1  2 -1  5  0 -2 -1 -1 -1 -1  1 -3 -1 -1 -4
+F -2 -3 -3 -3 -2 -3 -3 -3 -1  0  0 -3  0  6 -4 -2 -2  1  3 -1 -3 -3 -1 -4
+P -1 -2 -2 -1 -3 -1 -1 -2 -2 -3 -3 -1 -2 -4  7 -1 -1 -4 -3 -2 -2 -1 -2 -4
+S  1 -1  1  0 -1  0  0  0 -1 -2 -2  0 -1 -2 -1  4  1 -3 -2 -2  0  0  0 -4
+T  0 -1  0 -1 -1 -1 -1 -2 -2 -1 -1 -1 -1 -2 -1  1  5 -2 -2  0 -1 -1  0 -4
+W -3 -3 -4 -4 -2 -2 -3 -2 -2 -3 -2 -3 -1  1 -4 -3 -2 11  2 -3 -4 -3 -2 -4
+Y -2 -2 -2 -3 -2 -1 -2 -3  2 -1 -1 -2 -1  3 -3 -2 -2  2  7 -1 -3 -2 -1 -4
+V  0 -3 -3 -3 -1 -2 -2 -3 -3  3  1 -2  1 -1 -2 -2  0 -3 -1  4 -3 -2 -1 -4
+B -2 -1  3  4 -3  0  1 -1  0 -3 -4  0 -3 -3 -2  0 -1 -4 -3 -3  4  1 -1 -4
+Z -1  0  0  1 -3  3  4 -2  0 -3 -3  1 -1 -3 -1  0 -1 -3 -2 -2  1  4 -1 -4
+X  0 -1 -1 -1 -2 -1 -1 -1 -1 -1 -1 -1 -1 -1 -2  0  0 -2 -1 -1 -1 -1 -1 -4
+* -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4  1
+"""
+
+PAM250_TEXT = """\
+#  PAM 250 substitution matrix (Dayhoff)
+   A  R  N  D  C  Q  E  G  H  I  L  K  M  F  P  S  T  W  Y  V  B  Z  X  *
+A  2 -2  0  0 -2  0  0  1 -1 -1 -2 -1 -1 -3  1  1  1 -6 -3  0  0  0  0 -8
+R -2  6  0 -1 -4  1 -1 -3  2 -2 -3  3  0 -4  0  0 -1  2 -4 -2 -1  0 -1 -8
+N  0  0  2  2 -4  1  1  0  2 -2 -3  1 -2 -3  0  1  0 -4 -2 -2  2  1  0 -8
+D  0 -1  2  4 -5  2  3  1  1 -2 -4  0 -3 -6 -1  0  0 -7 -4 -2  3  3 -1 -8
+C -2 -4 -4 -5 12 -5 -5 -3 -3 -2 -6 -5 -5 -4 -3  0 -2 -8  0 -2 -4 -5 -3 -8
+Q  0  1  1  2 -5  4  2 -1  3 -2 -2  1 -1 -5  0 -1 -1 -5 -4 -2  1  3 -1 -8
+E  0 -1  1  3 -5  2  4  0  1 -2 -3  0 -2 -5 -1  0  0 -7 -4 -2  3  3 -1 -8
+G  1 -3  0  1 -3 -1  0  5 -2 -3 -4 -2 -3 -5  0  1  0 -7 -5 -1  0  0 -1 -8
+H -1  2  2  1 -3  3  1 -2  6 -2 -2  0 -2 -2  0 -1 -1 -3  0 -2  1  2 -1 -8
+I -1 -2 -2 -2 -2 -2 -2 -3 -2  5  2 -2  2  1 -2 -1  0 -5 -1  4 -2 -2 -1 -8
+L -2 -3 -3 -4 -6 -2 -3 -4 -2  2  6 -3  4  2 -3 -3 -2 -2 -1  2 -3 -3 -1 -8
+K -1  3  1  0 -5  1  0 -2  0 -2 -3  5  0 -5 -1  0  0 -3 -4 -2  1  0 -1 -8
+M -1  0 -2 -3 -5 -1 -2 -3 -2  2  4  0  6  0 -2 -2 -1 -4 -2  2 -2 -2 -1 -8
+F -3 -4 -3 -6 -4 -5 -5 -5 -2  1  2 -5  0  9 -5 -3 -3  0  7 -1 -4 -5 -2 -8
+P  1  0  0 -1 -3  0 -1  0  0 -2 -3 -1 -2 -5  6  1  0 -6 -5 -1 -1  0 -1 -8
+S  1  0  1  0  0 -1  0  1 -1 -1 -3  0 -2 -3  1  2  1 -2 -3 -1  0  0  0 -8
+T  1 -1  0  0 -2 -1  0  0 -1  0 -2  0 -1 -3  0  1  3 -5 -3  0  0 -1  0 -8
+W -6  2 -4 -7 -8 -5 -7 -7 -3 -5 -2 -3 -4  0 -6 -2 -5 17  0 -6 -5 -6 -4 -8
+Y -3 -4 -2 -4  0 -4 -4 -5  0 -1 -1 -4 -2  7 -5 -3 -3  0 10 -2 -3 -4 -2 -8
+V  0 -2 -2 -2 -2 -2 -2 -1 -2  4  2 -2  2 -1 -1 -1  0 -6 -2  4 -2 -2 -1 -8
+B  0 -1  2  3 -4  1  3  0  1 -2 -3  1 -2 -4 -1  0  0 -5 -3 -2  3  2 -1 -8
+Z  0  0  1  3 -5  3  3  0  2 -2 -3  0 -2 -5  0  0 -1 -6 -4 -2  2  3 -1 -8
+X  0 -1  0 -1 -3 -1 -1 -1 -1 -1 -1 -1 -1 -2 -1  0  0 -4 -2 -1 -1 -1 -1 -8
+* -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8  1
+"""
+
+BUILTIN_MATRICES = {"BLOSUM62": BLOSUM62_TEXT, "PAM250": PAM250_TEXT}
+
+# Número padrão de pares por tarefa enviada ao pool de processos
+DEFAULT_CHUNK_SIZE = 16
+
+# Pré-filtro por k-mers (MinHash): tamanho do k-mer, hashes guardados por
+# sequência e formato do índice serializado
+DEFAULT_KMER = 11
+DEFAULT_SKETCH_SIZE = 128
+KMER_INDEX_MAGIC = b"SEQALIGNX-KMER\n"
+KMER_INDEX_VERSION = 1
+
+
+def parse_matrix_window(text: str) -> tuple:
+    """
+    Analisa uma janela "i0:i1,j0:j1" da matriz de pontuação.
+
+    Args:
+        text: Janela; limites omitidos valem o início/fim da matriz
+
+    Returns:
+        tuple: (i0, i1, j0, j1), com None nos limites omitidos
+
+    Raises:
+        argparse.ArgumentTypeError: Se o formato for inválido
+    """
+    found = WINDOW_RE.match(text.replace(" ", ""))
+    if found is None:
+        raise argparse.ArgumentTypeError(
+            f"janela inválida: {text!r} (use i0:i1,j0:j1)")
+    return tuple(int(part) if part else None for part in found.groups())
+
 
 def parse_args(args: list) -> argparse.Namespace:
     """
@@ -33,10 +243,14 @@ def parse_args(args: list) -> argparse.Namespace:
     )
 
     parser.add_argument(
-        "--seq1", required=True, help="Caminho para o arquivo FASTA da primeira sequência"
+        "--seq1", required=True,
+        help="Caminho para o arquivo FASTA da primeira sequência "
+             "(aceita arquivo.fasta:registro[:início-fim])"
     )
     parser.add_argument(
-        "--seq2", required=True, help="Caminho para o arquivo FASTA da segunda sequência"
+        "--seq2", help="Caminho para o arquivo FASTA da segunda sequência "
+                       "(aceita arquivo.fasta:registro[:início-fim]; "
+                       "opcional apenas com --batch all)"
     )
     parser.add_argument(
         "--match", type=int, default=1, help="Pontuação para match (padrão: 1)"
@@ -48,20 +262,402 @@ def parse_args(args: list) -> argparse.Namespace:
         "--gap", type=int, default=-1, help="Penalidade de gap (padrão: -1)"
     )
     parser.add_argument(
-        "--quiet", action="store_true", help="Não exibe a matriz de pontuação"
+        "--matrix", default=None,
+        help="Matriz de substituição: BLOSUM62, PAM250 ou caminho para um "
+             "arquivo no formato NCBI (substitui --match/--mismatch)"
+    )
+    parser.add_argument(
+        "--gap-open", type=int, default=None,
+        help="Penalidade de abertura de gap (ativa gaps afins/Gotoh; "
+             "padrão: valor de --gap)"
+    )
+    parser.add_argument(
+        "--gap-extend", type=int, default=None,
+        help="Penalidade de extensão de gap (ativa gaps afins/Gotoh; "
+             "padrão: valor de --gap)"
+    )
+    parser.add_argument(
+        "--mode", choices=MODES, default="global",
+        help="Modo de alinhamento: global, local (Smith-Waterman) ou "
+             "semiglobal (gaps nas extremidades sem custo; padrão: global)"
+    )
+    parser.add_argument(
+        "--quiet", action="store_true",
+        help="Não exibe a matriz de pontuação (mesmo com --show-matrix)"
+    )
+    parser.add_argument(
+        "--show-matrix", action="store_true",
+        help="Exibe a matriz de pontuação do motor full (até "
+             f"{MAX_PRINT_CELLS} células, ou a janela de --matrix-window)"
+    )
+    parser.add_argument(
+        "--matrix-window", type=parse_matrix_window, default=None,
+        help="Janela da matriz exibida/gravada, no formato i0:i1,j0:j1 "
+             "(linhas e colunas, como fatias do Python)"
+    )
+    parser.add_argument(
+        "--dump-matrix", default=None,
+        help="Grava a matriz de pontuação (ou a janela) em um arquivo .npy "
+             "int32, legível por numpy.load"
+    )
+    parser.add_argument(
+        "--format", choices=OUTPUT_FORMATS, default="text",
+        help="Formato de saída: text (legível), tsv, jsonl ou cigar (linhas "
+             "no estilo SAM com CIGAR =/X/I/D; padrão: text)"
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="Arquivo de saída dos formatos tsv, jsonl e cigar "
+             "(padrão: saída padrão)"
+    )
+    parser.add_argument(
+        "--score-only", action="store_true",
+        help="Calcula apenas o score em memória O(n), sem traceback, "
+             "alinhamento ou matriz"
+    )
+    parser.add_argument(
+        "--min-score", type=int, default=None,
+        help="Descarta pares cujo score global fica abaixo deste valor, "
+             "interrompendo o cálculo assim que o mínimo se torna "
+             "inalcançável (apenas --mode global com gaps lineares)"
+    )
+    parser.add_argument(
+        "--xdrop", type=int, default=None,
+        help="Poda as células que ficam mais de X abaixo do máximo da linha "
+             "anterior e abandona o par quando não sobra nenhuma (heurística: "
+             "o score pode ficar abaixo do ótimo)"
     )
+    parser.add_argument(
+        "--engine", choices=ENGINES, default="auto",
+        help="Motor de alinhamento: full (matriz completa), hirschberg "
+             "(espaço linear), banded (faixa em torno da diagonal), pointers "
+             "(direções em 2 bits por célula), wavefront (Hirschberg com o "
+             "preenchimento dividido em blocos entre vários processos), "
+             "checkpoint (guarda uma linha a cada √m e recalcula blocos no "
+             "traceback; aceita os três modos), anchored (encadeia sementes "
+             "exatas e só alinha os trechos entre elas; heurístico, para "
+             "pares longos e parecidos) ou auto (padrão: auto)"
+    )
+    parser.add_argument(
+        "--seed-k", type=int, default=DEFAULT_SEED,
+        help="Tamanho das sementes (k-mers únicos nas duas sequências) do "
+             f"motor anchored (padrão: {DEFAULT_SEED})"
+    )
+    parser.add_argument(
+        "--tile", type=int, default=DEFAULT_TILE,
+        help="Lado dos blocos do motor wavefront, preenchidos em paralelo "
+             f"por anti-diagonais (padrão: {DEFAULT_TILE})"
+    )
+    parser.add_argument(
+        "--band", type=int, default=DEFAULT_BAND,
+        help="Meia-largura inicial da faixa no motor banded; é dobrada "
+             f"automaticamente até o score ser exato (padrão: {DEFAULT_BAND})"
+    )
+    parser.add_argument(
+        "--backend", choices=BACKENDS, default="auto",
+        help="Implementação do preenchimento da matriz completa: python, "
+             "numpy (vetorizado) ou auto (numpy se instalado; padrão: auto)"
+    )
+    parser.add_argument(
+        "--max-cells", type=int, default=DEFAULT_MAX_CELLS,
+        help="Número máximo de células da matriz completa no modo auto "
+             f"antes de usar Hirschberg (padrão: {DEFAULT_MAX_CELLS})"
+    )
+
+    parser.add_argument(
+        "--profile", default=None, metavar="JSON",
+        help="Grava em JSON o tempo, a vazão (GCUPS), o pico de memória e "
+             "os blocos alocados de cada fase da execução"
+    )
+    parser.add_argument(
+        "--cprofile", default=None, metavar="PROF",
+        help="Executa sob cProfile e grava as estatísticas em um arquivo "
+             ".prof (para pstats/snakeviz)"
+    )
+    parser.add_argument(
+        "--cache-dir", default=DEFAULT_CACHE_DIR,
+        help="Diretório do cache persistente de resultados "
+             f"(padrão: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Não consulta nem grava o cache de resultados"
+    )
+
+    parser.add_argument(
+        "--batch", choices=BATCH_MODES,
+        help="Alinha todos os registros: pairwise (i-ésimo contra i-ésimo), "
+             "query (cada registro de --seq1 contra todos de --seq2) ou all "
+             "(todos contra todos de --seq1, triângulo superior)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Número de processos no modo batch e no motor wavefront "
+             "(padrão: número de CPUs)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+        help=f"Pares por tarefa no modo batch (padrão: {DEFAULT_CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--prefilter", type=float, default=None, metavar="JACCARD",
+        help="No modo batch, alinha apenas os pares cuja similaridade de "
+             "Jaccard estimada pelos k-mers (MinHash) alcança o limiar; os "
+             "demais saem com score '*'"
+    )
+    parser.add_argument(
+        "--kmer", type=int, default=DEFAULT_KMER,
+        help=f"Tamanho do k-mer do pré-filtro (padrão: {DEFAULT_KMER})"
+    )
+    parser.add_argument(
+        "--sketch-size", type=int, default=DEFAULT_SKETCH_SIZE,
+        help="Hashes MinHash guardados por sequência no pré-filtro "
+             f"(padrão: {DEFAULT_SKETCH_SIZE})"
+    )
+    parser.add_argument(
+        "--kmer-index", default=None, metavar="ARQUIVO",
+        help="Arquivo do índice de k-mers do pré-filtro: carregado se "
+             "existir e atualizado com as sequências novas, para que um "
+             "conjunto de referência seja esboçado uma única vez"
+    )
+    parser.add_argument(
+        "--packed", action="store_true",
+        help="No modo batch, guarda as sequências de DNA com 2 bits por "
+             "base (menos memória e serialização mais barata)"
+    )
+
+    parsed = parser.parse_args(args)
+    if parsed.seq2 is None and parsed.batch != "all":
+        parser.error("o argumento --seq2 é obrigatório")
+    if parsed.chunk_size < 1:
+        parser.error("--chunk-size deve ser positivo")
+    if parsed.output is not None and parsed.format == "text":
+        parser.error("--output requer --format tsv, jsonl ou cigar")
+    if parsed.batch and parsed.format == "cigar":
+        parser.error("--format cigar requer o alinhamento; no modo batch "
+                     "use tsv ou jsonl")
+    if parsed.mode != "global" and (parsed.gap_open is not None
+                                    or parsed.gap_extend is not None):
+        parser.error("--gap-open/--gap-extend exigem --mode global")
+    if parsed.workers is not None and parsed.workers < 1:
+        parser.error("--workers deve ser positivo")
+    if parsed.tile < 1:
+        parser.error("--tile deve ser positivo")
+    if parsed.seed_k < 1:
+        parser.error("--seed-k deve ser positivo")
+    if parsed.prefilter is not None:
+        if not parsed.batch:
+            parser.error("--prefilter requer --batch")
+        if not 0 <= parsed.prefilter <= 1:
+            parser.error("--prefilter deve estar entre 0 e 1")
+    if parsed.kmer < 1 or parsed.sketch_size < 1:
+        parser.error("--kmer e --sketch-size devem ser positivos")
+    if parsed.xdrop is not None and parsed.xdrop < 0:
+        parser.error("--xdrop não pode ser negativo")
+    if (parsed.min_score is not None or parsed.xdrop is not None) and (
+            parsed.mode != "global" or parsed.gap_open is not None
+            or parsed.gap_extend is not None):
+        parser.error("--min-score/--xdrop exigem --mode global com gaps "
+                     "lineares")
+
+    return parsed
+
+
+class SubstitutionMatrix:
+    """
+    Matriz de substituição com tabela de consulta inteira e plana.
+
+    Cada resíduo do alfabeto recebe um código pequeno (0..K-1) e a
+    pontuação de (a, b) fica em table[code(a) * K + code(b)]. As
+    sequências são codificadas uma única vez com bytes.translate, de modo
+    que o laço de preenchimento faz apenas consultas por índice.
+    """
+
+    def __init__(self, alphabet: str, scores: list, name: str = ""):
+        """
+        Args:
+            alphabet: Resíduos na ordem das linhas/colunas da matriz
+            scores: Lista de linhas (listas de int), uma por resíduo
+            name: Nome da matriz (para exibição)
+
+        Raises:
+            ValueError: Se a matriz não for quadrada do tamanho do alfabeto
+        """
+        size = len(alphabet)
+        if len(scores) != size or any(len(row) != size for row in scores):
+            raise ValueError("A matriz de substituição deve ser quadrada e "
+                             "do tamanho do alfabeto")
+        self.name = name
+        self.alphabet = alphabet
+        self.size = size
+        self.table = array("i", [value for row in scores for value in row])
+
+        # Resíduos desconhecidos usam X (ou *), se a matriz os tiver
+        default = alphabet.find("X")
+        if default < 0:
+            default = alphabet.find("*")
+        self._unknown = 255 if default < 0 else default
+        translation = bytearray([self._unknown]) * 256
+        for code, residue in enumerate(alphabet):
+            translation[ord(residue.upper())] = code
+            translation[ord(residue.lower())] = code
+        self._translation = bytes(translation)
+
+    def __repr__(self):
+        return f"SubstitutionMatrix({self.name or self.alphabet!r})"
+
+    def encode(self, seq: str) -> bytes:
+        """
+        Codifica uma sequência em códigos inteiros do alfabeto.
+
+        Args:
+            seq: Sequência de resíduos
+
+        Returns:
+            bytes: Um código por resíduo
+
+        Raises:
+            ValueError: Se houver resíduo fora do alfabeto e a matriz não
+                tiver X nem *
+        """
+        codes = seq.encode("latin-1", "replace").translate(self._translation)
+        if self._unknown == 255 and 255 in codes:
+            raise ValueError(f"Resíduo fora do alfabeto da matriz {self.name}")
+        return codes
+
+    def score(self, a: str, b: str) -> int:
+        """Retorna a pontuação de substituição entre dois resíduos."""
+        codes = self.encode(a + b)
+        return self.table[codes[0] * self.size + codes[1]]
+
+    def max_score(self) -> int:
+        """Retorna a maior pontuação da matriz."""
+        return max(self.table)
+
+    @classmethod
+    def from_ncbi(cls, text: str, name: str = ""):
+        """
+        Lê uma matriz no formato NCBI (linha de cabeçalho com o alfabeto
+        seguida de uma linha por resíduo; "#" inicia comentários).
+
+        Args:
+            text: Conteúdo do arquivo
+            name: Nome da matriz
+
+        Returns:
+            SubstitutionMatrix: Matriz carregada
+
+        Raises:
+            ValueError: Se o formato for inválido
+        """
+        lines = [line.split() for line in text.splitlines()
+                 if line.strip() and not line.lstrip().startswith("#")]
+        if not lines:
+            raise ValueError("Matriz de substituição vazia")
+        alphabet = "".join(lines[0])
+        rows = {}
+        try:
+            for fields in lines[1:]:
+                rows[fields[0]] = [int(value) for value in fields[1:]]
+            scores = [rows[residue] for residue in alphabet]
+        except (KeyError, ValueError) as e:
+            raise ValueError(f"Matriz de substituição inválida: {e}") from e
+        return cls(alphabet, scores, name)
+
+
+@functools.lru_cache(maxsize=None)
+def load_substitution_matrix(name_or_path: str) -> SubstitutionMatrix:
+    """
+    Carrega uma matriz embutida (BLOSUM62, PAM250) ou um arquivo NCBI.
+
+    Args:
+        name_or_path: Nome da matriz embutida ou caminho do arquivo
 
-    return parser.parse_args(args)
+    Returns:
+        SubstitutionMatrix: Matriz carregada
+
+    Raises:
+        FileNotFoundError: Se o arquivo não existir
+        ValueError: Se o formato for inválido
+    """
+    builtin = BUILTIN_MATRICES.get(name_or_path.upper())
+    if builtin is not None:
+        return SubstitutionMatrix.from_ncbi(builtin, name_or_path.upper())
+    with open(name_or_path) as f:
+        return SubstitutionMatrix.from_ncbi(f.read(),
+                                            os.path.basename(name_or_path))
+
+
+def substitution_score(a: str, b: str, match_val: int = 1,
+                       mismatch_val: int = -1, subst=None) -> int:
+    """
+    Pontuação de alinhar o resíduo a com o resíduo b.
+
+    Args:
+        a: Resíduo da primeira sequência
+        b: Resíduo da segunda sequência
+        match_val: Valor para match (sem matriz)
+        mismatch_val: Valor para mismatch (sem matriz)
+        subst: SubstitutionMatrix opcional
+
+    Returns:
+        int: Pontuação da substituição
+    """
+    if subst is not None:
+        return subst.score(a, b)
+    return match_val if a == b else mismatch_val
+
+
+def build_profile(seq1: str, seq2: str, match_val: int = 1,
+                  mismatch_val: int = -1, subst=None) -> list:
+    """
+    Pré-calcula o perfil de pontuações de seq2 para cada resíduo de seq1.
+
+    Para cada resíduo distinto de seq1 é construída (uma única vez) a
+    lista com a pontuação dele contra cada posição de seq2. O laço de
+    preenchimento passa a fazer apenas `scores[j - 1]`, sem comparar
+    caracteres nem consultar a matriz de substituição por célula.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match (sem matriz)
+        mismatch_val: Valor para mismatch (sem matriz)
+        subst: SubstitutionMatrix opcional
+
+    Returns:
+        list: profile[i] é a lista de pontuações de seq1[i] contra seq2;
+            resíduos iguais compartilham a mesma lista
+    """
+    rows = {}
+    if subst is None:
+        for residue in set(seq1):
+            rows[residue] = [match_val if residue == b else mismatch_val
+                             for b in seq2]
+        return [rows[residue] for residue in seq1]
 
+    codes1 = subst.encode(seq1)
+    codes2 = subst.encode(seq2)
+    table = subst.table
+    for code in set(codes1):
+        base = code * subst.size
+        rows[code] = [table[base + b] for b in codes2]
+    return [rows[code] for code in codes1]
 
-def create_score_matrix(seq1: str, seq2: str, gap_val: int = -1):
+
+def create_score_matrix(seq1: str, seq2: str, gap_val: int = -1,
+                        mode: str = "global"):
     """
     Cria e inicializa a matriz de pontuação.
 
+    Nos modos local e semi-global a primeira linha e a primeira coluna
+    ficam zeradas: gaps antes do início do alinhamento não custam nada.
+
     Args:
         seq1: Primeira sequência
         seq2: Segunda sequência
         gap_val: Penalidade de gap
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
 
     Returns:
         list: Matriz de pontuação inicializada
@@ -70,6 +666,8 @@ def create_score_matrix(seq1: str, seq2: str, gap_val: int = -1):
 
     # Inicializa matriz com zeros
     score_matrix = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
+    if mode != "global":
+        return score_matrix
 
     # Preenche primeira coluna (gaps na sequência 2)
     for i in range(1, m + 1):
@@ -83,10 +681,15 @@ def create_score_matrix(seq1: str, seq2: str, gap_val: int = -1):
 
 
 def fill_score_matrix(score_matrix: list, seq1: str, seq2: str, 
-                      match_val: int = 1, mismatch_val: int = -1, gap_val: int = -1):
+                      match_val: int = 1, mismatch_val: int = -1,
+                      gap_val: int = -1, subst=None, mode: str = "global"):
     """
     Preenche a matriz de pontuação usando o algoritmo Needleman-Wunsch.
 
+    O mesmo laço atende os três modos: no local (Smith-Waterman) cada
+    célula é limitada inferiormente a zero; o semi-global difere do global
+    apenas na inicialização (create_score_matrix).
+
     Args:
         score_matrix: Matriz inicializada
         seq1: Primeira sequência
@@ -94,28 +697,147 @@ def fill_score_matrix(score_matrix: list, seq1: str, seq2: str,
         match_val: Valor para match
         mismatch_val: Valor para mismatch
         gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
 
     Returns:
         list: Matriz completamente preenchida
     """
     m, n = len(seq1), len(seq2)
+    profile = build_profile(seq1, seq2, match_val, mismatch_val, subst)
+    floor = 0 if mode == "local" else NEG_INF
 
     for i in range(1, m + 1):
+        # Pontuações de seq1[i - 1] contra cada resíduo de seq2
+        scores = profile[i - 1]
+        prev_row = score_matrix[i - 1]
+        row = score_matrix[i]
         for j in range(1, n + 1):
-            # Calcula pontuação do match/mismatch
-            match = match_val if seq1[i - 1] == seq2[j - 1] else mismatch_val
-
             # Calcula três possibilidades
-            diagonal = score_matrix[i - 1][j - 1] + match  # Match/Mismatch
-            up = score_matrix[i - 1][j] + gap_val  # Gap em seq2
-            left = score_matrix[i][j - 1] + gap_val  # Gap em seq1
+            diagonal = prev_row[j - 1] + scores[j - 1]  # Match/Mismatch
+            up = prev_row[j] + gap_val  # Gap em seq2
+            left = row[j - 1] + gap_val  # Gap em seq1
+
+            # Escolhe o máximo (nunca abaixo de zero no modo local)
+            best = max(diagonal, up, left)
+            row[j] = best if best > floor else floor
+
+    return score_matrix
+
+
+def _encode_uint8(seq: str):
+    """
+    Converte uma sequência em um vetor NumPy de códigos uint8 (um por base).
 
-            # Escolhe o máximo
-            score_matrix[i][j] = max(diagonal, up, left)
+    Args:
+        seq: Sequência a ser codificada
+
+    Returns:
+        numpy.ndarray: Vetor uint8 com o código de cada caractere
+    """
+    return np.frombuffer(seq.encode("latin-1", "replace"), dtype=np.uint8)
+
+
+def fill_score_matrix_numpy(seq1: str, seq2: str, match_val: int = 1,
+                            mismatch_val: int = -1, gap_val: int = -1,
+                            subst=None, mode: str = "global"):
+    """
+    Cria e preenche a matriz de pontuação com NumPy, por anti-diagonais.
+
+    As células de uma mesma anti-diagonal (i + j = d) dependem apenas das
+    duas anti-diagonais anteriores, portanto podem ser calculadas de uma
+    só vez com operações vetorizadas. A matriz é um ndarray int32
+    contíguo; na visão achatada, a célula (i, d - i) fica na posição
+    d + i * n, de modo que cada anti-diagonal (e suas vizinhas) é um
+    slice com passo n, sem cópia.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+
+    Returns:
+        numpy.ndarray: Matriz (m+1) x (n+1) int32 completamente preenchida
+
+    Raises:
+        ImportError: Se o NumPy não estiver instalado
+    """
+    if np is None:
+        raise ImportError("NumPy não está instalado; use o backend python")
+
+    m, n = len(seq1), len(seq2)
+    score_matrix = np.empty((m + 1, n + 1), dtype=np.int32)
+
+    # Primeira coluna e primeira linha com penalidades de gap acumuladas
+    # (zeradas nos modos local e semi-global)
+    edge = gap_val if mode == "global" else 0
+    score_matrix[:, 0] = np.arange(m + 1, dtype=np.int32) * edge
+    score_matrix[0, :] = np.arange(n + 1, dtype=np.int32) * edge
+
+    if m == 0 or n == 0:
+        return score_matrix
+
+    if subst is None:
+        codes1 = _encode_uint8(seq1)
+        # seq2 invertida: ao longo de uma anti-diagonal j decresce com i
+        codes2_rev = _encode_uint8(seq2)[::-1]
+        match = np.int32(match_val)
+        mismatch = np.int32(mismatch_val)
+    else:
+        codes1 = np.frombuffer(subst.encode(seq1), dtype=np.uint8)
+        codes2_rev = np.frombuffer(subst.encode(seq2), dtype=np.uint8)[::-1]
+        table = np.array(subst.table, dtype=np.int32).reshape(subst.size,
+                                                               subst.size)
+    flat = score_matrix.reshape(-1)
+
+    for d in range(2, m + n + 1):
+        lo = max(1, d - n)
+        hi = min(m, d - 1)
+
+        diagonal = flat[d - 2 + (lo - 1) * n:d - 2 + (hi - 1) * n + 1:n]
+        up = flat[d - 1 + (lo - 1) * n:d - 1 + (hi - 1) * n + 1:n]
+        left = flat[d - 1 + lo * n:d - 1 + hi * n + 1:n]
+
+        # seq1[i - 1] contra seq2[d - i - 1] para i em lo..hi
+        residues1 = codes1[lo - 1:hi]
+        residues2 = codes2_rev[n - d + lo:n - d + hi + 1]
+        if subst is None:
+            scores = np.where(residues1 == residues2, match, mismatch)
+        else:
+            scores = table[residues1, residues2]
+
+        cells = np.maximum(diagonal + scores, np.maximum(up, left) + gap_val)
+        if mode == "local":
+            np.maximum(cells, 0, out=cells)
+        flat[d + lo * n:d + hi * n + 1:n] = cells
 
     return score_matrix
 
 
+def select_backend(backend: str) -> str:
+    """
+    Resolve o backend de preenchimento da matriz completa.
+
+    Args:
+        backend: Backend pedido ("auto", "python" ou "numpy")
+
+    Returns:
+        str: Backend efetivo ("python" ou "numpy")
+
+    Raises:
+        ImportError: Se "numpy" for pedido e o NumPy não estiver instalado
+    """
+    if backend == "auto":
+        return "python" if np is None else "numpy"
+    if backend == "numpy" and np is None:
+        raise ImportError("NumPy não está instalado; use --backend python")
+    return backend
+
+
 def get_alignment_score(score_matrix: list):
     """
     Retorna o score final do alinhamento.
@@ -130,9 +852,14 @@ def get_alignment_score(score_matrix: list):
 
 
 def needleman_wunsch(seq1: str, seq2: str, match_val: int = 1, 
-                     mismatch_val: int = -1, gap_val: int = -1):
+                     mismatch_val: int = -1, gap_val: int = -1, subst=None):
     """
-    Executa o algoritmo completo de Needleman-Wunsch.
+    Executa o algoritmo de Needleman-Wunsch e retorna apenas o score.
+
+    Como o score depende somente da última célula, a matriz completa não é
+    materializada: o preenchimento usa uma única linha rolante (memória
+    O(n)). Sem matriz de substituição, pontuações que se reduzem a
+    distância de edição ou LCS usam os algoritmos bit-paralelos.
 
     Args:
         seq1: Primeira sequência
@@ -140,19 +867,58 @@ def needleman_wunsch(seq1: str, seq2: str, match_val: int = 1,
         match_val: Valor para match
         mismatch_val: Valor para mismatch
         gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
 
     Returns:
         int: Score do melhor alinhamento global
     """
-    # Cria e preenche matriz
-    score_matrix = create_score_matrix(seq1, seq2, gap_val)
-    score_matrix = fill_score_matrix(score_matrix, seq1, seq2, match_val, mismatch_val, gap_val)
+    return Aligner(match_val, mismatch_val, gap_val, subst=subst).score(seq1,
+                                                                        seq2)
+
+
+def find_alignment_end(score_matrix, mode: str = "global") -> tuple:
+    """
+    Localiza a célula onde o alinhamento ótimo termina.
+
+    No modo global é sempre o canto (m, n). No local é a célula de maior
+    valor (a primeira em ordem de linhas, em caso de empate); no
+    semi-global é a maior célula da última linha ou da última coluna,
+    preferindo (m, n), depois a última coluna e por fim a última linha.
+
+    Args:
+        score_matrix: Matriz de pontuação preenchida (lista ou ndarray)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+
+    Returns:
+        tuple: (i, j) da célula final
+    """
+    m = len(score_matrix) - 1
+    n = len(score_matrix[0]) - 1
+    if mode == "global":
+        return m, n
+
+    if mode == "local":
+        best, best_i, best_j = 0, 0, 0
+        for i, row in enumerate(score_matrix):
+            row_max = max(row)
+            if row_max > best:
+                best, best_i, best_j = row_max, i, list(row).index(row_max)
+        return best_i, best_j
 
-    return get_alignment_score(score_matrix)
+    best, best_i, best_j = score_matrix[m][n], m, n
+    for i in range(m):
+        if score_matrix[i][n] > best:
+            best, best_i, best_j = score_matrix[i][n], i, n
+    last_row = list(score_matrix[m])
+    row_max = max(last_row[:n]) if n else best
+    if row_max > best:
+        best_i, best_j = m, last_row.index(row_max)
+    return best_i, best_j
 
 
 def traceback(score_matrix: list, seq1: str, seq2: str, 
-              match_val: int = 1, mismatch_val: int = -1, gap_val: int = -1) -> tuple:
+              match_val: int = 1, mismatch_val: int = -1, gap_val: int = -1,
+              subst=None, mode: str = "global") -> tuple:
     """
     Reconstrói o alinhamento ótimo a partir da matriz de pontuação.
 
@@ -163,20 +929,63 @@ def traceback(score_matrix: list, seq1: str, seq2: str,
         match_val: Valor para match
         mismatch_val: Valor para mismatch
         gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
 
     Returns:
         tuple: (aligned_seq1, aligned_seq2)
     """
+    align1, align2, _ = traceback_region(score_matrix, seq1, seq2, match_val,
+                                         mismatch_val, gap_val, subst, mode)
+    return align1, align2
+
+
+def traceback_region(score_matrix: list, seq1: str, seq2: str,
+                     match_val: int = 1, mismatch_val: int = -1,
+                     gap_val: int = -1, subst=None,
+                     mode: str = "global", end: tuple = None) -> tuple:
+    """
+    Reconstrói o alinhamento ótimo e a região de cada sequência coberta.
+
+    O caminho parte de find_alignment_end. No modo global vai até (0, 0);
+    no local para na primeira célula com valor zero; no semi-global para
+    ao atingir a primeira linha ou a primeira coluna. As pontas não
+    alinhadas (local e semi-global) ficam fora do alinhamento retornado.
+
+    Args:
+        score_matrix: Matriz de pontuação preenchida
+        seq1: Primeira sequência original
+        seq2: Segunda sequência original
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+        end: Célula final (i, j) já conhecida; por padrão é localizada
+            com find_alignment_end
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2, (início1, fim1, início2, fim2)),
+        com coordenadas 0-based semiabertas em seq1 e seq2
+    """
     aligned_seq1 = []
     aligned_seq2 = []
 
-    i, j = len(seq1), len(seq2)
+    if end is None:
+        end = find_alignment_end(score_matrix, mode)
+    end_i, end_j = end
+    i, j = end_i, end_j
 
     while i > 0 or j > 0:
+        if mode == "local" and score_matrix[i][j] == 0:
+            break
+        if mode == "semiglobal" and (i == 0 or j == 0):
+            break
+
         if i > 0 and j > 0:
             # Verifica se veio da diagonal (match ou mismatch)
-            is_match = seq1[i - 1] == seq2[j - 1]
-            match = match_val if is_match else mismatch_val
+            match = substitution_score(seq1[i - 1], seq2[j - 1],
+                                       match_val, mismatch_val, subst)
             if score_matrix[i][j] == score_matrix[i - 1][j - 1] + match:
                 aligned_seq1.append(seq1[i - 1])
                 aligned_seq2.append(seq2[j - 1])
@@ -195,78 +1004,3657 @@ def traceback(score_matrix: list, seq1: str, seq2: str,
             aligned_seq2.append(seq2[j - 1])
             j -= 1
 
-    return "".join(reversed(aligned_seq1)), "".join(reversed(aligned_seq2))
+    return ("".join(reversed(aligned_seq1)), "".join(reversed(aligned_seq2)),
+            (i, end_i, j, end_j))
 
 
-def format_alignment(align1: str, align2: str) -> str:
+class CheckpointedMatrix:
     """
-    Formata o alinhamento para exibição visual.
+    Matriz de pontuação que guarda só algumas linhas e recalcula o resto.
 
-    Args:
-        align1: Primeira sequência alinhada (com gaps)
-        align2: Segunda sequência alinhada (com gaps)
+    O preenchimento inicial (_dp_last_row) guarda uma cópia da linha a
+    cada `interval` linhas (por padrão √m). Ao pedir a linha i, o bloco de
+    linhas entre o checkpoint anterior e o seguinte é recalculado com
+    fill_score_matrix e mantido até o acesso sair dele. Como o traceback
+    percorre as linhas em ordem decrescente, cada bloco é recalculado uma
+    única vez: a memória cai para O(n * √m) e o custo total fica em cerca
+    de duas vezes o preenchimento. Os valores são idênticos aos da matriz
+    completa, então traceback_region funciona sem alterações.
 
-    Returns:
-        str: String formatada com barras verticais para matches
+    Attributes:
+        score: Score ótimo no modo pedido
+        end: Célula final (i, j), a mesma de find_alignment_end
+        interval: Distância entre checkpoints, em linhas
+        checkpoints: Linhas guardadas (índice -> linha)
     """
-    matches = []
-    for c1, c2 in zip(align1, align2):
-        if c1 == c2 and c1 != "-":
-            matches.append("|")
-        else:
-            matches.append(" ")
-
-    line1 = " ".join(align1)
-    line2 = " ".join(matches)
-    line3 = " ".join(align2)
 
-    return f"{line1}\n{line2}\n{line3}"
+    def __init__(self, seq1: str, seq2: str, match_val: int = 1,
+                 mismatch_val: int = -1, gap_val: int = -1, subst=None,
+                 mode: str = "global", interval: int = None):
+        """
+        Args:
+            seq1: Primeira sequência
+            seq2: Segunda sequência
+            match_val: Valor para match
+            mismatch_val: Valor para mismatch
+            gap_val: Valor para gap
+            subst: SubstitutionMatrix opcional (substitui match/mismatch)
+            mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+            interval: Linhas entre checkpoints (padrão: √m)
+        """
+        self._seq1, self._seq2 = seq1, seq2
+        self._scoring = (match_val, mismatch_val, gap_val, subst, mode)
+        self.interval = interval or max(1, math.isqrt(len(seq1)))
+        self.checkpoints = {}
+        _, self.score, end_i, end_j = _dp_last_row(
+            seq1, seq2, match_val, mismatch_val, gap_val, subst, mode,
+            checkpoints=self.checkpoints, interval=self.interval)
+        self.end = (end_i, end_j)
+        self._block_start = 0
+        self._block = []
 
+    def __len__(self) -> int:
+        return len(self._seq1) + 1
 
-def print_matrix(score_matrix: list, seq1: str, seq2: str):
-    """
-    Imprime a matriz de pontuação formatada (para debug).
-    """
-    print("\nMatriz de Pontuação:")
-    print("     " + "  ".join(f" {c} " for c in " " + seq2))
+    def __getitem__(self, i: int) -> list:
+        offset = i - self._block_start
+        if not 0 <= offset < len(self._block):
+            self._load_block(i)
+            offset = i - self._block_start
+        return self._block[offset]
 
-    for i, row in enumerate(score_matrix):
-        prefix = " " if i == 0 else seq1[i - 1]
-        print(f"{prefix} " + " ".join(f"{val:3d}" for val in row))
+    def _load_block(self, i: int):
+        """Recalcula o bloco que contém as linhas i - 1 e i."""
+        match_val, mismatch_val, gap_val, subst, mode = self._scoring
+        start = max(i - 1, 0) // self.interval * self.interval
+        stop = min(start + self.interval, len(self._seq1))
+        edge = gap_val if mode == "global" else 0
+        n = len(self._seq2)
+        # Primeira coluna como em create_score_matrix; o resto é sobrescrito
+        block = [self.checkpoints[start]]
+        block.extend([r * edge] + [0] * n for r in range(start + 1, stop + 1))
+        self._block = fill_score_matrix(block, self._seq1[start:stop],
+                                        self._seq2, match_val, mismatch_val,
+                                        gap_val, subst, mode)
+        self._block_start = start
 
 
-def read_fasta(file_path: str) -> list:
+def checkpoint_alignment(seq1: str, seq2: str, match_val: int = 1,
+                         mismatch_val: int = -1, gap_val: int = -1,
+                         subst=None, mode: str = "global",
+                         interval: int = None) -> tuple:
     """
-    Lê sequências de um arquivo no formato FASTA.
+    Alinhamento com traceback por checkpoints (ver CheckpointedMatrix).
 
-    Args:
-        file_path: Caminho para o arquivo .fasta
+    O resultado é idêntico ao de traceback_region sobre a matriz completa,
+    inclusive no desempate (diagonal, depois cima, depois esquerda), nos
+    três modos.
 
-    Returns:
-        list: Lista de sequências encontradas no arquivo
-    """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+        interval: Linhas entre checkpoints (padrão: √m)
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2, score, região), com a região
+        no formato de traceback_region
+    """
+    matrix = CheckpointedMatrix(seq1, seq2, match_val, mismatch_val, gap_val,
+                                subst, mode, interval)
+    align1, align2, region = traceback_region(
+        matrix, seq1, seq2, match_val, mismatch_val, gap_val, subst, mode,
+        matrix.end)
+    return align1, align2, matrix.score, region
+
+
+def alignment_score(align1: str, align2: str, match_val: int = 1,
+                    mismatch_val: int = -1, gap_val: int = -1,
+                    subst=None) -> int:
+    """
+    Calcula o score de um alinhamento já construído.
+
+    Args:
+        align1: Primeira sequência alinhada (com gaps)
+        align2: Segunda sequência alinhada (com gaps)
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+
+    Returns:
+        int: Soma das pontuações de cada coluna do alinhamento
+    """
+    score = 0
+    for c1, c2 in zip(align1, align2):
+        if c1 == "-" or c2 == "-":
+            score += gap_val
+        else:
+            score += substitution_score(c1, c2, match_val, mismatch_val, subst)
+    return score
+
+
+def _nw_last_row(seq1: str, seq2: str, match_val: int = 1,
+                 mismatch_val: int = -1, gap_val: int = -1,
+                 subst=None) -> list:
+    """
+    Calcula apenas a última linha da matriz de pontuação (modo global).
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+
+    Returns:
+        list: Scores da linha len(seq1), colunas 0..len(seq2)
+    """
+    return _dp_last_row(seq1, seq2, match_val, mismatch_val, gap_val,
+                        subst)[0]
+
+
+def _dp_last_row(seq1: str, seq2: str, match_val: int = 1,
+                 mismatch_val: int = -1, gap_val: int = -1,
+                 subst=None, mode: str = "global", row: list = None,
+                 checkpoints: dict = None, interval: int = 1) -> tuple:
+    """
+    Preenche a matriz linha a linha guardando apenas a linha corrente.
+
+    Mantém uma única linha em memória (O(n)) e um registrador com o valor
+    diagonal, sobrescrevendo a linha anterior à medida que avança. Assim
+    obtemos os scores de todos os prefixos de seq2 contra seq1 inteira sem
+    materializar a matriz completa. Nos modos local e semi-global a célula
+    final (a mesma escolhida por find_alignment_end) é acompanhada durante
+    o preenchimento.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+        row: Lista reaproveitada como linha rolante (área de trabalho do
+            Aligner); é redimensionada e reinicializada no lugar
+        checkpoints: Dicionário que recebe uma cópia da linha 0 e de cada
+            linha múltipla de `interval` (ver CheckpointedMatrix)
+        interval: Distância entre checkpoints, em linhas
+
+    Returns:
+        tuple: (última linha, score ótimo, i final, j final)
+    """
+    m, n = len(seq1), len(seq2)
+    edge = gap_val if mode == "global" else 0
+    floor = 0 if mode == "local" else NEG_INF
+    if row is None:
+        row = [j * edge for j in range(n + 1)]
+    else:
+        del row[n + 1:]
+        row.extend(itertools.repeat(0, n + 1 - len(row)))
+        for j in range(n + 1):
+            row[j] = j * edge
+    profile = build_profile(seq1, seq2, match_val, mismatch_val, subst)
+    # Local: maior célula vista; semi-global: maior célula da última coluna
+    best, best_i, best_j = 0, 0, n if mode == "semiglobal" else 0
+    if checkpoints is not None:
+        checkpoints[0] = list(row)
+
+    for i in range(1, m + 1):
+        scores = profile[i - 1]
+        diag = row[0]
+        left = row[0] = i * edge
+        for j, match in enumerate(scores, 1):
+            up = row[j]
+            # Mesma recorrência de fill_score_matrix, sem chamar max()
+            best_cell = diag + match
+            if up + gap_val > best_cell:
+                best_cell = up + gap_val
+            if left + gap_val > best_cell:
+                best_cell = left + gap_val
+            if best_cell < floor:
+                best_cell = floor
+            row[j] = left = best_cell
+            diag = up
+
+        if checkpoints is not None and i % interval == 0:
+            checkpoints[i] = list(row)
+        if mode == "local":
+            row_max = max(row)
+            if row_max > best:
+                best, best_i, best_j = row_max, i, row.index(row_max)
+        elif mode == "semiglobal" and i < m and row[n] > best:
+            best, best_i = row[n], i
+
+    if mode == "global":
+        return row, row[n], m, n
+    if mode == "semiglobal":
+        # Mesma ordem de preferência de find_alignment_end
+        column_best, column_i = best, best_i
+        best, best_i, best_j = row[n], m, n
+        if column_best > best:
+            best, best_i, best_j = column_best, column_i, n
+        row_max = max(row[:n]) if n else best
+        if row_max > best:
+            best, best_i, best_j = row_max, m, row.index(row_max)
+    return row, best, best_i, best_j
+
+
+def best_alignment_end(seq1: str, seq2: str, match_val: int = 1,
+                       mismatch_val: int = -1, gap_val: int = -1,
+                       subst=None, mode: str = "local") -> tuple:
+    """
+    Calcula o score ótimo e a célula final sem materializar a matriz.
+
+    Usa memória O(n): é o caminho de score-only dos modos local e
+    semi-global, que não podem ler o score apenas no canto (m, n).
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+
+    Returns:
+        tuple: (score, fim em seq1, fim em seq2), fins 0-based exclusivos
+    """
+    _, score, end_i, end_j = _dp_last_row(seq1, seq2, match_val, mismatch_val,
+                                          gap_val, subst, mode)
+    return score, end_i, end_j
+
+
+def screen_score(seq1: str, seq2: str, match_val: int = 1,
+                 mismatch_val: int = -1, gap_val: int = -1, subst=None,
+                 min_score: int = None, xdrop: int = None) -> int:
+    """
+    Score global com interrupção antecipada para triagem de pares.
+
+    Com `min_score`, depois de cada linha i calcula o maior score final que
+    ainda é alcançável: para cada célula, H[i][j] mais o melhor caso do
+    restante (a = m - i linhas e b = n - j colunas), que é min(a, b)
+    substituições de pontuação máxima e |a - b| gaps. Se nem esse limite
+    atinge `min_score`, o par é descartado sem calcular as demais linhas.
+    O limite usa apenas operações em C (map e max sobre a linha) e só é
+    recalculado quando pode ter caído abaixo do mínimo: de uma linha para
+    a seguinte ele cai no máximo (maior - menor substituição), então uma
+    folga F permite pular F // queda linhas.
+
+    Com `xdrop`, células que ficam mais de X abaixo do máximo da linha
+    anterior são podadas (viram NEG_INF) e cada linha só é calculada na
+    janela de células vivas. Como a referência acompanha a linha, um par
+    global cujo score só cai (ex.: uma sequência muito mais longa que a
+    outra) não é descartado por isso; apenas os caminhos que se afastam do
+    melhor da linha são podados. Para isso as linhas percorrem a sequência
+    mais longa (as sequências são trocadas quando a pontuação é simétrica),
+    de modo que o excesso de comprimento vira gaps ao longo das linhas,
+    acompanhados pelo máximo de cada uma. É uma heurística: o score
+    retornado pode ficar abaixo do ótimo.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        min_score: Score mínimo de interesse (opcional)
+        xdrop: Queda máxima em relação ao máximo da linha anterior
+            (opcional)
+
+    Returns:
+        int: Score do alinhamento global, ou None se o par foi descartado
+            (score abaixo de min_score ou todas as células podadas)
+    """
+    m, n = len(seq1), len(seq2)
+    if xdrop is not None and n > m:
+        size = subst.size if subst is not None else 0
+        if all(subst.table[a * size + b] == subst.table[b * size + a]
+               for a in range(size) for b in range(a)):
+            seq1, seq2, m, n = seq2, seq1, n, m
+    profile = build_profile(seq1, seq2, match_val, mismatch_val, subst)
+    row = [j * gap_val for j in range(n + 1)]
+
+    next_check = m + 1
+    if min_score is not None:
+        if subst is not None:
+            top, bottom = max(subst.table), min(subst.table)
+        else:
+            top, bottom = max(match_val, mismatch_val), min(match_val,
+                                                            mismatch_val)
+        # Com top >= 2 * gap, mais substituições nunca pioram o limite
+        top = max(top, 2 * gap_val)
+        drop = top - bottom
+        # tails[a + j] + a * top: melhor caso do restante a partir de (i, j)
+        tails = [(n - p) * gap_val if p <= n else (n - p) * (top - gap_val)
+                 for p in range(n + m + 1)]
+        next_check = 1
+
+    lo, hi = 0, n
+    if xdrop is not None:
+        limit = max(row) - xdrop
+        row = [value if value >= limit else NEG_INF for value in row]
+        hi = max(j for j in range(n + 1) if row[j] != NEG_INF)
+        # Máximo da linha anterior, referência da poda da linha seguinte
+        row_best = max(row)
+
+    for i in range(1, m + 1):
+        scores = profile[i - 1]
+        if xdrop is None:
+            diag = row[0]
+            left = row[0] = i * gap_val
+            for j, match in enumerate(scores, 1):
+                up = row[j]
+                cell = diag + match
+                if up + gap_val > cell:
+                    cell = up + gap_val
+                if left + gap_val > cell:
+                    cell = left + gap_val
+                row[j] = left = cell
+                diag = up
+        else:
+            limit = row_best - xdrop
+            first = i * gap_val
+            if first < limit:
+                first = NEG_INF
+            # Antes de lo a linha anterior está podada; só a coluna 0 viva
+            # ainda alcança essas células (por gaps à esquerda)
+            start = 1 if first != NEG_INF else max(lo, 1)
+            diag = row[start - 1]
+            row[0] = first
+            left = row[start - 1]
+            new_lo = 0 if first != NEG_INF else None
+            new_hi = 0 if first != NEG_INF else -1
+            for j in range(start, n + 1):
+                up = row[j]
+                cell = diag + scores[j - 1]
+                if up + gap_val > cell:
+                    cell = up + gap_val
+                if left + gap_val > cell:
+                    cell = left + gap_val
+                if cell < limit:
+                    cell = NEG_INF
+                    if j > hi:
+                        # Daqui em diante a linha anterior está podada
+                        break
+                else:
+                    if new_lo is None:
+                        new_lo = j
+                    new_hi = j
+                row[j] = left = cell
+                diag = up
+            if new_lo is None:
+                return None
+            lo, hi = new_lo, new_hi
+            row_best = max(row[lo:hi + 1])
+
+        if i >= next_check:
+            # Só a janela viva (lo..hi) pode alcançar o fim
+            a = m - i
+            reach = a * top + max(map(operator.add, row[lo:hi + 1],
+                                      tails[a + lo:a + hi + 1]))
+            if reach < min_score:
+                return None
+            next_check = i + 1 + ((reach - min_score) // drop if drop
+                                  else m)
+
+    score = row[n]
+    if score == NEG_INF or (min_score is not None and score < min_score):
+        return None
+    return score
+
+
+def bit_parallel_kind(match_val: int, mismatch_val: int,
+                      gap_val: int) -> str:
+    """
+    Verifica se a pontuação linear se reduz a um problema bit-paralelo.
+
+    Com M matches, X mismatches e G gaps vale m + n = 2M + 2X + G, logo
+
+        score = a(m+n)/2 + (b - a)X + (g - a/2)G
+
+    para match a, mismatch b e gap g. Se a + 2g = 2b (e a >= b), o score é
+    a(m+n)/2 - (a - b)D, com D a distância de edição unitária. Se b <= 2g
+    (um mismatch nunca supera dois gaps) e a >= 2g, mismatches não são
+    usados e o score é g(m+n) + (a - 2g)L, com L o tamanho da maior
+    subsequência comum. A pontuação padrão (1, -1, -1) não se encaixa em
+    nenhum dos dois casos.
+
+    Args:
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+
+    Returns:
+        str: "edit", "lcs" ou None se a pontuação não se reduz
+    """
+    if (match_val + 2 * gap_val == 2 * mismatch_val
+            and match_val >= mismatch_val):
+        return "edit"
+    if mismatch_val <= 2 * gap_val and match_val >= 2 * gap_val:
+        return "lcs"
+    return None
+
+
+def _match_masks(pattern: str) -> dict:
+    """
+    Calcula, para cada caractere do padrão, a máscara de suas posições.
+
+    O bit i da máscara de c vale 1 se pattern[i] == c. Cada máscara é
+    montada com str.translate e int(..., 2), em tempo linear.
+
+    Args:
+        pattern: Sequência indexada pelos bits
+
+    Returns:
+        dict: Caractere -> máscara (int de largura arbitrária)
+    """
+    reversed_pattern = pattern[::-1]
+    zeros = {ord(c): "0" for c in set(pattern)}
+    masks = {}
+    for c in zeros:
+        table = dict(zeros)
+        table[c] = "1"
+        masks[chr(c)] = int(reversed_pattern.translate(table), 2)
+    return masks
+
+
+def myers_edit_distance(seq1: str, seq2: str) -> int:
+    """
+    Calcula a distância de edição unitária com o algoritmo de Myers/Hyyrö.
+
+    Cada coluna da matriz de distâncias é representada pelas diferenças
+    verticais (+1/-1) codificadas em dois vetores de bits, atualizados com
+    poucas operações inteiras por caractere de seq2. Os inteiros do Python
+    têm largura arbitrária, então a coluna inteira cabe em uma "palavra".
+    O bit de entrada 1 em Ph corresponde à primeira linha D[0][j] = j
+    (variante global de Hyyrö).
+
+    Args:
+        seq1: Primeira sequência (padrão, um bit por posição)
+        seq2: Segunda sequência (texto percorrido)
+
+    Returns:
+        int: Distância de edição (mismatch e gap custam 1)
+    """
+    if len(seq1) < len(seq2):
+        # Menos iterações em Python: o padrão é a sequência mais longa
+        seq1, seq2 = seq2, seq1
+    m = len(seq1)
+    if m == 0 or not seq2:
+        return m + len(seq2)
+
+    masks = _match_masks(seq1)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv, mv = full, 0
+    score = m
+
+    for c in seq2:
+        eq = masks.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+
+    return score
+
+
+def lcs_length(seq1: str, seq2: str) -> int:
+    """
+    Calcula o tamanho da maior subsequência comum (Allison-Dix/Hyyrö).
+
+    Os bits zerados de V marcam as posições de seq1 em que a linha da
+    tabela de LCS cresce; cada caractere de seq2 atualiza V com uma soma e
+    uma subtração de inteiros.
+
+    Args:
+        seq1: Primeira sequência (padrão, um bit por posição)
+        seq2: Segunda sequência (texto percorrido)
+
+    Returns:
+        int: Tamanho da LCS
+    """
+    if len(seq1) < len(seq2):
+        seq1, seq2 = seq2, seq1
+    m = len(seq1)
+    if m == 0 or not seq2:
+        return 0
+
+    masks = _match_masks(seq1)
+    full = (1 << m) - 1
+    v = full
+
+    for c in seq2:
+        u = v & masks.get(c, 0)
+        v = ((v + u) | (v - u)) & full
+
+    return m - bin(v).count("1")
+
+
+def bit_parallel_score(seq1: str, seq2: str, match_val: int = 1,
+                       mismatch_val: int = -1, gap_val: int = -1) -> int:
+    """
+    Calcula o score global pelos algoritmos bit-paralelos, se possível.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+
+    Returns:
+        int: Mesmo score de needleman_wunsch, ou None se a pontuação não
+        se reduz a distância de edição ou LCS (ver bit_parallel_kind)
+    """
+    kind = bit_parallel_kind(match_val, mismatch_val, gap_val)
+    total = len(seq1) + len(seq2)
+    if kind == "edit":
+        distance = myers_edit_distance(seq1, seq2)
+        return match_val * total // 2 - (match_val - mismatch_val) * distance
+    if kind == "lcs":
+        common = lcs_length(seq1, seq2)
+        return gap_val * total + (match_val - 2 * gap_val) * common
+    return None
+
+
+def _nw_last_labels(seq1: str, seq2: str, match_val: int = 1,
+                    mismatch_val: int = -1, gap_val: int = -1, subst=None,
+                    first_row: list = None) -> list:
+    """
+    Rótulos do traceback na última linha, a partir de uma linha inicial.
+
+    Preenche a matriz abaixo de `first_row` (por padrão a linha 0) e cada
+    célula carrega um rótulo: a coluna da linha inicial em que termina o
+    caminho do traceback que parte dela, copiado do predecessor que o
+    traceback escolheria (diagonal, cima, esquerda, nessa ordem).
+
+    Args:
+        seq1: Primeira sequência (linhas abaixo de first_row)
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        first_row: Scores da linha inicial, colunas 0..len(seq2)
+
+    Returns:
+        list: Rótulos da linha len(seq1), colunas 0..len(seq2)
+    """
+    m, n = len(seq1), len(seq2)
+    if first_row is None:
+        first_row = [j * gap_val for j in range(n + 1)]
+    left = [first_row[0] + i * gap_val for i in range(m + 1)]
+    profile = build_profile(seq1, seq2, match_val, mismatch_val, subst)
+    return _fill_labeled_tile(first_row, left, range(n + 1), [0] * (m + 1),
+                              profile, gap_val)[2]
+
+
+def _hirschberg_split(seq1: str, seq2: str, mid: int, match_val: int = 1,
+                      mismatch_val: int = -1, gap_val: int = -1,
+                      subst=None, last_row=None, last_labels=None) -> int:
+    """
+    Coluna em que o caminho do traceback entra na linha `mid`.
+
+    O traceback volta de (m, n) escolhendo, em cada célula, o primeiro
+    predecessor consistente na ordem diagonal, cima, esquerda; essa escolha
+    depende só dos scores diretos. Até a linha `mid` basta a última linha
+    (last_row); dali em diante cada célula também carrega um rótulo
+    (last_labels), e o rótulo de (m, n) é a coluna procurada. Cortar nesse
+    ponto preserva o caminho nas duas metades: acima dele os scores são os
+    mesmos da matriz completa, e abaixo todo passo do caminho continua
+    sendo a primeira escolha consistente a partir de (mid, coluna).
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        mid: Linha de corte (0 < mid < len(seq1))
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        last_row: Função da linha `mid` (padrão: _nw_last_row)
+        last_labels: Função dos rótulos (padrão: _nw_last_labels)
+
+    Returns:
+        int: Coluna de corte na linha `mid`
+    """
+    last_row = last_row or _nw_last_row
+    last_labels = last_labels or _nw_last_labels
+    row = last_row(seq1[:mid], seq2, match_val, mismatch_val, gap_val, subst)
+    return last_labels(seq1[mid:], seq2, match_val, mismatch_val, gap_val,
+                       subst, first_row=row)[-1]
+
+
+def hirschberg(seq1: str, seq2: str, match_val: int = 1,
+               mismatch_val: int = -1, gap_val: int = -1,
+               subst=None, last_row=None, last_labels=None) -> tuple:
+    """
+    Alinhamento global em espaço linear (Hirschberg).
+
+    Divide seq1 ao meio e encontra a coluna em que o caminho do
+    `traceback` (preferência diagonal > cima > esquerda) entra na linha do
+    meio (ver _hirschberg_split); os dois subproblemas são resolvidos
+    recursivamente. Como o corte fica sobre esse caminho, o alinhamento é
+    o mesmo da matriz completa, inclusive nos empates. A memória usada é
+    O(m + n) e o tempo continua O(m * n), cerca de duas vezes o custo do
+    preenchimento completo.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        last_row: Função com a assinatura de _nw_last_row usada na metade
+            superior (ex.: wavefront_last_row com um pool de processos)
+        last_labels: Função com a assinatura de _nw_last_labels usada na
+            metade inferior (ex.: wavefront_last_row com first_row)
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2)
+    """
+    m, n = len(seq1), len(seq2)
+
+    # Caso base: subproblema pequeno resolvido com a matriz completa
+    if m <= 1 or n <= 1 or (m + 1) * (n + 1) <= HIRSCHBERG_BASE_CELLS:
+        score_matrix = create_score_matrix(seq1, seq2, gap_val)
+        score_matrix = fill_score_matrix(score_matrix, seq1, seq2, match_val,
+                                         mismatch_val, gap_val, subst)
+        return traceback(score_matrix, seq1, seq2,
+                         match_val, mismatch_val, gap_val, subst)
+
+    mid = m // 2
+    split = _hirschberg_split(seq1, seq2, mid, match_val, mismatch_val,
+                              gap_val, subst, last_row, last_labels)
+
+    top1, top2 = hirschberg(seq1[:mid], seq2[:split],
+                            match_val, mismatch_val, gap_val, subst, last_row,
+                            last_labels)
+    bottom1, bottom2 = hirschberg(seq1[mid:], seq2[split:],
+                                  match_val, mismatch_val, gap_val, subst,
+                                  last_row, last_labels)
+
+    return top1 + bottom1, top2 + bottom2
+
+
+def _fill_tile(top: list, left: list, profile: list, gap_val: int) -> tuple:
+    """
+    Preenche um bloco da matriz a partir das suas bordas.
+
+    Args:
+        top: Linha acima do bloco, com o canto superior esquerdo em top[0]
+        left: Coluna à esquerda do bloco, com o mesmo canto em left[0]
+        profile: Perfil (build_profile) das linhas do bloco
+        gap_val: Valor para gap
+
+    Returns:
+        tuple: (última linha do bloco, última coluna do bloco), no mesmo
+            formato das bordas recebidas
+    """
+    row = list(top)
+    right = [row[-1]]
+    for k, scores in enumerate(profile, 1):
+        diag = row[0]
+        left_val = row[0] = left[k]
+        for j, match in enumerate(scores, 1):
+            up = row[j]
+            best = diag + match
+            if up + gap_val > best:
+                best = up + gap_val
+            if left_val + gap_val > best:
+                best = left_val + gap_val
+            row[j] = left_val = best
+            diag = up
+        right.append(row[-1])
+    return row, right
+
+
+def _fill_labeled_tile(top: list, left: list, top_labels, left_labels,
+                       profile: list, gap_val: int) -> tuple:
+    """
+    Como _fill_tile, propagando também os rótulos de _nw_last_labels.
+
+    Args:
+        top: Linha acima do bloco, com o canto superior esquerdo em top[0]
+        left: Coluna à esquerda do bloco, com o mesmo canto em left[0]
+        top_labels: Rótulos da linha acima do bloco
+        left_labels: Rótulos da coluna à esquerda do bloco
+        profile: Perfil (build_profile) das linhas do bloco
+        gap_val: Valor para gap
+
+    Returns:
+        tuple: (última linha, última coluna, rótulos da última linha,
+            rótulos da última coluna)
+    """
+    row, labels = list(top), list(top_labels)
+    right, right_labels = [row[-1]], [labels[-1]]
+    for k, scores in enumerate(profile, 1):
+        diag, diag_label = row[0], labels[0]
+        left_val = row[0] = left[k]
+        left_label = labels[0] = left_labels[k]
+        for j, match in enumerate(scores, 1):
+            up, up_label = row[j], labels[j]
+            # Empates na ordem do traceback: diagonal, cima, esquerda
+            best, label = diag + match, diag_label
+            if up + gap_val > best:
+                best, label = up + gap_val, up_label
+            if left_val + gap_val > best:
+                best, label = left_val + gap_val, left_label
+            row[j] = left_val = best
+            labels[j] = left_label = label
+            diag, diag_label = up, up_label
+        right.append(row[-1])
+        right_labels.append(labels[-1])
+    return row, right, labels, right_labels
+
+
+# Memória compartilhada anexada em cada processo do pool (nome -> buffers)
+_WAVEFRONT_BUFFERS = {}
+
+
+def _attach_wavefront(names: tuple) -> tuple:
+    """
+    Anexa (uma vez por preenchimento) as bordas compartilhadas no processo.
+
+    Returns:
+        tuple: Visões int32 (linha, coluna, cantos)
+    """
+    entry = _WAVEFRONT_BUFFERS.get(names)
+    if entry is None:
+        # Solta os segmentos do preenchimento anterior
+        for segments, views in _WAVEFRONT_BUFFERS.values():
+            for view in views:
+                view.release()
+            for segment in segments:
+                segment.close()
+        _WAVEFRONT_BUFFERS.clear()
+        segments = [shared_memory.SharedMemory(name) for name in names]
+        entry = (segments, tuple(segment.buf.cast("i") for segment in segments))
+        _WAVEFRONT_BUFFERS[names] = entry
+    return entry[1]
+
+
+def _wavefront_tile(names: tuple, bi: int, bj: int, stride: int,
+                    i0: int, j0: int, part1: str, part2: str,
+                    scoring: tuple):
+    """
+    Preenche o bloco (bi, bj) (executado nos processos do pool).
+
+    Lê as bordas superior e esquerda da memória compartilhada e grava no
+    lugar delas as bordas inferior e direita, além do canto inferior
+    direito. Blocos da mesma anti-diagonal tocam intervalos disjuntos.
+    Com seis segmentos, os três últimos guardam os rótulos das mesmas
+    bordas (_fill_labeled_tile).
+
+    Args:
+        names: Nomes dos segmentos (linha, coluna, cantos e, opcionalmente,
+            os rótulos de cada um)
+        bi: Linha do bloco
+        bj: Coluna do bloco
+        stride: Cantos por linha de blocos
+        i0: Primeira linha da matriz antes do bloco
+        j0: Primeira coluna da matriz antes do bloco
+        part1: Trecho de seq1 coberto pelo bloco
+        part2: Trecho de seq2 coberto pelo bloco
+        scoring: (match_val, mismatch_val, gap_val, subst)
+    """
+    views = _attach_wavefront(names)
+    rows, cols, corners = views[:3]
+    match_val, mismatch_val, gap_val, subst = scoring
+    i1, j1 = i0 + len(part1), j0 + len(part2)
+    corner = corners[bi * stride + bj]
+    top = [corner] + rows[j0 + 1:j1 + 1].tolist()
+    left = [corner] + cols[i0 + 1:i1 + 1].tolist()
+    profile = build_profile(part1, part2, match_val, mismatch_val, subst)
+    if len(views) == 3:
+        bottom, right = _fill_tile(top, left, profile, gap_val)
+    else:
+        row_labels, col_labels, corner_labels = views[3:]
+        label = corner_labels[bi * stride + bj]
+        bottom, right, labels, right_labels = _fill_labeled_tile(
+            top, left, [label] + row_labels[j0 + 1:j1 + 1].tolist(),
+            [label] + col_labels[i0 + 1:i1 + 1].tolist(), profile, gap_val)
+        row_labels[j0 + 1:j1 + 1] = array("i", labels[1:])
+        col_labels[i0 + 1:i1 + 1] = array("i", right_labels[1:])
+        corner_labels[(bi + 1) * stride + bj + 1] = labels[-1]
+    rows[j0 + 1:j1 + 1] = array("i", bottom[1:])
+    cols[i0 + 1:i1 + 1] = array("i", right[1:])
+    corners[(bi + 1) * stride + bj + 1] = bottom[-1]
+
+
+def _shared_ints(values) -> tuple:
+    """Cria um segmento de memória compartilhada com os inteiros dados."""
+    values = array("i", values)
+    segment = shared_memory.SharedMemory(create=True,
+                                         size=max(len(values), 1) * 4)
+    view = segment.buf.cast("i")
+    view[:len(values)] = values
+    return segment, view
+
+
+def wavefront_last_row(seq1: str, seq2: str, match_val: int = 1,
+                       mismatch_val: int = -1, gap_val: int = -1,
+                       subst=None, workers: int = None,
+                       tile: int = DEFAULT_TILE, executor=None,
+                       min_cells: int = WAVEFRONT_MIN_CELLS,
+                       first_row: list = None) -> list:
+    """
+    Calcula a última linha da matriz em blocos, com vários processos.
+
+    A matriz é dividida em blocos de `tile` x `tile`. O bloco (bi, bj)
+    depende apenas dos blocos acima e à esquerda, então os blocos de uma
+    mesma anti-diagonal são independentes: cada um é enviado ao pool
+    assim que os dois vizinhos terminam. Entre os processos circulam
+    apenas as bordas, em três segmentos de multiprocessing.shared_memory:
+    a linha de fronteira (n + 1 inteiros), a coluna de fronteira (m + 1) e
+    o canto inferior direito de cada bloco. A memória é O(m + n) e o
+    resultado é idêntico ao de _nw_last_row, que é usado diretamente para
+    subproblemas com menos de `min_cells` células.
+
+    Com `first_row`, a matriz parte dessa linha e o resultado são os
+    rótulos de _nw_last_labels, propagados em mais três segmentos com as
+    mesmas bordas (é a metade inferior do corte do Hirschberg).
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        workers: Número de processos (padrão: número de CPUs)
+        tile: Lado dos blocos
+        executor: ProcessPoolExecutor já aberto (reaproveitado entre
+            chamadas, como nas metades do Hirschberg)
+        min_cells: Abaixo deste número de células não há paralelismo
+        first_row: Linha inicial; se dada, devolve os rótulos
+
+    Returns:
+        list: Scores (ou rótulos) da linha len(seq1), colunas 0..len(seq2)
+    """
+    m, n = len(seq1), len(seq2)
+    if m * n < min_cells or (m <= tile and n <= tile):
+        if first_row is not None:
+            return _nw_last_labels(seq1, seq2, match_val, mismatch_val,
+                                   gap_val, subst, first_row)
+        return _nw_last_row(seq1, seq2, match_val, mismatch_val, gap_val,
+                            subst)
+    if executor is None:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return wavefront_last_row(seq1, seq2, match_val, mismatch_val,
+                                      gap_val, subst, workers, tile, executor,
+                                      min_cells, first_row)
+
+    row_bounds = list(range(0, m, tile)) + [m]
+    col_bounds = list(range(0, n, tile)) + [n]
+    blocks_i, blocks_j = len(row_bounds) - 1, len(col_bounds) - 1
+    stride = blocks_j + 1
+    top = first_row or [j * gap_val for j in range(n + 1)]
+    corners = [0] * ((blocks_i + 1) * stride)
+    for bj, j in enumerate(col_bounds):
+        corners[bj] = top[j]
+    for bi, i in enumerate(row_bounds):
+        corners[bi * stride] = top[0] + i * gap_val
+
+    buffers = [_shared_ints(top),
+               _shared_ints(top[0] + i * gap_val for i in range(m + 1)),
+               _shared_ints(corners)]
+    if first_row is not None:
+        corner_labels = [0] * len(corners)
+        corner_labels[:blocks_j + 1] = col_bounds
+        buffers += [_shared_ints(range(n + 1)), _shared_ints([0] * (m + 1)),
+                    _shared_ints(corner_labels)]
+    names = tuple(segment.name for segment, _ in buffers)
+    scoring = (match_val, mismatch_val, gap_val, subst)
+    try:
+        pending = {}
+        done = set()
+
+        def submit(bi, bj):
+            i0, i1 = row_bounds[bi], row_bounds[bi + 1]
+            j0, j1 = col_bounds[bj], col_bounds[bj + 1]
+            future = executor.submit(_wavefront_tile, names, bi, bj, stride,
+                                     i0, j0, seq1[i0:i1], seq2[j0:j1],
+                                     scoring)
+            pending[future] = (bi, bj)
+
+        submit(0, 0)
+        while pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                bi, bj = pending.pop(future)
+                future.result()
+                done.add((bi, bj))
+                # Libera os vizinhos cujas duas dependências terminaram
+                if bi + 1 < blocks_i and (bj == 0 or (bi + 1, bj - 1) in done):
+                    submit(bi + 1, bj)
+                if bj + 1 < blocks_j and (bi == 0 or (bi - 1, bj + 1) in done):
+                    submit(bi, bj + 1)
+
+        if first_row is not None:
+            return buffers[3][1].tolist()
+        row = buffers[0][1].tolist()
+        row[0] = m * gap_val
+        return row
+    finally:
+        for segment, view in buffers:
+            view.release()
+            segment.close()
+            segment.unlink()
+
+
+def wavefront_hirschberg(seq1: str, seq2: str, match_val: int = 1,
+                         mismatch_val: int = -1, gap_val: int = -1,
+                         subst=None, workers: int = None,
+                         tile: int = DEFAULT_TILE,
+                         min_cells: int = WAVEFRONT_MIN_CELLS) -> tuple:
+    """
+    Hirschberg com as últimas linhas calculadas por wavefront_last_row.
+
+    Um único pool de processos atende todas as metades da recursão (scores
+    da metade superior e rótulos da inferior); os subproblemas pequenos
+    continuam no processo principal. O alinhamento é o mesmo de hirschberg.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        workers: Número de processos (padrão: número de CPUs)
+        tile: Lado dos blocos
+        min_cells: Subproblemas menores são preenchidos sem paralelismo
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2)
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        last_row = functools.partial(wavefront_last_row, workers=workers,
+                                     tile=tile, executor=executor,
+                                     min_cells=min_cells)
+        return hirschberg(seq1, seq2, match_val, mismatch_val, gap_val, subst,
+                          last_row, last_row)
+
+
+def _fill_banded(seq1: str, seq2: str, lo: int, hi: int, match_val: int,
+                 mismatch_val: int, gap_val: int, subst=None) -> list:
+    """
+    Preenche apenas as células com deslocamento j - i em [lo, hi].
+
+    Cada linha guarda somente a faixa (hi - lo + 1 células) em um
+    array('i'); a célula (i, j) fica no índice j - i - lo da linha i.
+    Nessa disposição a vizinha diagonal (i-1, j-1) tem o mesmo índice, a
+    de cima (i-1, j) o índice seguinte e a da esquerda (i, j-1) o anterior.
+    Posições fora da matriz ou da faixa valem NEG_INF.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        lo: Menor deslocamento j - i dentro da faixa
+        hi: Maior deslocamento j - i dentro da faixa
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+
+    Returns:
+        list: Linhas 0..m da faixa, cada uma um array('i')
+    """
+    m, n = len(seq1), len(seq2)
+    profile = build_profile(seq1, seq2, match_val, mismatch_val, subst)
+    width = hi - lo + 1
+    empty = array("i", [NEG_INF]) * width
+
+    first = array("i", empty)
+    for j in range(max(0, lo), min(n, hi) + 1):
+        first[j - lo] = j * gap_val
+    rows = [first]
+
+    for i in range(1, m + 1):
+        prev = rows[-1]
+        row = array("i", empty)
+        scores = profile[i - 1]
+        j_lo = max(0, i + lo)
+        if j_lo == 0:
+            row[j_lo - i - lo] = i * gap_val
+            j_lo = 1
+        for j in range(j_lo, min(n, i + hi) + 1):
+            idx = j - i - lo
+            best = prev[idx] + scores[j - 1]
+            if idx + 1 < width and prev[idx + 1] + gap_val > best:
+                best = prev[idx + 1] + gap_val
+            if idx > 0 and row[idx - 1] + gap_val > best:
+                best = row[idx - 1] + gap_val
+            row[idx] = best
+        rows.append(row)
+
+    return rows
+
+
+def _banded_traceback(rows: list, seq1: str, seq2: str, lo: int,
+                      match_val: int, mismatch_val: int, gap_val: int,
+                      subst=None) -> tuple:
+    """
+    Reconstrói o alinhamento a partir das linhas da faixa.
+
+    Segue a mesma ordem de preferência de `traceback` (diagonal, cima,
+    esquerda), lendo as células pelo índice j - i - lo.
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2)
+    """
+    aligned_seq1 = []
+    aligned_seq2 = []
+    width = len(rows[0])
+    i, j = len(seq1), len(seq2)
+
+    while i > 0 or j > 0:
+        idx = j - i - lo
+        current = rows[i][idx]
+        if i > 0 and j > 0:
+            match = substitution_score(seq1[i - 1], seq2[j - 1],
+                                       match_val, mismatch_val, subst)
+            if current == rows[i - 1][idx] + match:
+                aligned_seq1.append(seq1[i - 1])
+                aligned_seq2.append(seq2[j - 1])
+                i -= 1
+                j -= 1
+                continue
+
+        if (i > 0 and idx + 1 < width
+                and current == rows[i - 1][idx + 1] + gap_val):
+            aligned_seq1.append(seq1[i - 1])
+            aligned_seq2.append("-")
+            i -= 1
+        else:
+            aligned_seq1.append("-")
+            aligned_seq2.append(seq2[j - 1])
+            j -= 1
+
+    return "".join(reversed(aligned_seq1)), "".join(reversed(aligned_seq2))
+
+
+def banded_needleman_wunsch(seq1: str, seq2: str, match_val: int = 1,
+                            mismatch_val: int = -1, gap_val: int = -1,
+                            band: int = DEFAULT_BAND, subst=None) -> tuple:
+    """
+    Alinhamento global restrito a uma faixa em torno da diagonal.
+
+    Apenas as células a até `band` posições da diagonal (estendida para
+    cobrir a diferença de tamanho entre as sequências) são calculadas, com
+    custo O((m + n) * band) em tempo e memória. Depois do preenchimento o
+    score obtido é comparado com o maior score possível de qualquer
+    caminho que saia da faixa: sair da faixa exige um número mínimo de
+    gaps, o que limita o score desses caminhos. Se o limite não puder ser
+    descartado, a faixa é dobrada e o cálculo repetido, de modo que o
+    score final é sempre igual ao do algoritmo exato.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        band: Meia-largura inicial da faixa
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2, score)
+    """
+    m, n = len(seq1), len(seq2)
+    diff = n - m
+    if subst is None:
+        best_pair = max(match_val, mismatch_val)
+    else:
+        best_pair = subst.max_score()
+    k = max(band, 1)
+
+    while True:
+        lo = min(0, diff) - k
+        hi = max(0, diff) + k
+        rows = _fill_banded(seq1, seq2, lo, hi, match_val, mismatch_val,
+                            gap_val, subst)
+        score = rows[m][diff - lo]
+
+        if lo <= -m and hi >= n:
+            break  # A faixa cobre a matriz inteira
+
+        if 2 * gap_val < best_pair:
+            # Gaps mínimos de um caminho que toca hi + 1 ou lo - 1
+            min_gaps = min((hi + 1) + (hi + 1 - diff),
+                           (1 - lo) + (diff - lo + 1))
+            # Limite (dobrado) do score de qualquer caminho fora da faixa
+            bound2 = (m + n - min_gaps) * best_pair + 2 * min_gaps * gap_val
+            if 2 * score >= bound2:
+                break
+
+        k *= 2
+
+    align1, align2 = _banded_traceback(rows, seq1, seq2, lo, match_val,
+                                       mismatch_val, gap_val, subst)
+    return align1, align2, score
+
+
+def _fill_pointers(seq1: str, seq2: str, match_val: int, mismatch_val: int,
+                   gap_val: int, subst=None,
+                   pointers: bytearray = None) -> tuple:
+    """
+    Preenche a matriz guardando apenas as direções, 2 bits por célula.
+
+    Os scores usam uma única linha rolante; de cada linha sobra somente
+    o código de direção de cada célula (MOVE_DIAG, MOVE_UP ou MOVE_LEFT),
+    escolhido com a mesma preferência de `traceback` (diagonal, cima,
+    esquerda). A linha de códigos é empacotada com pack_2bit, 4 células
+    por byte, em linhas de `stride` bytes. Um bytearray passado em
+    `pointers` (área de trabalho do Aligner) é redimensionado e reaproveitado;
+    todas as linhas são sobrescritas, então não é preciso zerá-lo.
+
+    Returns:
+        tuple: (ponteiros em bytearray, stride, score)
+    """
+    m, n = len(seq1), len(seq2)
+    stride = (n + 4) // 4
+    size = stride * (m + 1)
+    if pointers is None:
+        pointers = bytearray(size)
+    elif len(pointers) > size:
+        del pointers[size:]
+    else:
+        pointers.extend(bytes(size - len(pointers)))
+    # Linha 0: só é possível vir da esquerda
+    pointers[0:stride] = pack_2bit(bytes([MOVE_LEFT]) * (n + 1))
+
+    row = [j * gap_val for j in range(n + 1)]
+    profile = build_profile(seq1, seq2, match_val, mismatch_val, subst)
+    moves = bytearray(n + 1)
+
+    for i in range(1, m + 1):
+        scores = profile[i - 1]
+        diag = row[0]
+        left = row[0] = i * gap_val
+        moves[0] = MOVE_UP
+        for j, match in enumerate(scores, 1):
+            up = row[j]
+            best = diag + match
+            move = MOVE_DIAG
+            if up + gap_val > best:
+                best = up + gap_val
+                move = MOVE_UP
+            if left + gap_val > best:
+                best = left + gap_val
+                move = MOVE_LEFT
+            row[j] = left = best
+            moves[j] = move
+            diag = up
+        pointers[i * stride:(i + 1) * stride] = pack_2bit(moves)
+
+    return pointers, stride, row[n]
+
+
+def _pointer_traceback(pointers: bytearray, stride: int, seq1: str,
+                       seq2: str) -> tuple:
+    """
+    Reconstrói o alinhamento lendo apenas os códigos de direção.
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2)
+    """
+    aligned_seq1 = []
+    aligned_seq2 = []
+    i, j = len(seq1), len(seq2)
+
+    while i > 0 or j > 0:
+        move = (pointers[i * stride + (j >> 2)] >> ((j & 3) << 1)) & 3
+        if move == MOVE_DIAG:
+            aligned_seq1.append(seq1[i - 1])
+            aligned_seq2.append(seq2[j - 1])
+            i -= 1
+            j -= 1
+        elif move == MOVE_UP:
+            aligned_seq1.append(seq1[i - 1])
+            aligned_seq2.append("-")
+            i -= 1
+        else:
+            aligned_seq1.append("-")
+            aligned_seq2.append(seq2[j - 1])
+            j -= 1
+
+    return "".join(reversed(aligned_seq1)), "".join(reversed(aligned_seq2))
+
+
+def pointer_needleman_wunsch(seq1: str, seq2: str, match_val: int = 1,
+                             mismatch_val: int = -1, gap_val: int = -1,
+                             subst=None) -> tuple:
+    """
+    Alinhamento global com matriz de ponteiros de 2 bits.
+
+    Em vez de manter a matriz de scores (um int do Python por célula,
+    cerca de 36 bytes com o ponteiro da lista) só para o traceback, o
+    preenchimento grava a direção de cada célula em um bytearray com 4
+    células por byte e descarta cada linha de scores após usá-la. O
+    alinhamento é idêntico ao de `traceback`.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2, score)
+    """
+    return Aligner(match_val, mismatch_val, gap_val, subst=subst,
+                   engine="pointers").align(seq1, seq2)
+
+
+def find_anchors(seq1: str, seq2: str, k: int = DEFAULT_SEED) -> list:
+    """
+    Encontra âncoras exatas entre duas sequências a partir de k-mers únicos.
+
+    Um índice de hash guarda a posição de cada k-mer de seq1; apenas os
+    k-mers que ocorrem exatamente uma vez em cada sequência viram
+    sementes, o que descarta repetições ambíguas. Sementes consecutivas na
+    mesma diagonal são fundidas em um único match exato (no estilo dos
+    maximal unique matches), de modo que uma região idêntica longa gera
+    uma âncora, e não uma por base.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        k: Tamanho das sementes
+
+    Returns:
+        list: Tuplas (início1, início2, comprimento), ordenadas por início1
+    """
+    positions = {}
+    for i in range(len(seq1) - k + 1):
+        kmer = seq1[i:i + k]
+        positions[kmer] = -1 if kmer in positions else i
+    hits = {}
+    for j in range(len(seq2) - k + 1):
+        kmer = seq2[j:j + k]
+        if positions.get(kmer, -1) >= 0:
+            hits[kmer] = -1 if kmer in hits else j
+    seeds = sorted((positions[kmer] - j, positions[kmer])
+                   for kmer, j in hits.items() if j >= 0)
+
+    anchors = []
+    run_start = previous = None
+    for diagonal, i in seeds:
+        if (run_start is not None
+                and (diagonal, i) == (run_start[0], previous + 1)):
+            previous = i
+            continue
+        if run_start is not None:
+            start = run_start[1]
+            anchors.append((start, start - run_start[0], previous - start + k))
+        run_start, previous = (diagonal, i), i
+    if run_start is not None:
+        start = run_start[1]
+        anchors.append((start, start - run_start[0], previous - start + k))
+    anchors.sort()
+    return anchors
+
+
+def chain_anchors(anchors: list) -> list:
+    """
+    Escolhe a cadeia colinear de âncoras de maior comprimento total.
+
+    Uma âncora só pode seguir outra que termine antes dela nas duas
+    sequências (sem sobreposição). A programação dinâmica percorre as
+    âncoras por início1 e consulta o melhor predecessor em uma árvore de
+    Fenwick de máximos indexada pelo fim em seq2, em O(a log a) para a
+    âncoras.
+
+    Args:
+        anchors: Tuplas (início1, início2, comprimento) ordenadas por
+            início1 (ver find_anchors)
+
+    Returns:
+        list: Âncoras da cadeia, em ordem
+    """
+    if not anchors:
+        return []
+    ends2 = sorted({j + length for _, j, length in anchors})
+    size = len(ends2)
+    tree = [0] * (size + 1)
+    owner = [-1] * (size + 1)
+    by_end1 = sorted(range(len(anchors)),
+                     key=lambda n: anchors[n][0] + anchors[n][2])
+    best = [0] * len(anchors)
+    back = [-1] * len(anchors)
+    inserted = 0
+
+    for n, (i, j, length) in enumerate(anchors):
+        # Torna consultáveis as âncoras que terminam antes de i em seq1
+        while inserted < len(by_end1):
+            other = by_end1[inserted]
+            other_i, other_j, other_length = anchors[other]
+            if other_i + other_length > i:
+                break
+            pos = bisect.bisect_left(ends2, other_j + other_length) + 1
+            while pos <= size:
+                if best[other] > tree[pos]:
+                    tree[pos], owner[pos] = best[other], other
+                pos += pos & -pos
+            inserted += 1
+        # Melhor predecessor entre as âncoras com fim2 <= j
+        pos = bisect.bisect_right(ends2, j)
+        previous_best, previous = 0, -1
+        while pos > 0:
+            if tree[pos] > previous_best:
+                previous_best, previous = tree[pos], owner[pos]
+            pos -= pos & -pos
+        best[n] = previous_best + length
+        back[n] = previous
+
+    chain = []
+    n = max(range(len(anchors)), key=best.__getitem__)
+    while n >= 0:
+        chain.append(anchors[n])
+        n = back[n]
+    chain.reverse()
+    return chain
+
+
+def anchored_alignment(seq1: str, seq2: str, match_val: int = 1,
+                       mismatch_val: int = -1, gap_val: int = -1, subst=None,
+                       k: int = DEFAULT_SEED, aligner=None) -> tuple:
+    """
+    Alinhamento global guiado por âncoras (seed-and-chain).
+
+    As âncoras exatas (find_anchors) são encadeadas (chain_anchors) e
+    apenas os trechos entre âncoras consecutivas, além das pontas, são
+    alinhados por programação dinâmica; os pedaços são então concatenados.
+    Em pares longos e parecidos o custo cai de O(m·n) para a soma dos
+    quadrados dos trechos entre âncoras. É uma heurística: o resultado é
+    um alinhamento global válido, mas pode ficar abaixo do ótimo se a
+    cadeia escolhida não pertencer a um alinhamento ótimo. Sem âncoras, o
+    par inteiro é alinhado pelo `aligner`.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        k: Tamanho das sementes
+        aligner: Aligner global dos trechos entre âncoras (padrão: um
+            Aligner com a mesma pontuação e motor auto); com gaps afins o
+            score continua exato, pois nenhum gap atravessa uma âncora
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2, score)
+    """
+    if aligner is None:
+        aligner = Aligner(match_val, mismatch_val, gap_val, subst=subst)
+    parts1, parts2 = [], []
+    score = 0
+    end1 = end2 = 0
+    chain = chain_anchors(find_anchors(seq1, seq2, k))
+    for i, j, length in chain + [(len(seq1), len(seq2), 0)]:
+        align1, align2, part_score = aligner.align(seq1[end1:i], seq2[end2:j])
+        anchor = seq1[i:i + length]
+        parts1 += (align1, anchor)
+        parts2 += (align2, anchor)
+        score += part_score + sum(
+            substitution_score(c, c, match_val, mismatch_val, subst)
+            for c in anchor)
+        end1, end2 = i + length, j + length
+    return "".join(parts1), "".join(parts2), score
+
+
+def _gap_run(length: int, gap_open: int, gap_extend: int) -> int:
+    """Penalidade de um gap de `length` posições (abertura + extensões)."""
+    return gap_open + (length - 1) * gap_extend
+
+
+def _fill_gotoh(seq1: str, seq2: str, match_val: int, mismatch_val: int,
+                gap_open: int, gap_extend: int, subst=None, first: tuple = None,
+                start: int = 0) -> tuple:
+    """
+    Preenche as três matrizes do algoritmo de Gotoh.
+
+    M[i][j] termina em match/mismatch, X[i][j] termina em gap na seq2
+    (consome seq1) e Y[i][j] termina em gap na seq1 (consome seq2). Cada
+    matriz é um único array('i') contíguo de (m+1) * (n+1) posições, com a
+    célula (i, j) no índice i * (n + 1) + j: 4 bytes por célula, em vez de
+    uma lista de listas de objetos int.
+
+    Args:
+        first: Linhas (M, X, Y) acima de seq1, para continuar o
+            preenchimento a partir de um checkpoint (ver checkpoint_gotoh)
+        start: Linha da matriz completa que corresponde a `first`
+
+    Returns:
+        tuple: (M, X, Y) como array('i')
+    """
+    m, n = len(seq1), len(seq2)
+    width = n + 1
+    size = (m + 1) * width
+    M = array("i", [NEG_INF]) * size
+    X = array("i", [NEG_INF]) * size
+    Y = array("i", [NEG_INF]) * size
+
+    for i in range(1, m + 1):
+        X[i * width] = _gap_run(start + i, gap_open, gap_extend)
+    if first is None:
+        M[0] = 0
+        for j in range(1, n + 1):
+            Y[j] = _gap_run(j, gap_open, gap_extend)
+    else:
+        M[:width], X[:width], Y[:width] = first
+
+    profile = build_profile(seq1, seq2, match_val, mismatch_val, subst)
+    for i in range(1, m + 1):
+        scores = profile[i - 1]
+        row = i * width
+        for j in range(1, n + 1):
+            k = row + j
+            diag = k - width - 1
+            up = k - width
+            left = k - 1
+
+            best = M[diag]
+            if X[diag] > best:
+                best = X[diag]
+            if Y[diag] > best:
+                best = Y[diag]
+            M[k] = best + scores[j - 1]
+
+            best = M[up] + gap_open
+            if X[up] + gap_extend > best:
+                best = X[up] + gap_extend
+            if Y[up] + gap_open > best:
+                best = Y[up] + gap_open
+            X[k] = best
+
+            best = M[left] + gap_open
+            if Y[left] + gap_extend > best:
+                best = Y[left] + gap_extend
+            if X[left] + gap_open > best:
+                best = X[left] + gap_open
+            Y[k] = best
+
+    return M, X, Y
+
+
+def gotoh(seq1: str, seq2: str, match_val: int = 1, mismatch_val: int = -1,
+          gap_open: int = -1, gap_extend: int = -1, subst=None) -> tuple:
+    """
+    Alinhamento global com penalidades de gap afins (Gotoh).
+
+    Um gap de comprimento L custa gap_open + (L - 1) * gap_extend; com
+    gap_open == gap_extend o resultado coincide com o Needleman-Wunsch de
+    gap linear. O traceback percorre os três estados (M, X, Y) com a
+    preferência M, X, Y em caso de empate.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_open: Penalidade do primeiro resíduo de um gap
+        gap_extend: Penalidade de cada resíduo adicional do gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2, score)
+    """
+    m, n = len(seq1), len(seq2)
+    M, X, Y = _fill_gotoh(seq1, seq2, match_val, mismatch_val,
+                          gap_open, gap_extend, subst)
+
+    k = m * (n + 1) + n
+    score = max(M[k], X[k], Y[k])
+    state = "M" if M[k] == score else "X" if X[k] == score else "Y"
+
+    aligned_seq1 = []
+    aligned_seq2 = []
+    _gotoh_traceback(M, X, Y, seq1, seq2, m, n, state, 0,
+                     (match_val, mismatch_val, gap_open, gap_extend, subst),
+                     aligned_seq1, aligned_seq2)
+    return ("".join(reversed(aligned_seq1)), "".join(reversed(aligned_seq2)),
+            score)
+
+
+def _gotoh_traceback(M, X, Y, seq1: str, seq2: str, i: int, j: int,
+                     state: str, start: int, scoring: tuple,
+                     aligned_seq1: list, aligned_seq2: list) -> tuple:
+    """
+    Percorre as matrizes de Gotoh de (i, j) até a linha `start`.
+
+    As matrizes cobrem as linhas start..; a célula (i, j) fica no índice
+    (i - start) * (n + 1) + j. Com start == 0 o percurso vai até (0, 0).
+    As colunas do alinhamento são acrescentadas, de trás para frente, em
+    aligned_seq1 e aligned_seq2.
+
+    Args:
+        M, X, Y: Matrizes de _fill_gotoh
+        seq1: Primeira sequência (inteira)
+        seq2: Segunda sequência
+        i: Linha inicial
+        j: Coluna inicial
+        state: Estado inicial ("M", "X" ou "Y")
+        start: Primeira linha das matrizes
+        scoring: (match_val, mismatch_val, gap_open, gap_extend, subst)
+        aligned_seq1: Colunas de seq1 (invertidas)
+        aligned_seq2: Colunas de seq2 (invertidas)
+
+    Returns:
+        tuple: (i, j, estado) em que o percurso parou
+    """
+    match_val, mismatch_val, gap_open, gap_extend, subst = scoring
+    width = len(seq2) + 1
+
+    while i > start or (start == 0 and j > 0):
+        k = (i - start) * width + j
+        if state == "M":
+            # Match/mismatch: veio de (i-1, j-1) em qualquer estado
+            match = substitution_score(seq1[i - 1], seq2[j - 1],
+                                       match_val, mismatch_val, subst)
+            prev = k - width - 1
+            target = M[k] - match
+            aligned_seq1.append(seq1[i - 1])
+            aligned_seq2.append(seq2[j - 1])
+            i -= 1
+            j -= 1
+            extend_m = extend_x = extend_y = 0
+        elif state == "X":
+            # Gap na seq2: veio de (i-1, j); só X pode ser estendido
+            prev = k - width
+            target = X[k]
+            aligned_seq1.append(seq1[i - 1])
+            aligned_seq2.append("-")
+            i -= 1
+            extend_m, extend_x, extend_y = gap_open, gap_extend, gap_open
+        else:
+            # Gap na seq1: veio de (i, j-1); só Y pode ser estendido
+            prev = k - 1
+            target = Y[k]
+            aligned_seq1.append("-")
+            aligned_seq2.append(seq2[j - 1])
+            j -= 1
+            extend_m, extend_x, extend_y = gap_open, gap_open, gap_extend
+
+        if M[prev] + extend_m == target:
+            state = "M"
+        elif X[prev] + extend_x == target:
+            state = "X"
+        else:
+            state = "Y"
+
+    return i, j, state
+
+
+def gotoh_score(seq1: str, seq2: str, match_val: int = 1,
+                mismatch_val: int = -1, gap_open: int = -1,
+                gap_extend: int = -1, subst=None, checkpoints: dict = None,
+                interval: int = 1) -> int:
+    """
+    Calcula apenas o score do alinhamento com gaps afins (Gotoh).
+
+    Mantém somente a linha anterior e a atual das três matrizes, com
+    memória O(n).
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_open: Penalidade do primeiro resíduo de um gap
+        gap_extend: Penalidade de cada resíduo adicional do gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        checkpoints: Dicionário que recebe as linhas (M, X, Y), como
+            array('i'), da linha 0 e de cada múltipla de `interval`
+        interval: Distância entre checkpoints, em linhas
+
+    Returns:
+        int: Score do melhor alinhamento global
+    """
+    n = len(seq2)
+    profile = build_profile(seq1, seq2, match_val, mismatch_val, subst)
+    prev_m = [NEG_INF] * (n + 1)
+    prev_m[0] = 0
+    prev_x = [NEG_INF] * (n + 1)
+    prev_y = [NEG_INF] + [_gap_run(j, gap_open, gap_extend)
+                          for j in range(1, n + 1)]
+    if checkpoints is not None:
+        checkpoints[0] = (array("i", prev_m), array("i", prev_x),
+                          array("i", prev_y))
+
+    for i in range(1, len(seq1) + 1):
+        scores = profile[i - 1]
+        cur_m = [NEG_INF] * (n + 1)
+        cur_x = [NEG_INF] * (n + 1)
+        cur_y = [NEG_INF] * (n + 1)
+        cur_x[0] = _gap_run(i, gap_open, gap_extend)
+        for j in range(1, n + 1):
+            cur_m[j] = max(prev_m[j - 1], prev_x[j - 1],
+                           prev_y[j - 1]) + scores[j - 1]
+            cur_x[j] = max(prev_m[j] + gap_open, prev_x[j] + gap_extend,
+                           prev_y[j] + gap_open)
+            cur_y[j] = max(cur_m[j - 1] + gap_open, cur_y[j - 1] + gap_extend,
+                           cur_x[j - 1] + gap_open)
+        prev_m, prev_x, prev_y = cur_m, cur_x, cur_y
+        if checkpoints is not None and i % interval == 0:
+            checkpoints[i] = (array("i", cur_m), array("i", cur_x),
+                              array("i", cur_y))
+
+    return max(prev_m[n], prev_x[n], prev_y[n])
+
+
+def checkpoint_gotoh(seq1: str, seq2: str, match_val: int = 1,
+                     mismatch_val: int = -1, gap_open: int = -1,
+                     gap_extend: int = -1, subst=None,
+                     interval: int = None) -> tuple:
+    """
+    Gotoh com traceback por checkpoints, em memória O(n * √m).
+
+    Mesma ideia de CheckpointedMatrix com as três matrizes: o preenchimento
+    inicial (gotoh_score) guarda as linhas M, X e Y a cada `interval`
+    linhas (por padrão √m). O traceback desce de bloco em bloco; cada bloco
+    entre dois checkpoints é recalculado uma única vez por _fill_gotoh a
+    partir do checkpoint de cima, e o custo total fica em cerca de duas
+    vezes o preenchimento. O resultado é idêntico ao de gotoh, inclusive
+    no desempate.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_open: Penalidade do primeiro resíduo de um gap
+        gap_extend: Penalidade de cada resíduo adicional do gap
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        interval: Linhas entre checkpoints (padrão: √m)
+
+    Returns:
+        tuple: (aligned_seq1, aligned_seq2, score)
+    """
+    m, n = len(seq1), len(seq2)
+    interval = interval or max(1, math.isqrt(m))
+    checkpoints = {}
+    score = gotoh_score(seq1, seq2, match_val, mismatch_val, gap_open,
+                        gap_extend, subst, checkpoints, interval)
+    scoring = (match_val, mismatch_val, gap_open, gap_extend, subst)
+
+    aligned_seq1 = []
+    aligned_seq2 = []
+    i, j, state = m, n, None
+    while state is None or i > 0 or j > 0:
+        # Bloco que contém as linhas i - 1 e i
+        start = max(i - 1, 0) // interval * interval
+        stop = min(start + interval, m)
+        M, X, Y = _fill_gotoh(seq1[start:stop], seq2, match_val, mismatch_val,
+                              gap_open, gap_extend, subst, checkpoints[start],
+                              start)
+        if state is None:
+            k = (m - start) * (n + 1) + n
+            state = "M" if M[k] == score else "X" if X[k] == score else "Y"
+        i, j, state = _gotoh_traceback(M, X, Y, seq1, seq2, i, j, state,
+                                       start, scoring, aligned_seq1,
+                                       aligned_seq2)
+
+    return ("".join(reversed(aligned_seq1)), "".join(reversed(aligned_seq2)),
+            score)
+
+
+def resolve_affine_gaps(gap_val: int, gap_open: int = None,
+                        gap_extend: int = None):
+    """
+    Determina as penalidades afins a partir dos argumentos da CLI.
+
+    Args:
+        gap_val: Penalidade de gap linear (usada no valor ausente)
+        gap_open: Penalidade de abertura ou None
+        gap_extend: Penalidade de extensão ou None
+
+    Returns:
+        tuple: (gap_open, gap_extend), ou None se nenhum dos dois foi dado
+    """
+    if gap_open is None and gap_extend is None:
+        return None
+    return (gap_val if gap_open is None else gap_open,
+            gap_val if gap_extend is None else gap_extend)
+
+
+def score_pair(seq1: str, seq2: str, match_val: int = 1,
+               mismatch_val: int = -1, gap_val: int = -1,
+               gap_open: int = None, gap_extend: int = None,
+               subst=None, mode: str = "global", min_score: int = None,
+               xdrop: int = None) -> int:
+    """
+    Calcula o score de um par escolhendo o modelo de gap adequado.
+
+    Args:
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap linear
+        gap_open: Penalidade de abertura (ativa gaps afins)
+        gap_extend: Penalidade de extensão (ativa gaps afins)
+        subst: SubstitutionMatrix opcional (substitui match/mismatch)
+        mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+        min_score: Score mínimo da triagem (ver screen_score)
+        xdrop: Poda X-drop da triagem (ver screen_score)
+
+    Returns:
+        int: Score do melhor alinhamento no modo pedido, ou None se o par
+        foi descartado pela triagem
+
+    Raises:
+        ValueError: Se gaps afins forem combinados com um modo não global,
+            ou a triagem com gaps afins ou um modo não global
+    """
+    aligner = Aligner(match_val, mismatch_val, gap_val, gap_open, gap_extend,
+                      subst, mode, min_score=min_score, xdrop=xdrop)
+    return aligner.score(seq1, seq2)
+
+
+def select_engine(engine: str, seq1: str, seq2: str,
+                  max_cells: int = DEFAULT_MAX_CELLS) -> str:
+    """
+    Resolve o motor de alinhamento a ser usado.
+
+    Args:
+        engine: Motor pedido ("auto" ou um dos motores de ENGINES)
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        max_cells: Orçamento de células da matriz completa no modo auto
+
+    Returns:
+        str: Motor efetivo (auto resolve para "full" ou "hirschberg")
+    """
+    if engine != "auto":
+        return engine
+    cells = (len(seq1) + 1) * (len(seq2) + 1)
+    return "hirschberg" if cells > max_cells else "full"
+
+
+class Aligner:
+    """
+    Esquema de pontuação e motor reutilizáveis para alinhar muitos pares.
+
+    As funções livres (needleman_wunsch, score_pair...) resolvem o modelo de
+    gap, o atalho bit-paralelo e o motor a cada chamada e alocam uma linha
+    nova por par. O Aligner faz essa resolução uma única vez e mantém uma
+    área de trabalho que cresce sob demanda e é reaproveitada entre as
+    chamadas: a linha rolante dos scores (uma list; array('i') seria mais
+    compacto, mas cada leitura criaria um novo int no laço interno) e o
+    bytearray de ponteiros do motor "pointers". Não é thread-safe: use um
+    Aligner por thread ou processo.
+
+    Attributes:
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap linear
+        affine: (gap_open, gap_extend) ou None para gaps lineares
+        subst: SubstitutionMatrix opcional
+        mode: Modo de alinhamento
+        engine: Motor do alinhamento global (ver ENGINES; com gaps afins,
+            só os de AFFINE_ENGINES)
+    """
+
+    def __init__(self, match_val: int = 1, mismatch_val: int = -1,
+                 gap_val: int = -1, gap_open: int = None,
+                 gap_extend: int = None, subst=None, mode: str = "global",
+                 engine: str = "auto", max_cells: int = DEFAULT_MAX_CELLS,
+                 band: int = DEFAULT_BAND, workers: int = None,
+                 tile: int = DEFAULT_TILE, min_score: int = None,
+                 xdrop: int = None, seed: int = DEFAULT_SEED):
+        """
+        Args:
+            match_val: Valor para match
+            mismatch_val: Valor para mismatch
+            gap_val: Valor para gap linear
+            gap_open: Penalidade de abertura (ativa gaps afins)
+            gap_extend: Penalidade de extensão (ativa gaps afins)
+            subst: SubstitutionMatrix opcional (substitui match/mismatch)
+            mode: Modo de alinhamento ("global", "local" ou "semiglobal")
+            engine: Motor de align() (nos modos local e semi-global, só os
+                de LOCAL_ENGINES)
+            max_cells: Orçamento de células da matriz no motor "auto"
+            band: Meia-largura inicial do motor "banded"
+            workers: Processos do motor "wavefront" (padrão: número de CPUs)
+            tile: Lado dos blocos do motor "wavefront"
+            min_score: Descarta (retorna None) pares abaixo deste score,
+                interrompendo o cálculo assim que ele fica inalcançável
+            xdrop: Poda células mais de X abaixo do máximo da linha
+                anterior (heurística; ver screen_score)
+            seed: Tamanho das sementes do motor "anchored"
+
+        Raises:
+            ValueError: Se o modo ou o motor forem desconhecidos, se um modo
+                não global for combinado com um motor fora de
+                LOCAL_ENGINES, se gaps afins forem combinados com um modo
+                não global ou com um motor fora de AFFINE_ENGINES, ou se a
+                triagem (min_score/xdrop) não for global com gaps lineares
+        """
+        if mode not in MODES:
+            raise ValueError(f"modo desconhecido: {mode}")
+        if engine not in ENGINES:
+            raise ValueError(f"motor desconhecido: {engine}")
+        self.affine = resolve_affine_gaps(gap_val, gap_open, gap_extend)
+        if self.affine is not None and mode != "global":
+            raise ValueError("gaps afins só estão disponíveis no modo "
+                             "global")
+        if self.affine is not None and engine not in AFFINE_ENGINES:
+            raise ValueError(f"o motor {engine} não aceita gaps afins; use "
+                             "auto, full, checkpoint ou anchored")
+        if engine == "anchored" and mode != "global":
+            raise ValueError("o motor anchored só está disponível no modo "
+                             "global")
+        if mode != "global" and engine not in LOCAL_ENGINES:
+            raise ValueError(f"o modo {mode} só é suportado pelos motores "
+                             "full e checkpoint")
+        self.screening = min_score is not None or xdrop is not None
+        if self.screening and (mode != "global" or self.affine is not None):
+            raise ValueError("--min-score e --xdrop só estão disponíveis no "
+                             "modo global com gaps lineares")
+        self.match_val = match_val
+        self.mismatch_val = mismatch_val
+        self.gap_val = gap_val
+        self.subst = subst
+        self.mode = mode
+        self.engine = engine
+        self.max_cells = max_cells
+        self.band = band
+        self.workers = workers
+        self.tile = tile
+        self.min_score = min_score
+        self.xdrop = xdrop
+        self.seed = seed
+        self._bit_parallel = (subst is None and mode == "global"
+                              and self.affine is None
+                              and bit_parallel_kind(match_val, mismatch_val,
+                                                    gap_val) is not None)
+        # Área de trabalho reaproveitada entre as chamadas
+        self._row = []
+        self._pointers = bytearray()
+
+    def score(self, seq1: str, seq2: str) -> int:
+        """
+        Calcula apenas o score do par, em memória O(n).
+
+        Args:
+            seq1: Primeira sequência
+            seq2: Segunda sequência
+
+        Returns:
+            int: Score do melhor alinhamento no modo do Aligner, ou None se
+            o par foi descartado pela triagem (min_score/xdrop)
+        """
+        if self.screening:
+            if self._bit_parallel and self.xdrop is None:
+                # O bit-paralelo já é mais rápido que interromper o DP
+                score = bit_parallel_score(seq1, seq2, self.match_val,
+                                           self.mismatch_val, self.gap_val)
+                return score if score >= self.min_score else None
+            return screen_score(seq1, seq2, self.match_val, self.mismatch_val,
+                                self.gap_val, self.subst, self.min_score,
+                                self.xdrop)
+        if self.affine is not None:
+            return gotoh_score(seq1, seq2, self.match_val, self.mismatch_val,
+                               *self.affine, subst=self.subst)
+        if self._bit_parallel:
+            return bit_parallel_score(seq1, seq2, self.match_val,
+                                      self.mismatch_val, self.gap_val)
+        return _dp_last_row(seq1, seq2, self.match_val, self.mismatch_val,
+                            self.gap_val, self.subst, self.mode, self._row)[1]
+
+    def align(self, seq1: str, seq2: str) -> tuple:
+        """
+        Alinha o par com o motor do Aligner (ver align_region).
+
+        Args:
+            seq1: Primeira sequência
+            seq2: Segunda sequência
+
+        Returns:
+            tuple: (aligned_seq1, aligned_seq2, score), ou None se o par foi
+            descartado pela triagem (min_score/xdrop)
+        """
+        result = self.align_region(seq1, seq2)
+        return None if result is None else result[:3]
+
+    def align_region(self, seq1: str, seq2: str) -> tuple:
+        """
+        Alinha o par e informa a região alinhada de cada sequência.
+
+        Gaps afins usam Gotoh: com as três matrizes completas, ou por
+        checkpoints (checkpoint_gotoh) se o motor checkpoint for pedido ou
+        se, no auto, a matriz passar de max_cells. Os modos local e
+        semi-global usam a matriz completa (ou o motor checkpoint, se
+        pedido); nos demais casos o motor é resolvido por select_engine. O
+        motor anchored alinha por âncoras nos dois modelos de gap, com um
+        Aligner auxiliar de mesma pontuação nos trechos entre âncoras.
+
+        Args:
+            seq1: Primeira sequência
+            seq2: Segunda sequência
+
+        Returns:
+            tuple: (aligned_seq1, aligned_seq2, score, região), com a região
+            (início1, fim1, início2, fim2) 0-based semiaberta, como em
+            traceback_region (no modo global, as sequências inteiras); ou
+            None se o par foi descartado pela triagem (min_score/xdrop)
+        """
+        if self.screening and self.score(seq1, seq2) is None:
+            return None
+        match_val, mismatch_val = self.match_val, self.mismatch_val
+        gap_val, subst = self.gap_val, self.subst
+        whole = (0, len(seq1), 0, len(seq2))
+        if self.engine == "anchored":
+            segments = Aligner(match_val, mismatch_val, gap_val,
+                               *(self.affine or (None, None)), subst,
+                               max_cells=self.max_cells)
+            return anchored_alignment(seq1, seq2, match_val, mismatch_val,
+                                      gap_val, subst, self.seed,
+                                      segments) + (whole,)
+        if self.affine is not None:
+            too_big = (len(seq1) + 1) * (len(seq2) + 1) > self.max_cells
+            if self.engine == "checkpoint" or (self.engine == "auto"
+                                               and too_big):
+                return checkpoint_gotoh(seq1, seq2, match_val, mismatch_val,
+                                        *self.affine, subst=subst) + (whole,)
+            return gotoh(seq1, seq2, match_val, mismatch_val, *self.affine,
+                         subst=subst) + (whole,)
+
+        engine = "full"
+        if self.engine == "checkpoint":
+            engine = "checkpoint"
+        elif self.mode == "global":
+            engine = select_engine(self.engine, seq1, seq2, self.max_cells)
+        if engine == "checkpoint":
+            return checkpoint_alignment(seq1, seq2, match_val, mismatch_val,
+                                        gap_val, subst, self.mode)
+        if engine == "hirschberg":
+            align1, align2 = hirschberg(seq1, seq2, match_val, mismatch_val,
+                                        gap_val, subst)
+            return align1, align2, alignment_score(
+                align1, align2, match_val, mismatch_val, gap_val,
+                subst), whole
+        if engine == "banded":
+            return banded_needleman_wunsch(seq1, seq2, match_val, mismatch_val,
+                                           gap_val, self.band,
+                                           subst) + (whole,)
+        if engine == "wavefront":
+            align1, align2 = wavefront_hirschberg(
+                seq1, seq2, match_val, mismatch_val, gap_val, subst,
+                self.workers, self.tile)
+            return align1, align2, alignment_score(
+                align1, align2, match_val, mismatch_val, gap_val,
+                subst), whole
+        if engine == "pointers":
+            pointers, stride, score = _fill_pointers(
+                seq1, seq2, match_val, mismatch_val, gap_val, subst,
+                self._pointers)
+            align1, align2 = _pointer_traceback(pointers, stride, seq1, seq2)
+            return align1, align2, score, whole
+
+        score_matrix = create_score_matrix(seq1, seq2, gap_val, self.mode)
+        fill_score_matrix(score_matrix, seq1, seq2, match_val, mismatch_val,
+                          gap_val, subst, self.mode)
+        align1, align2, region = traceback_region(
+            score_matrix, seq1, seq2, match_val, mismatch_val, gap_val, subst,
+            self.mode)
+        return align1, align2, score_matrix[region[1]][region[3]], region
+
+    def align_many(self, pairs, alignments: bool = False):
+        """
+        Processa muitos pares reaproveitando a mesma área de trabalho.
+
+        Args:
+            pairs: Iterável de tuplas (seq1, seq2)
+            alignments: Se True, reconstrói os alinhamentos (align); caso
+                contrário calcula apenas os scores (score)
+
+        Yields:
+            int ou tuple: Score, ou (aligned_seq1, aligned_seq2, score); None
+            para os pares descartados pela triagem (min_score/xdrop)
+        """
+        solve = self.align if alignments else self.score
+        for seq1, seq2 in pairs:
+            yield solve(seq1, seq2)
+
+
+def format_alignment(align1: str, align2: str) -> str:
+    """
+    Formata o alinhamento para exibição visual.
+
+    Args:
+        align1: Primeira sequência alinhada (com gaps)
+        align2: Segunda sequência alinhada (com gaps)
+
+    Returns:
+        str: String formatada com barras verticais para matches
+    """
+    matches = []
+    for c1, c2 in zip(align1, align2):
+        if c1 == c2 and c1 != "-":
+            matches.append("|")
+        else:
+            matches.append(" ")
+
+    line1 = " ".join(align1)
+    line2 = " ".join(matches)
+    line3 = " ".join(align2)
+
+    return f"{line1}\n{line2}\n{line3}"
+
+
+def alignment_cigar(align1: str, align2: str, clip_start: int = 0,
+                    clip_end: int = 0) -> str:
+    """
+    Codifica o alinhamento em CIGAR estendido (=, X, I, D e S).
+
+    seq1 faz o papel da referência: um gap em seq1 é uma inserção (I) e
+    um gap em seq2 uma deleção (D). As colunas são agrupadas em corridas
+    à medida que são lidas, sem montar strings intermediárias. Nos modos
+    local e semi-global, as bases de seq2 (a consulta) fora do alinhamento
+    entram como soft clips (S) nas pontas, de modo que o CIGAR cobre a
+    consulta inteira, como exige o SAM.
+
+    Args:
+        align1: Primeira sequência alinhada (com gaps)
+        align2: Segunda sequência alinhada (com gaps)
+        clip_start: Bases de seq2 antes do alinhamento
+        clip_end: Bases de seq2 depois do alinhamento
+
+    Returns:
+        str: CIGAR (vazio para um alinhamento vazio sem clips)
+    """
+    ops = ("I" if c1 == "-" else "D" if c2 == "-" else "=" if c1 == c2 else "X"
+           for c1, c2 in zip(align1, align2))
+    cigar = "".join(f"{sum(1 for _ in run)}{op}"
+                    for op, run in itertools.groupby(ops))
+    head = f"{clip_start}S" if clip_start else ""
+    tail = f"{clip_end}S" if clip_end else ""
+    return head + cigar + tail
+
+
+class RecordWriter:
+    """
+    Escreve registros de alinhamento incrementalmente.
+
+    Cada registro é um dicionário com os campos de `fields`; cada linha é
+    escrita e descarregada assim que o registro chega, de modo que a saída
+    pode ser consumida por outro programa durante um batch longo. Campos
+    ausentes aparecem como "*" (tsv e cigar) ou null (jsonl).
+    """
+
+    def __init__(self, stream, fmt: str = "tsv", fields: tuple = RECORD_FIELDS):
+        """
+        Args:
+            stream: Arquivo de texto de destino
+            fmt: "tsv", "jsonl" ou "cigar"
+            fields: Campos de cada registro (tsv e jsonl)
+        """
+        self.stream = stream
+        self.format = fmt
+        self.fields = fields
+        if fmt == "tsv":
+            self._emit("\t".join(fields))
+
+    def write(self, record: dict):
+        """
+        Escreve um registro.
+
+        Args:
+            record: Dicionário com os campos do registro
+        """
+        if self.format == "jsonl":
+            line = json.dumps({field: record.get(field)
+                               for field in self.fields})
+        elif self.format == "cigar":
+            # Colunas no estilo SAM: consulta (seq2), referência (seq1),
+            # posição 1-based na referência, CIGAR e score
+            start = record.get("start1")
+            columns = [
+                record["seq2"], record["seq1"],
+                "*" if start is None else str(start + 1),
+                record.get("cigar") or "*",
+            ]
+            # Par descartado pela triagem (--min-score): sem score
+            if record.get("score") is not None:
+                columns.append(f"AS:i:{record['score']}")
+            line = "\t".join(columns)
+        else:
+            line = "\t".join("*" if record.get(field) is None
+                             else str(record[field]) for field in self.fields)
+        self._emit(line)
+
+    def _emit(self, line: str):
+        self.stream.write(line + "\n")
+        self.stream.flush()
+
+
+@contextlib.contextmanager
+def write_guard():
+    """
+    Trata os erros de escrita da saída estruturada.
+
+    Se o leitor fecha o pipe antes do fim (ex.: `| head`), a saída padrão
+    passa a apontar para /dev/null, para que a descarga final do
+    interpretador não falhe de novo, e o programa termina sem traceback.
+    Os demais erros de escrita terminam com uma mensagem própria, separada
+    dos erros de leitura das entradas.
+    """
+    try:
+        yield
+    except BrokenPipeError:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        sys.exit(1)
+    except OSError as e:
+        print(f"Erro ao gravar a saída: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+@contextlib.contextmanager
+def open_output(path: str = None):
+    """
+    Abre o destino da saída estruturada.
+
+    Args:
+        path: Caminho do arquivo, ou None para a saída padrão (que não é
+            fechada)
+
+    Yields:
+        Arquivo de texto aberto para escrita
+    """
+    if path is None:
+        yield sys.stdout
+        return
+    with write_guard():
+        stream = open(path, "w")
+    with stream:
+        yield stream
+
+
+def matrix_window(score_matrix, window: tuple = None) -> tuple:
+    """
+    Resolve uma janela da matriz como fatias do Python.
+
+    Args:
+        score_matrix: Matriz de pontuação (lista de listas ou ndarray)
+        window: Tupla (i0, i1, j0, j1) de parse_matrix_window, ou None
+
+    Returns:
+        tuple: (range de linhas, range de colunas)
+    """
+    i0, i1, j0, j1 = window or (None, None, None, None)
+    rows = range(len(score_matrix))[i0:i1]
+    cols = range(len(score_matrix[0]) if len(score_matrix) else 0)[j0:j1]
+    return rows, cols
+
+
+def print_matrix(score_matrix: list, seq1: str, seq2: str,
+                 window: tuple = None):
+    """
+    Imprime a matriz de pontuação formatada (para debug).
+
+    O texto é montado e escrito de uma vez, e a matriz (ou a janela) só é
+    exibida até MAX_PRINT_CELLS células: acima disso uma única linha
+    orienta o uso de --matrix-window ou --dump-matrix.
+
+    Args:
+        score_matrix: Matriz de pontuação preenchida
+        seq1: Primeira sequência (rótulos das linhas)
+        seq2: Segunda sequência (rótulos das colunas)
+        window: Tupla (i0, i1, j0, j1) opcional
+    """
+    rows, cols = matrix_window(score_matrix, window)
+    cells = len(rows) * len(cols)
+    if cells > MAX_PRINT_CELLS:
+        print(f"\nMatriz de pontuação com {cells} células (limite "
+              f"{MAX_PRINT_CELLS}); use --matrix-window ou --dump-matrix.")
+        return
+
+    labels1 = " " + seq1
+    labels2 = " " + seq2
+    lines = ["", "Matriz de Pontuação:",
+             "     " + "  ".join(f" {labels2[j]} " for j in cols)]
+    for i in rows:
+        row = score_matrix[i]
+        lines.append(f"{labels1[i]} "
+                     + " ".join(f"{row[j]:3d}" for j in cols))
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def write_matrix_npy(score_matrix, path: str, window: tuple = None) -> tuple:
+    """
+    Grava a matriz (ou uma janela) em formato .npy int32 little-endian.
+
+    O cabeçalho segue a versão 1.0 do formato .npy, sem depender do NumPy.
+    As linhas são convertidas com array('i') (ou ndarray.astype) e
+    acumuladas em blocos de MATRIX_DUMP_CHUNK bytes antes de cada escrita.
+
+    Args:
+        score_matrix: Matriz de pontuação (lista de listas ou ndarray)
+        path: Arquivo de destino
+        window: Tupla (i0, i1, j0, j1) opcional
+
+    Returns:
+        tuple: Forma (linhas, colunas) gravada
+    """
+    rows, cols = matrix_window(score_matrix, window)
+    shape = (len(rows), len(cols))
+    header = ("{'descr': '<i4', 'fortran_order': False, "
+              f"'shape': ({shape[0]}, {shape[1]}), }}")
+    # Magic + versão + tamanho (10 bytes) + cabeçalho alinhado a 64 bytes
+    header += " " * (-(10 + len(header) + 1) % 64) + "\n"
+    col_slice = slice(cols.start, cols.stop) if cols else slice(0, 0)
+
+    with open(path, "wb") as f:
+        f.write(b"\x93NUMPY\x01\x00")
+        f.write(len(header).to_bytes(2, "little"))
+        f.write(header.encode("latin-1"))
+
+        chunk = bytearray()
+        for i in rows:
+            row = score_matrix[i][col_slice]
+            if np is not None and isinstance(row, np.ndarray):
+                chunk += row.astype("<i4").tobytes()
+            else:
+                values = array("i", row)
+                if sys.byteorder == "big":
+                    values.byteswap()
+                chunk += values.tobytes()
+            if len(chunk) >= MATRIX_DUMP_CHUNK:
+                f.write(chunk)
+                chunk.clear()
+        f.write(chunk)
+
+    return shape
+
+
+def iter_fasta(file_path: str):
+    """
+    Lê um arquivo FASTA registro a registro.
+
+    O arquivo é lido em blocos grandes (FASTA_BUFFER_SIZE) e apenas o
+    registro corrente fica em memória, o que permite começar a alinhar
+    antes de terminar de ler arquivos de vários GB. Arquivos comprimidos
+    com gzip são detectados pela assinatura e descompactados de forma
+    transparente. Registros sem sequência são ignorados.
+
+    Args:
+        file_path: Caminho para o arquivo .fasta (ou .fasta.gz)
+
+    Yields:
+        tuple: (cabeçalho sem o ">", sequência)
+
+    Raises:
+        FileNotFoundError: Se o arquivo não existir
+    """
+    with open(file_path, "rb", buffering=FASTA_BUFFER_SIZE) as raw:
+        stream = raw
+        if raw.peek(2)[:2] == GZIP_MAGIC:
+            stream = gzip.GzipFile(fileobj=raw)
+        text = io.TextIOWrapper(stream, encoding="utf-8", errors="replace")
+
+        header = ""
+        current_seq = []
+        for line in text:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(">"):
+                if current_seq:
+                    yield header, "".join(current_seq)
+                    current_seq = []
+                header = line[1:].strip()
+            else:
+                current_seq.append(line)
+
+        if current_seq:
+            yield header, "".join(current_seq)
+
+
+def fasta_record_name(header: str) -> str:
+    """
+    Extrai o nome do registro (primeira palavra do cabeçalho FASTA).
+
+    Args:
+        header: Cabeçalho sem o ">"
+
+    Returns:
+        str: Nome do registro (vazio se o cabeçalho for vazio)
+    """
+    parts = header.split(None, 1)
+    return parts[0] if parts else ""
+
+
+def read_fasta(file_path: str) -> list:
+    """
+    Lê sequências de um arquivo no formato FASTA.
+
+    Args:
+        file_path: Caminho para o arquivo .fasta
+
+    Returns:
+        list: Lista de sequências encontradas no arquivo
+    """
+    return [seq for _, seq in iter_fasta(file_path)]
+
+
+def build_fasta_index(file_path: str, index_path: str = None) -> list:
+    """
+    Constrói o índice (estilo samtools .fai) de um arquivo FASTA.
+
+    Cada entrada registra o nome do registro, o número de bases, o offset
+    em bytes da primeira base, o número de bases por linha e o número de
+    bytes por linha (incluindo o fim de linha). Com esses dados a posição
+    de qualquer base é calculada em O(1). O índice é salvo em
+    `index_path` (padrão: arquivo + ".fai") quando possível.
+
+    Args:
+        file_path: Caminho para o arquivo .fasta (não comprimido)
+        index_path: Caminho do arquivo de índice a ser escrito
+
+    Returns:
+        list: Tuplas (nome, tamanho, offset, bases_por_linha, bytes_por_linha)
+
+    Raises:
+        ValueError: Se o arquivo estiver comprimido, tiver linhas de
+            tamanho irregular ou nomes de registro duplicados
+    """
+    entries = []
+    names = set()
+    current = None
+    offset = 0
+
+    with open(file_path, "rb", buffering=FASTA_BUFFER_SIZE) as f:
+        if f.peek(2)[:2] == GZIP_MAGIC:
+            raise ValueError("Arquivos gzip não podem ser indexados; "
+                             "descompacte o arquivo primeiro")
+        for line in f:
+            if line.startswith(b">"):
+                if current is not None:
+                    entries.append(tuple(current[:5]))
+                name = fasta_record_name(line[1:].decode("utf-8", "replace"))
+                if name in names:
+                    raise ValueError(f"Registro duplicado no FASTA: {name}")
+                names.add(name)
+                # [nome, tamanho, offset, bases/linha, bytes/linha,
+                #  última linha curta]
+                current = [name, 0, offset + len(line), 0, 0, False]
+            else:
+                bases = len(line.rstrip(b"\r\n"))
+                if current is None:
+                    if bases:
+                        raise ValueError("Sequência encontrada antes do "
+                                         "primeiro cabeçalho")
+                elif bases:
+                    if current[5]:
+                        raise ValueError("Linhas de tamanho irregular no "
+                                         f"registro {current[0]}")
+                    if current[3] == 0:
+                        current[3], current[4] = bases, len(line)
+                    elif bases > current[3]:
+                        raise ValueError("Linhas de tamanho irregular no "
+                                         f"registro {current[0]}")
+                    current[5] = bases < current[3]
+                    current[1] += bases
+                elif current[1]:
+                    # Linha em branco encerra a sequência do registro
+                    current[5] = True
+            offset += len(line)
+        if current is not None:
+            entries.append(tuple(current[:5]))
+
+    if index_path is None:
+        index_path = file_path + ".fai"
+    try:
+        with open(index_path, "w") as f:
+            for entry in entries:
+                f.write("\t".join(str(value) for value in entry) + "\n")
+    except OSError:
+        pass  # Índice continua disponível em memória
+
+    return entries
+
+
+def load_fasta_index(file_path: str) -> list:
+    """
+    Carrega o índice .fai de um FASTA, reconstruindo-o se estiver ausente
+    ou desatualizado.
+
+    Args:
+        file_path: Caminho para o arquivo .fasta
+
+    Returns:
+        list: Tuplas (nome, tamanho, offset, bases_por_linha, bytes_por_linha)
+    """
+    index_path = file_path + ".fai"
+    try:
+        if os.path.getmtime(index_path) >= os.path.getmtime(file_path):
+            entries = []
+            with open(index_path) as f:
+                for line in f:
+                    fields = line.rstrip("\n").split("\t")
+                    entries.append((fields[0],)
+                                   + tuple(int(v) for v in fields[1:5]))
+            return entries
+    except (OSError, ValueError, IndexError):
+        pass
+    return build_fasta_index(file_path, index_path)
+
+
+class IndexedFasta:
+    """
+    Acesso aleatório a registros de um FASTA via índice .fai e mmap.
+
+    O arquivo é mapeado em memória somente para leitura; buscar um
+    registro (ou um trecho dele) lê apenas os bytes correspondentes, sem
+    percorrer o restante do arquivo. Como o mapeamento é do sistema
+    operacional, processos diferentes que abrem o mesmo arquivo
+    compartilham as mesmas páginas em cache.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Abre e mapeia o arquivo FASTA.
+
+        Args:
+            file_path: Caminho para o arquivo .fasta (não comprimido)
+        """
+        self.file_path = file_path
+        self.index = {entry[0]: entry for entry in load_fasta_index(file_path)}
+        self._file = open(file_path, "rb")
+        self._mm = None
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._mm = mmap.mmap(self._file.fileno(), 0,
+                                 access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Libera o mapeamento e o arquivo."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def names(self) -> list:
+        """Retorna os nomes dos registros na ordem do arquivo."""
+        return list(self.index)
+
+    def fetch(self, name: str, start: int = None, end: int = None) -> str:
+        """
+        Extrai um registro ou um trecho dele.
+
+        Args:
+            name: Nome do registro (primeira palavra do cabeçalho)
+            start: Primeira base (1-based, inclusiva; padrão: 1)
+            end: Última base (1-based, inclusiva; padrão: fim do registro)
+
+        Returns:
+            str: Sequência do trecho pedido
+
+        Raises:
+            KeyError: Se o registro não existir
+            ValueError: Se o intervalo for inválido
+        """
+        if name not in self.index:
+            raise KeyError(f"Registro não encontrado: {name}")
+        _, length, offset, line_bases, line_width = self.index[name]
+
+        start = 1 if start is None else start
+        end = length if end is None else min(end, length)
+        if start < 1 or end < start - 1:
+            raise ValueError(f"Intervalo inválido: {start}-{end}")
+        if end < start:
+            return ""
+
+        def byte_offset(pos):
+            return offset + (pos // line_bases) * line_width + pos % line_bases
+
+        data = self._mm[byte_offset(start - 1):byte_offset(end - 1) + 1]
+        return data.replace(b"\n", b"").replace(b"\r", b"").decode("latin-1")
+
+
+def _pack_tables() -> tuple:
+    """
+    Monta as tabelas de tradução usadas por PackedSequence.
+
+    Returns:
+        tuple: (tabela caractere -> código de 2 bits, tabelas byte
+        empacotado -> base ASCII para cada uma das 4 posições do byte)
+    """
+    pack = bytearray(256)
+    for code, base in enumerate(PACKED_BASES):
+        pack[base] = code
+    unpack = tuple(
+        bytes(PACKED_BASES[(byte >> (2 * k)) & 3] for byte in range(256))
+        for k in range(4)
+    )
+    return bytes(pack), unpack
+
+
+_PACK_TABLE, _UNPACK_TABLES = _pack_tables()
+
+
+def pack_2bit(codes: bytes) -> bytes:
+    """
+    Empacota códigos de 0 a 3 (um por byte) em 4 códigos por byte.
+
+    O código k fica nos bits 2*(k % 4) do byte k // 4. Cada um dos 4
+    fluxos codes[r::4] é lido como um inteiro grande e deslocado 2*r bits;
+    como os valores não passam de 3, os deslocamentos nunca invadem o
+    byte vizinho e o OR dos fluxos empacota tudo sem laço por código.
+
+    Args:
+        codes: Um código (0 a 3) por byte
+
+    Returns:
+        bytes: ceil(len(codes) / 4) bytes empacotados
+    """
+    codes = bytes(codes) + bytes(-len(codes) % 4)
+    packed = 0
+    for k in range(4):
+        packed |= int.from_bytes(codes[k::4], "little") << (2 * k)
+    return packed.to_bytes(len(codes) // 4, "little")
+
+
+def _packed_from_parts(data: bytes, start: int, length: int,
+                       exceptions: list, lower: list = ()):
+    """Reconstrói uma PackedSequence serializada (usada pelo pickle)."""
+    return PackedSequence._from_parts(memoryview(bytearray(data)), start,
+                                      length, exceptions, list(lower))
+
+
+class PackedSequence:
+    """
+    Sequência de nucleotídeos compactada em 2 bits por base.
+
+    A, C, G e T ficam empacotados 4 por byte em um bytearray (um quarto da
+    memória de uma str). Qualquer outro caractere (N, códigos IUPAC) vai
+    para uma lista esparsa de trechos (início, fim, caracteres), em que um
+    trecho homogêneo, como uma corrida de N, guarda um único caractere.
+    Minúsculas (regiões soft-masked) são empacotadas como maiúsculas e a
+    caixa é guardada à parte, como trechos (início, fim): o alinhamento
+    diferencia maiúsculas de minúsculas (com match/mismatch, "a" e "A" são
+    um mismatch), então a sequência original é sempre reconstruída
+    exatamente. Fatias compartilham o buffer via memoryview, sem cópia, e
+    o pickle envia apenas os bytes empacotados.
+    """
+
+    __slots__ = ("_buffer", "_start", "_length", "_exceptions", "_lower")
+
+    def __init__(self, seq: str = ""):
+        """
+        Args:
+            seq: Sequência a compactar
+        """
+        raw = seq.encode("latin-1", "replace")
+        # bytes.upper só altera ASCII, então as posições não mudam
+        folded = raw.upper()
+        data = bytearray(pack_2bit(folded.translate(_PACK_TABLE)))
+
+        exceptions = []
+        for found in PACKED_EXCEPTION_RE.finditer(folded.decode("latin-1")):
+            chars = found.group()
+            if chars.count(chars[0]) == len(chars):
+                chars = chars[0]
+            exceptions.append((found.start(), found.end(), chars))
+
+        self._buffer = memoryview(data)
+        self._start = 0
+        self._length = len(seq)
+        self._exceptions = exceptions
+        self._lower = [found.span() for found in
+                       PACKED_LOWER_RE.finditer(raw.decode("latin-1"))]
+
+    @classmethod
+    def _from_parts(cls, buffer: memoryview, start: int, length: int,
+                    exceptions: list, lower: list = None):
+        """Cria uma instância sobre um buffer já empacotado."""
+        packed = cls.__new__(cls)
+        packed._buffer = buffer
+        packed._start = start
+        packed._length = length
+        packed._exceptions = exceptions
+        packed._lower = lower or []
+        return packed
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados pelas bases empacotadas e pelas exceções."""
+        return self._buffer.nbytes + sum(len(chars) for _, _, chars
+                                         in self._exceptions)
+
+    def encode(self, encoding: str = "latin-1",
+               errors: str = "strict") -> bytes:
+        """
+        Converte para um código uint8 (ASCII) por base.
+
+        Tem a mesma assinatura de str.encode, de modo que os motores que
+        codificam sequências (backend NumPy, matrizes de substituição)
+        aceitam uma PackedSequence diretamente.
+
+        Args:
+            encoding: Ignorado; as bases já são ASCII/latin-1
+            errors: Ignorado
+
+        Returns:
+            bytes: Um byte por base
+        """
+        data = bytes(self._buffer)
+        out = bytearray(len(data) * 4)
+        for k in range(4):
+            out[k::4] = data.translate(_UNPACK_TABLES[k])
+        out = out[self._start:self._start + self._length]
+        for start, end, chars in self._exceptions:
+            if len(chars) == 1:
+                chars = chars * (end - start)
+            out[start:end] = chars.encode("latin-1", "replace")
+        for start, end in self._lower:
+            out[start:end] = out[start:end].lower()
+        return bytes(out)
+
+    def __str__(self) -> str:
+        return self.encode().decode("latin-1")
+
+    def __repr__(self) -> str:
+        return f"PackedSequence({str(self)!r})"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (PackedSequence, str)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __getitem__(self, key):
+        """
+        Retorna uma base (str) ou uma fatia.
+
+        Fatias contíguas são PackedSequence que compartilham o buffer
+        original (sem cópia); fatias com passo são recompactadas.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return PackedSequence(str(self)[key])
+            stop = max(start, stop)
+            first = self._start + start
+            buffer = self._buffer[first // 4:(self._start + stop + 3) // 4]
+            exceptions = []
+            for run_start, run_end, chars in self._exceptions:
+                if run_start < stop and run_end > start:
+                    lo, hi = max(run_start, start), min(run_end, stop)
+                    if len(chars) > 1:
+                        chars = chars[lo - run_start:hi - run_start]
+                    exceptions.append((lo - start, hi - start, chars))
+            lower = [(max(run_start, start) - start, min(run_end, stop) - start)
+                     for run_start, run_end in self._lower
+                     if run_start < stop and run_end > start]
+            return PackedSequence._from_parts(buffer, first % 4, stop - start,
+                                              exceptions, lower)
+
+        index = key + self._length if key < 0 else key
+        if not 0 <= index < self._length:
+            raise IndexError("índice fora da sequência")
+        found = bisect.bisect_right(self._lower, (index, float("inf")))
+        lower = found and index < self._lower[found - 1][1]
+        found = bisect.bisect_right(self._exceptions, (index, float("inf")))
+        run_start, run_end, chars = (self._exceptions[found - 1] if found
+                                     else (0, 0, ""))
+        if index < run_end:
+            base = chars if len(chars) == 1 else chars[index - run_start]
+        else:
+            position = self._start + index
+            code = (self._buffer[position // 4] >> (2 * (position % 4))) & 3
+            base = chr(PACKED_BASES[code])
+        return base.lower() if lower else base
+
+    def __reduce__(self):
+        return (_packed_from_parts, (bytes(self._buffer), self._start,
+                                     self._length, self._exceptions,
+                                     self._lower))
+
+
+def parse_sequence_spec(spec: str) -> tuple:
+    """
+    Interpreta "arquivo.fasta[:registro[:início-fim]]".
+
+    Se `spec` for um arquivo existente, ele é usado inteiro. Caso
+    contrário, os sufixos ":registro" e ":início-fim" são separados a
+    partir da direita.
+
+    Args:
+        spec: Caminho, opcionalmente seguido de registro e intervalo
+
+    Returns:
+        tuple: (caminho, registro ou None, início ou None, fim ou None)
+    """
+    if os.path.exists(spec) or ":" not in spec:
+        return spec, None, None, None
+
+    parts = spec.rsplit(":", 2)
+    if len(parts) == 3:
+        region = REGION_RE.match(parts[2])
+        if region and os.path.exists(parts[0]):
+            return (parts[0], parts[1], int(region.group(1)),
+                    int(region.group(2)))
+
+    path, name = spec.rsplit(":", 1)
+    return path, name, None, None
+
+
+def load_records(spec: str):
+    """
+    Lê os registros indicados por uma especificação de sequência.
+
+    Sem registro, percorre o arquivo inteiro em streaming (iter_fasta).
+    Com registro (e intervalo opcional), usa o índice .fai e mmap para
+    extrair apenas o trecho pedido.
+
+    Args:
+        spec: "arquivo.fasta[:registro[:início-fim]]"
+
+    Yields:
+        tuple: (cabeçalho, sequência)
+    """
+    path, name, start, end = parse_sequence_spec(spec)
+    if name is None:
+        yield from iter_fasta(path)
+        return
+
+    with IndexedFasta(path) as fasta:
+        header = name if start is None else f"{name}:{start}-{end}"
+        yield header, fasta.fetch(name, start, end)
+
+
+def sequence_digest(seq) -> str:
+    """
+    Calcula o hash (BLAKE2b, 128 bits) de uma sequência.
+
+    Args:
+        seq: Sequência (str ou PackedSequence)
+
+    Returns:
+        str: Hash em hexadecimal
+    """
+    return hashlib.blake2b(seq.encode("latin-1", "replace"),
+                           digest_size=16).hexdigest()
+
+
+def cache_key(seq1, seq2, match_val: int = 1, mismatch_val: int = -1,
+              gap_val: int = -1, gap_open: int = None, gap_extend: int = None,
+              subst=None, mode: str = "global", engine: str = "auto",
+              band: int = DEFAULT_BAND) -> str:
+    """
+    Monta a chave de cache de um par com a mesma assinatura de score_pair.
+
+    A chave combina os hashes das sequências, todos os parâmetros de
+    pontuação (a matriz de substituição entra pelo hash do alfabeto e da
+    tabela, não pelo nome), o motor pedido, a faixa inicial do motor
+    banded e CACHE_VERSION. Motores diferentes podem produzir alinhamentos
+    diferentes para o mesmo par, então um resultado nunca é reaproveitado
+    por outro motor.
+
+    Args:
+        engine: Motor pedido (ver ENGINES)
+        band: Meia-largura inicial do motor banded
+
+    Returns:
+        str: Chave da entrada
+    """
+    matrix = "-"
+    if subst is not None:
+        matrix = hashlib.blake2b(subst.alphabet.encode("latin-1")
+                                 + subst.table.tobytes(),
+                                 digest_size=8).hexdigest()
+    return "|".join(str(part) for part in (
+        CACHE_VERSION, sequence_digest(seq1), sequence_digest(seq2),
+        match_val, mismatch_val, gap_val, gap_open, gap_extend, matrix, mode,
+        engine, band,
+    ))
+
+
+class AlignmentCache:
+    """
+    Cache persistente de resultados de alinhamento em sqlite3.
+
+    Cada entrada guarda o score e, opcionalmente, um dicionário de dados
+    extras (alinhamento, região) serializado em JSON e comprimido com
+    zlib. Uma camada LRU em memória (OrderedDict) atende pares repetidos no
+    mesmo processo sem ir ao disco. Cada leitura atualiza o instante de
+    uso da entrada, e a cada CACHE_FLUSH_INTERVAL escritas (e ao fechar)
+    as entradas menos usadas recentemente além de `max_entries` são
+    removidas. Se o banco falhar durante o uso, o cache segue apenas em
+    memória.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = DEFAULT_CACHE_ENTRIES,
+                 memory_entries: int = CACHE_MEMORY_ENTRIES):
+        """
+        Abre (ou cria) o banco do cache.
+
+        Args:
+            cache_dir: Diretório do arquivo CACHE_FILE_NAME
+            max_entries: Número máximo de entradas no disco
+            memory_entries: Número máximo de entradas na camada em memória
 
-    sequences = []
-    current_seq = []
+        Raises:
+            OSError: Se o diretório não puder ser criado
+            sqlite3.Error: Se o banco não puder ser aberto
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, CACHE_FILE_NAME)
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()
+        self._writes = 0
+        self._db = sqlite3.connect(self.path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS alignments ("
+            "key TEXT PRIMARY KEY, score INTEGER NOT NULL, extra BLOB, "
+            "used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS alignments_used "
+                         "ON alignments (used)")
+        self._db.commit()
 
-    with open(file_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
+    def get(self, key: str):
+        """
+        Busca uma entrada, primeiro em memória e depois no disco.
+
+        Args:
+            key: Chave gerada por cache_key
+
+        Returns:
+            tuple: (score, extra ou None), ou None se não houver entrada
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            return entry
+        if self._db is None:
+            return None
+
+        try:
+            row = self._db.execute(
+                "SELECT score, extra FROM alignments WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute("UPDATE alignments SET used = ? WHERE key = ?",
+                             (time.time(), key))
+            self._written()
+        except sqlite3.Error as e:
+            self._disable(e)
+            return None
+
+        extra = None if row[1] is None else json.loads(zlib.decompress(row[1]))
+        entry = (row[0], extra)
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, score: int, extra: dict = None):
+        """
+        Grava uma entrada; extra=None preserva os extras já guardados.
+
+        Args:
+            key: Chave gerada por cache_key
+            score: Score do alinhamento
+            extra: Dados adicionais serializáveis em JSON (opcional)
+        """
+        if extra is None:
+            previous = self._memory.get(key)
+            extra = None if previous is None else previous[1]
+        self._remember(key, (score, extra))
+        if self._db is None:
+            return
+
+        blob = None
+        if extra is not None:
+            blob = zlib.compress(json.dumps(extra).encode())
+        try:
+            self._db.execute(
+                "INSERT INTO alignments (key, score, extra, used) "
+                "VALUES (?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "score = excluded.score, "
+                "extra = COALESCE(excluded.extra, alignments.extra), "
+                "used = excluded.used",
+                (key, score, blob, time.time()),
+            )
+            self._written()
+        except sqlite3.Error as e:
+            self._disable(e)
+
+    def flush(self):
+        """Remove as entradas excedentes e grava as alterações pendentes."""
+        if self._db is None:
+            return
+        try:
+            (count,) = self._db.execute(
+                "SELECT COUNT(*) FROM alignments").fetchone()
+            if count > self.max_entries:
+                self._db.execute(
+                    "DELETE FROM alignments WHERE key IN (SELECT key FROM "
+                    "alignments ORDER BY used LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            self._db.commit()
+        except sqlite3.Error as e:
+            self._disable(e)
+        self._writes = 0
+
+    def close(self):
+        """Grava as alterações pendentes e fecha o banco."""
+        self.flush()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _remember(self, key: str, entry: tuple):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _written(self):
+        self._writes += 1
+        if self._writes >= CACHE_FLUSH_INTERVAL:
+            self.flush()
+
+    def _disable(self, error: Exception):
+        print(f"Aviso: cache em disco desativado ({error})", file=sys.stderr)
+        try:
+            self._db.close()
+        except sqlite3.Error:
+            pass
+        self._db = None
+
+
+def open_cache(cache_dir: str):
+    """
+    Abre o cache de resultados sem interromper o programa em caso de falha.
+
+    Args:
+        cache_dir: Diretório do cache
+
+    Returns:
+        AlignmentCache: Cache aberto, ou None se não puder ser aberto (um
+        aviso é emitido em stderr e o programa segue sem cache)
+    """
+    try:
+        return AlignmentCache(cache_dir)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Aviso: cache desativado ({e})", file=sys.stderr)
+        return None
+
+
+def minhash_sketch(seq, k: int = DEFAULT_KMER,
+                   size: int = DEFAULT_SKETCH_SIZE) -> array:
+    """
+    Calcula o esboço MinHash (bottom-s) dos k-mers de uma sequência.
+
+    Cada k-mer distinto é reduzido a um hash de 32 bits (CRC-32) e apenas
+    os `size` menores são guardados, em ordem crescente. Dois esboços
+    estimam a similaridade de Jaccard dos conjuntos de k-mers sem
+    compará-los por inteiro (ver jaccard_estimate).
+
+    Args:
+        seq: Sequência (str ou PackedSequence)
+        k: Tamanho do k-mer
+        size: Número máximo de hashes guardados
+
+    Returns:
+        array: Hashes ('I') em ordem crescente; vazio se a sequência for
+        menor que k
+    """
+    data = str(seq).encode("latin-1", "replace")
+    kmers = {data[i:i + k] for i in range(len(data) - k + 1)}
+    return array("I", heapq.nsmallest(size, map(zlib.crc32, kmers)))
+
+
+def jaccard_estimate(sketch1, sketch2, size: int = DEFAULT_SKETCH_SIZE):
+    """
+    Estima a similaridade de Jaccard entre dois esboços MinHash.
+
+    Os `size` menores hashes da união formam uma amostra uniforme dos
+    k-mers das duas sequências; a estimativa é a fração dessa amostra
+    presente nos dois esboços.
+
+    Args:
+        sketch1: Esboço da primeira sequência (minhash_sketch)
+        sketch2: Esboço da segunda sequência
+        size: Tamanho dos esboços
+
+    Returns:
+        float: Estimativa entre 0 e 1, ou None se algum esboço for vazio
+        (sequência menor que k)
+    """
+    if not sketch1 or not sketch2:
+        return None
+    union = heapq.nsmallest(size, set(sketch1).union(sketch2))
+    limit = union[-1]
+    shared = sum(1 for h in set(sketch1).intersection(sketch2) if h <= limit)
+    return shared / len(union)
+
+
+class KmerIndex:
+    """
+    Esboços MinHash de muitas sequências, guardados em arrays compactos.
+
+    Os hashes de todos os esboços ficam concatenados em um único
+    array('I'), com os limites de cada um em um array('Q'); cada esboço é
+    localizado pelo hash (BLAKE2b) da sequência, de modo que um índice
+    salvo em disco pode ser reaproveitado em execuções seguintes para
+    qualquer arquivo que contenha as mesmas sequências. Sequências novas
+    são esboçadas sob demanda e acrescentadas ao índice.
+    """
+
+    def __init__(self, k: int = DEFAULT_KMER,
+                 sketch_size: int = DEFAULT_SKETCH_SIZE):
+        """
+        Args:
+            k: Tamanho do k-mer
+            sketch_size: Hashes guardados por sequência
+
+        Raises:
+            ValueError: Se k ou sketch_size não forem positivos
+        """
+        if k < 1 or sketch_size < 1:
+            raise ValueError("k e o tamanho do esboço devem ser positivos")
+        self.k = k
+        self.sketch_size = sketch_size
+        self.hashes = array("I")
+        self.offsets = array("Q", [0])
+        self.digests = []
+        self._slots = {}
+        self.modified = False
+
+    def __len__(self) -> int:
+        return len(self.digests)
+
+    def sketch(self, seq) -> array:
+        """
+        Retorna o esboço de uma sequência, calculando-o se for nova.
+
+        Args:
+            seq: Sequência (str ou PackedSequence)
+
+        Returns:
+            array: Esboço MinHash da sequência (ver minhash_sketch)
+        """
+        digest = bytes.fromhex(sequence_digest(seq))
+        slot = self._slots.get(digest)
+        if slot is None:
+            slot = len(self.digests)
+            self.hashes.extend(minhash_sketch(seq, self.k, self.sketch_size))
+            self.offsets.append(len(self.hashes))
+            self.digests.append(digest)
+            self._slots[digest] = slot
+            self.modified = True
+        return self.hashes[self.offsets[slot]:self.offsets[slot + 1]]
+
+    def save(self, path: str):
+        """
+        Grava o índice em disco (substituindo o arquivo de forma atômica).
+
+        O arquivo tem uma assinatura, um cabeçalho JSON de uma linha e os
+        arrays de hashes das sequências, limites e hashes MinHash, em
+        little-endian.
+
+        Args:
+            path: Caminho do arquivo de índice
+        """
+        header = {"version": KMER_INDEX_VERSION, "k": self.k,
+                  "sketch_size": self.sketch_size, "count": len(self),
+                  "hashes": len(self.hashes)}
+        offsets, hashes = array("Q", self.offsets), array("I", self.hashes)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+            hashes.byteswap()
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(KMER_INDEX_MAGIC)
+            f.write(json.dumps(header).encode("ascii") + b"\n")
+            f.write(b"".join(self.digests))
+            f.write(offsets.tobytes())
+            f.write(hashes.tobytes())
+        os.replace(temp_path, path)
+        self.modified = False
+
+    @classmethod
+    def load(cls, path: str) -> "KmerIndex":
+        """
+        Carrega um índice gravado por save.
+
+        Args:
+            path: Caminho do arquivo de índice
+
+        Returns:
+            KmerIndex: Índice carregado
+
+        Raises:
+            ValueError: Se o arquivo não for um índice válido
+        """
+        with open(path, "rb") as f:
+            if f.readline() != KMER_INDEX_MAGIC:
+                raise ValueError(f"{path} não é um índice de k-mers")
+            try:
+                header = json.loads(f.readline())
+                if header["version"] != KMER_INDEX_VERSION:
+                    raise ValueError("versão incompatível")
+                index = cls(header["k"], header["sketch_size"])
+                count, total = header["count"], header["hashes"]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Cabeçalho inválido em {path}: {e}") from None
+            digests = f.read(16 * count)
+            index.offsets = array("Q")
+            index.offsets.frombytes(f.read(8 * (count + 1)))
+            index.hashes.frombytes(f.read(4 * total))
+        if (len(digests) != 16 * count or len(index.offsets) != count + 1
+                or len(index.hashes) != total):
+            raise ValueError(f"Índice de k-mers truncado: {path}")
+        if sys.byteorder == "big":
+            index.offsets.byteswap()
+            index.hashes.byteswap()
+        index.digests = [digests[n:n + 16] for n in range(0, len(digests), 16)]
+        index._slots = {digest: slot
+                        for slot, digest in enumerate(index.digests)}
+        return index
+
+
+def open_kmer_index(path: str = None, k: int = DEFAULT_KMER,
+                    sketch_size: int = DEFAULT_SKETCH_SIZE) -> KmerIndex:
+    """
+    Abre o índice de k-mers de `path`, ou cria um vazio se ele não existir.
+
+    Args:
+        path: Caminho do arquivo de índice (None: índice só em memória)
+        k: Tamanho do k-mer
+        sketch_size: Hashes guardados por sequência
+
+    Returns:
+        KmerIndex: Índice pronto para uso
+
+    Raises:
+        ValueError: Se o índice existente tiver sido criado com outro k ou
+            outro tamanho de esboço
+    """
+    if path is None or not os.path.exists(path):
+        return KmerIndex(k, sketch_size)
+    index = KmerIndex.load(path)
+    if (index.k, index.sketch_size) != (k, sketch_size):
+        raise ValueError(f"O índice {path} usa k={index.k} e esboços de "
+                         f"{index.sketch_size} hashes; use os mesmos "
+                         "--kmer/--sketch-size ou outro arquivo")
+    return index
+
+
+def prefilter_pairs(pairs, sketches1: list, sketches2: list,
+                    threshold: float, size: int, estimates: dict,
+                    filtered: list):
+    """
+    Repassa apenas os pares cuja similaridade estimada alcança o limiar.
+
+    Args:
+        pairs: Iterável de tuplas (índice1, índice2, seq1, seq2)
+        sketches1: Esboços das sequências de seq1, por índice
+        sketches2: Esboços das sequências de seq2, por índice
+        threshold: Jaccard mínimo estimado para alinhar o par
+        size: Tamanho dos esboços
+        estimates: Recebe a estimativa de cada par repassado, por
+            (índice1, índice2)
+        filtered: Recebe as tuplas (índice1, índice2, estimativa) dos pares
+            descartados
+
+    Yields:
+        tuple: (índice1, índice2, seq1, seq2) dos pares a alinhar; pares
+        com sequências menores que k (sem estimativa) são sempre repassados
+    """
+    for pair in pairs:
+        i, j = pair[0], pair[1]
+        estimate = jaccard_estimate(sketches1[i], sketches2[j], size)
+        if estimate is not None and estimate < threshold:
+            filtered.append((i, j, estimate))
+        else:
+            estimates[i, j] = estimate
+            yield pair
+
+
+def iter_batch_pairs(mode: str, seqs1: list, seqs2: list = None):
+    """
+    Gera os pares de sequências a alinhar no modo batch.
+
+    Os iteráveis são consumidos sob demanda sempre que possível: no modo
+    "pairwise" os dois são lidos em paralelo e no modo "query" apenas
+    seqs2 (o banco) precisa ficar em memória.
+
+    Args:
+        mode: "pairwise", "query" ou "all"
+        seqs1: Sequências do primeiro arquivo (qualquer iterável)
+        seqs2: Sequências do segundo arquivo (ignorado no modo "all")
+
+    Yields:
+        tuple: (índice1, índice2, seq1, seq2)
+    """
+    if mode == "pairwise":
+        for i, (seq1, seq2) in enumerate(zip(seqs1, seqs2)):
+            yield i, i, seq1, seq2
+    elif mode == "query":
+        seqs2 = list(seqs2)
+        for i, seq1 in enumerate(seqs1):
+            for j, seq2 in enumerate(seqs2):
+                yield i, j, seq1, seq2
+    elif mode == "all":
+        # Triângulo superior: cada par é alinhado uma única vez
+        seqs1 = list(seqs1)
+        for i in range(len(seqs1)):
+            for j in range(i + 1, len(seqs1)):
+                yield i, j, seqs1[i], seqs1[j]
+    else:
+        raise ValueError(f"Modo batch desconhecido: {mode}")
+
+
+def _align_batch_chunk(chunk: list, options: dict) -> list:
+    """
+    Alinha um lote de pares (executado nos processos do pool).
+
+    Args:
+        chunk: Lista de tuplas (índice1, índice2, seq1, seq2), com
+            sequências str ou PackedSequence
+        options: Argumentos de pontuação repassados ao Aligner (um por
+            lote, com a área de trabalho compartilhada entre os pares)
+
+    Returns:
+        list: Tuplas (índice1, índice2, score)
+    """
+    aligner = Aligner(**options)
+    # str() desempacota PackedSequence (e não copia uma str)
+    return [
+        (i, j, aligner.score(str(seq1), str(seq2)))
+        for i, j, seq1, seq2 in chunk
+    ]
+
+
+def run_batch(pairs, match_val: int = 1, mismatch_val: int = -1,
+              gap_val: int = -1, workers: int = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE, cache=None, **options):
+    """
+    Alinha muitos pares em paralelo com um ProcessPoolExecutor.
+
+    Os pares são agrupados em lotes de `chunk_size` para amortizar o custo
+    de serialização entre processos. No máximo 2 lotes por processo ficam
+    pendentes ao mesmo tempo, de modo que a entrada é consumida sob demanda
+    e os resultados são emitidos assim que cada lote termina (a ordem de
+    saída não é garantida). Com um cache, os pares já conhecidos são
+    respondidos no processo principal e emitidos assim que consultados,
+    sem esperar pelos lotes; apenas os demais vão ao pool, e os novos
+    scores são gravados no cache à medida que chegam. Com min_score,
+    pares descartados pela triagem produzem score None e não são gravados;
+    com xdrop (score heurístico) o cache não é usado.
+
+    Args:
+        pairs: Iterável de tuplas (índice1, índice2, seq1, seq2)
+        match_val: Valor para match
+        mismatch_val: Valor para mismatch
+        gap_val: Valor para gap
+        workers: Número de processos (padrão: número de CPUs); com 1 o
+            processamento é feito no próprio processo
+        chunk_size: Número de pares por tarefa
+        cache: AlignmentCache opcional
+        **options: Demais argumentos de score_pair (ex.: gap_open)
+
+    Yields:
+        tuple: (índice1, índice2, score)
+    """
+    options.update(match_val=match_val, mismatch_val=mismatch_val,
+                   gap_val=gap_val)
+    workers = workers or os.cpu_count() or 1
+    if cache is None or options.get("xdrop") is not None:
+        yield from _run_batch_chunks(pairs, workers, chunk_size, options)
+        return
+
+    # O cache guarda scores exatos: a triagem não entra na chave
+    min_score = options.get("min_score")
+    scoring = {name: value for name, value in options.items()
+               if name not in ("min_score", "xdrop")}
+    keys = {}
+
+    def lookups():
+        # Acertos já saem respondidos: (i, j, score) em vez do par
+        for i, j, seq1, seq2 in pairs:
+            key = cache_key(seq1, seq2, **scoring)
+            entry = cache.get(key)
+            if entry is None:
+                keys[i, j] = key
+                yield i, j, seq1, seq2
+            elif min_score is not None and entry[0] < min_score:
+                yield i, j, None
+            else:
+                yield i, j, entry[0]
+
+    for i, j, score in _run_batch_chunks(lookups(), workers, chunk_size,
+                                         options):
+        key = keys.pop((i, j), None)
+        if key is not None and score is not None:
+            cache.put(key, score)
+        yield i, j, score
+
+
+def _run_batch_chunks(pairs, workers: int, chunk_size: int, options: dict):
+    """
+    Distribui os pares em lotes entre os processos (ver run_batch).
+
+    Itens com três campos (índice1, índice2, score) já estão respondidos
+    (acertos do cache): são emitidos assim que lidos, sem ir ao pool nem
+    esperar que um lote se complete.
+
+    Yields:
+        tuple: (índice1, índice2, score)
+    """
+    def chunks():
+        chunk = []
+        for item in pairs:
+            if len(item) == 3:
+                yield None, item
                 continue
-            if line.startswith(">"):
-                if current_seq:
-                    sequences.append("".join(current_seq))
-                    current_seq = []
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield chunk, None
+                chunk = []
+        if chunk:
+            yield chunk, None
+
+    if workers == 1:
+        for chunk, answered in chunks():
+            if chunk is None:
+                yield answered
             else:
-                current_seq.append(line)
+                yield from _align_batch_chunk(chunk, options)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk, answered in chunks():
+            if chunk is None:
+                yield answered
+                continue
+            pending.add(executor.submit(_align_batch_chunk, chunk, options))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def _named_sequences(records, names: list, pack: bool = False):
+    """
+    Repassa as sequências de um iterador FASTA guardando os nomes.
 
-    if current_seq:
-        sequences.append("".join(current_seq))
+    Args:
+        records: Iterável de tuplas (cabeçalho, sequência)
+        names: Lista onde o nome de cada registro é acrescentado
+        pack: Se True, compacta cada sequência em uma PackedSequence
+
+    Yields:
+        str | PackedSequence: Sequência de cada registro
+    """
+    for header, seq in records:
+        names.append(fasta_record_name(header) or str(len(names)))
+        yield PackedSequence(seq) if pack else seq
+
+
+def _sketched(seqs, index: KmerIndex, sketches: list):
+    """Repassa as sequências guardando em sketches o esboço de cada uma."""
+    for seq in seqs:
+        sketches.append(index.sketch(seq))
+        yield seq
+
+
+def _count_cells(pairs, total: list):
+    """Repassa os pares somando em total[0] as células de cada um."""
+    for pair in pairs:
+        total[0] += len(pair[2]) * len(pair[3])
+        yield pair
+
+
+def run_batch_mode(args: argparse.Namespace, subst=None, profiler=None):
+    """
+    Executa o modo batch da CLI, emitindo um registro (TSV ou JSONL) por par.
+
+    Os registros são lidos sob demanda, então os primeiros pares começam a
+    ser alinhados antes de os arquivos serem lidos por completo. Com
+    --prefilter, cada registro é esboçado (MinHash) ao ser lido e apenas
+    os pares com Jaccard estimado acima do limiar vão ao alinhamento; os
+    demais são emitidos com score "*" e a estimativa na coluna jaccard.
+
+    Args:
+        args: Argumentos analisados por parse_args
+        subst: SubstitutionMatrix opcional
+        profiler: PhaseProfiler opcional (uma fase "run_batch" com as
+            células dos pares alinhados)
+    """
+    names1, names2 = [], []
+    seqs1 = _named_sequences(load_records(args.seq1), names1, args.packed)
+    seqs2 = None
+    if args.batch != "all":
+        seqs2 = _named_sequences(load_records(args.seq2), names2, args.packed)
+    else:
+        names2 = names1
+
+    # No batch o formato text equivale ao tsv (uma linha por par)
+    fmt = "tsv" if args.format == "text" else args.format
+    fields = BATCH_RECORD_FIELDS
+    cells = [0]
+    index = None
+    estimates, filtered = {}, []
+    cache = None if args.no_cache else open_cache(args.cache_dir)
+    try:
+        if args.prefilter is not None:
+            index = open_kmer_index(args.kmer_index, args.kmer,
+                                    args.sketch_size)
+            sketches1, sketches2 = [], []
+            seqs1 = _sketched(seqs1, index, sketches1)
+            if seqs2 is None:
+                sketches2 = sketches1
+            else:
+                seqs2 = _sketched(seqs2, index, sketches2)
+            fields = BATCH_RECORD_FIELDS + ("jaccard",)
+        pairs = iter_batch_pairs(args.batch, seqs1, seqs2)
+        if index is not None:
+            pairs = prefilter_pairs(pairs, sketches1, sketches2,
+                                    args.prefilter, index.sketch_size,
+                                    estimates, filtered)
+        if profiler is not None:
+            pairs = _count_cells(pairs, cells)
+
+        with profile_phase(profiler, "run_batch") as record, \
+                open_output(args.output) as stream:
+            with write_guard():
+                writer = RecordWriter(stream, fmt, fields)
+            skipped = 0
+
+            def write(row):
+                # Erros de escrita não se confundem com os de leitura
+                with write_guard():
+                    writer.write(row)
+
+            def write_filtered():
+                for fi, fj, estimate in filtered:
+                    write({"seq1": names1[fi], "seq2": names2[fj],
+                           "score": None, "jaccard": round(estimate, 4)})
+                skipped_now = len(filtered)
+                filtered.clear()
+                return skipped_now
+
+            for i, j, score in run_batch(pairs, args.match, args.mismatch,
+                                         args.gap, args.workers,
+                                         args.chunk_size, cache,
+                                         gap_open=args.gap_open,
+                                         gap_extend=args.gap_extend,
+                                         subst=subst, mode=args.mode,
+                                         min_score=args.min_score,
+                                         xdrop=args.xdrop):
+                skipped += write_filtered()
+                estimate = estimates.pop((i, j), None)
+                write({"seq1": names1[i], "seq2": names2[j], "score": score,
+                       "jaccard": None if estimate is None
+                       else round(estimate, 4)})
+            skipped += write_filtered()
+            record["cells"] = cells[0]
+        if index is not None:
+            if args.kmer_index is not None and index.modified:
+                index.save(args.kmer_index)
+            print(f"Pré-filtro: {skipped} par(es) descartado(s) por "
+                  f"Jaccard estimado abaixo de {args.prefilter}",
+                  file=sys.stderr)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"Erro ao ler arquivos: {e}")
+        sys.exit(1)
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+class PhaseProfiler:
+    """
+    Mede cada fase de uma execução: tempo, vazão, memória e alocações.
+
+    Cada fase é um bloco `with profiler.phase(nome, células)`; ao sair do
+    bloco são registrados o tempo de parede, as células por segundo (em
+    GCUPS, bilhões de células por segundo), o pico de memória alocada
+    durante a fase (tracemalloc) e a variação de blocos alocados pelo
+    interpretador (sys.getallocatedblocks). O tracemalloc deixa o código
+    medido bem mais lento; com memory=False apenas tempo e alocações são
+    registrados.
+    """
+
+    def __init__(self, memory: bool = True):
+        """
+        Args:
+            memory: Se True, mede o pico de memória com tracemalloc
+        """
+        self.memory = memory
+        self.phases = []
+        self._created = time.perf_counter()
+
+    @contextlib.contextmanager
+    def phase(self, name: str, cells: int = None):
+        """
+        Mede um bloco de código como uma fase.
+
+        Args:
+            name: Nome da fase
+            cells: Células da matriz de programação dinâmica processadas
+                (opcional; pode ser atualizado pelo chamador no registro)
+
+        Yields:
+            dict: Registro da fase, preenchido ao final do bloco
+        """
+        record = {"name": name, "seconds": None, "cells": cells, "gcups": None,
+                  "peak_bytes": None, "allocated_blocks": None}
+        started = False
+        if self.memory:
+            if tracemalloc.is_tracing():
+                if hasattr(tracemalloc, "reset_peak"):
+                    tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started = True
+            base, _ = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            seconds = time.perf_counter() - start
+            record["seconds"] = seconds
+            record["allocated_blocks"] = sys.getallocatedblocks() - blocks
+            if self.memory:
+                _, peak = tracemalloc.get_traced_memory()
+                record["peak_bytes"] = max(peak - base, 0)
+                if started:
+                    tracemalloc.stop()
+            if record["cells"] and seconds > 0:
+                record["gcups"] = record["cells"] / seconds / 1e9
+            self.phases.append(record)
+
+    def summary(self) -> dict:
+        """
+        Resume as fases medidas.
+
+        Returns:
+            dict: total_seconds, python e a lista de fases
+        """
+        return {
+            "total_seconds": time.perf_counter() - self._created,
+            "python": platform.python_version(),
+            "phases": list(self.phases),
+        }
+
+    def write_json(self, path: str):
+        """Grava o resumo em um arquivo JSON."""
+        with open(path, "w") as f:
+            json.dump(self.summary(), f, indent=2)
+
+
+def profile_phase(profiler, name: str, cells: int = None):
+    """
+    Retorna o bloco de medição da fase, ou um bloco vazio sem profiler.
+
+    Args:
+        profiler: PhaseProfiler ou None
+        name: Nome da fase
+        cells: Células processadas na fase (opcional)
 
-    return sequences
+    Returns:
+        Gerenciador de contexto
+    """
+    if profiler is None:
+        return contextlib.nullcontext({})
+    return profiler.phase(name, cells)
 
 
 def main():
@@ -276,47 +4664,460 @@ def main():
     except SystemExit:
         return
 
-    # Lê sequências dos arquivos FASTA
+    profiler = PhaseProfiler() if args.profile else None
+    try:
+        if args.cprofile:
+            stats = cProfile.Profile()
+            try:
+                stats.runcall(run_cli, args, profiler)
+            finally:
+                stats.dump_stats(args.cprofile)
+        else:
+            run_cli(args, profiler)
+    finally:
+        if profiler is not None:
+            profiler.write_json(args.profile)
+
+
+def run_cli(args: argparse.Namespace, profiler=None):
+    """
+    Executa a CLI com os argumentos já analisados.
+
+    Args:
+        args: Argumentos analisados por parse_args
+        profiler: PhaseProfiler opcional
+    """
+    subst = None
+    if args.matrix:
+        try:
+            subst = load_substitution_matrix(args.matrix)
+        except (OSError, ValueError) as e:
+            print(f"Erro ao carregar matriz de substituição: {e}")
+            sys.exit(1)
+
+    if args.batch:
+        run_batch_mode(args, subst, profiler)
+        return
+
+    # Lê apenas o primeiro registro de cada arquivo FASTA
     try:
-        seqs1 = read_fasta(args.seq1)
-        seqs2 = read_fasta(args.seq2)
+        with profile_phase(profiler, "read_fasta"):
+            record1 = next(load_records(args.seq1), None)
+            record2 = next(load_records(args.seq2), None)
         
-        if not seqs1 or not seqs2:
+        if record1 is None or record2 is None:
             print("Erro: Um dos arquivos FASTA está vazio.")
             sys.exit(1)
             
-        seq1 = seqs1[0]
-        seq2 = seqs2[0]
+        seq1 = record1[1]
+        seq2 = record2[1]
     except Exception as e:
         print(f"Erro ao ler arquivos: {e}")
         sys.exit(1)
 
-    print("=" * 60)
-    print("SeqAlignX - Alinhamento Global (Needleman-Wunsch)")
-    print("=" * 60)
-    print(f"\nSequência 1: {args.seq1} (Tamanho: {len(seq1)})")
-    print(f"Sequência 2: {args.seq2} (Tamanho: {len(seq2)})")
+    name1 = fasta_record_name(record1[0]) or "seq1"
+    name2 = fasta_record_name(record2[0]) or "seq2"
+    if args.format == "text":
+        print("=" * 60)
+        print(f"SeqAlignX - {MODE_TITLES[args.mode]}")
+        print("=" * 60)
+        print(f"\nSequência 1: {args.seq1} (Tamanho: {len(seq1)})")
+        print(f"Sequência 2: {args.seq2} (Tamanho: {len(seq2)})")
+        if subst is not None:
+            print(f"Matriz de substituição: {subst.name}")
 
-    # Cria e preenche matriz
-    score_matrix = create_score_matrix(seq1, seq2, args.gap)
-    score_matrix = fill_score_matrix(score_matrix, seq1, seq2, 
-                                     args.match, args.mismatch, args.gap)
+    cache = None if args.no_cache else open_cache(args.cache_dir)
+    try:
+        wants_matrix = bool(args.dump_matrix) or (
+            args.format == "text" and args.show_matrix and not args.quiet)
+        result = solve_pair(args, seq1, seq2, subst, cache,
+                            keep_matrix=wants_matrix, profiler=profiler)
+    except (ImportError, ValueError) as e:
+        print(f"Erro: {e}")
+        sys.exit(1)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    if args.dump_matrix and not args.score_only:
+        if result["score_matrix"] is None:
+            print(f"Aviso: matriz indisponível no motor {result['engine']}; "
+                  "--dump-matrix ignorado.", file=sys.stderr)
+        else:
+            try:
+                with profile_phase(profiler, "write_matrix_npy"):
+                    write_matrix_npy(result["score_matrix"], args.dump_matrix,
+                                     args.matrix_window)
+            except OSError as e:
+                print(f"Erro ao gravar a matriz: {e}")
+                sys.exit(1)
+
+    if args.format == "text":
+        report_text(result, args, seq1, seq2, profiler)
+        return
+
+    with profile_phase(profiler, "write_records"):
+        with open_output(args.output) as stream, write_guard():
+            writer = RecordWriter(stream, args.format)
+            writer.write(pair_record(name1, name2, result, len(seq2)))
 
-    # Calcula score
-    score = get_alignment_score(score_matrix)
-    print(f"\nScore de Alinhamento: {score}")
+
+def engine_label(engine: str, affine: tuple = None) -> str:
+    """
+    Retorna a linha exibida para o motor escolhido.
+
+    Args:
+        engine: Motor efetivo
+        affine: Tupla (abertura, extensão) com gaps afins, ou None
+
+    Returns:
+        str: Descrição do motor, ou None para o motor full
+    """
+    if engine == "gotoh":
+        return (f"Motor: Gotoh (gap afim: abertura {affine[0]}, "
+                f"extensão {affine[1]})")
+    if engine == "checkpoint" and affine:
+        return (f"Motor: Gotoh com checkpoints (gap afim: abertura "
+                f"{affine[0]}, extensão {affine[1]}; uma linha a cada √m)")
+    return {
+        "hirschberg": "Motor: Hirschberg (espaço linear)",
+        "banded": "Motor: Needleman-Wunsch em faixa (banded)",
+        "pointers": "Motor: Needleman-Wunsch com ponteiros de 2 bits",
+        "wavefront": "Motor: Hirschberg com preenchimento em blocos paralelos "
+                     "(wavefront)",
+        "checkpoint": "Motor: traceback com checkpoints (uma linha a cada √m)",
+        "anchored": "Motor: âncoras (sementes únicas encadeadas e "
+                    "Needleman-Wunsch entre as âncoras)",
+    }.get(engine)
+
+
+def run_engine(engine: str, seq1: str, seq2: str, args: argparse.Namespace,
+               subst=None, backend: str = "python", profiler=None) -> tuple:
+    """
+    Executa o motor escolhido sobre um par.
+
+    Args:
+        engine: Motor efetivo (ver select_engine)
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        args: Argumentos analisados por parse_args
+        subst: SubstitutionMatrix opcional
+        backend: Backend do motor full ("python" ou "numpy")
+        profiler: PhaseProfiler opcional (uma fase por etapa do motor)
+
+    Returns:
+        tuple: (align1, align2, score, região ou None, matriz ou None)
+    """
+    cells = len(seq1) * len(seq2)
+    affine = resolve_affine_gaps(args.gap, args.gap_open, args.gap_extend)
+    if engine == "anchored":
+        aligner = Aligner(args.match, args.mismatch, args.gap, args.gap_open,
+                          args.gap_extend, subst, engine="anchored",
+                          max_cells=args.max_cells, seed=args.seed_k)
+        with profile_phase(profiler, "anchored_alignment"):
+            align1, align2, score = aligner.align(seq1, seq2)
+        return align1, align2, score, None, None
+    if engine == "hirschberg":
+        # Espaço linear: a matriz completa nunca é construída
+        with profile_phase(profiler, "hirschberg", cells):
+            align1, align2 = hirschberg(seq1, seq2, args.match, args.mismatch,
+                                        args.gap, subst)
+        score = alignment_score(align1, align2, args.match, args.mismatch,
+                                args.gap, subst)
+        return align1, align2, score, None, None
+    if engine == "gotoh":
+        with profile_phase(profiler, "gotoh", cells):
+            align1, align2, score = gotoh(seq1, seq2, args.match, args.mismatch,
+                                          *affine, subst=subst)
+        return align1, align2, score, None, None
+    if engine == "banded":
+        with profile_phase(profiler, "banded_needleman_wunsch", cells):
+            align1, align2, score = banded_needleman_wunsch(
+                seq1, seq2, args.match, args.mismatch, args.gap, args.band,
+                subst)
+        return align1, align2, score, None, None
+    if engine == "checkpoint" and affine:
+        with profile_phase(profiler, "checkpoint_gotoh", 2 * cells):
+            align1, align2, score = checkpoint_gotoh(
+                seq1, seq2, args.match, args.mismatch, *affine, subst=subst)
+        return align1, align2, score, None, None
+    if engine == "checkpoint":
+        with profile_phase(profiler, "checkpoint_alignment", 2 * cells):
+            align1, align2, score, region = checkpoint_alignment(
+                seq1, seq2, args.match, args.mismatch, args.gap, subst,
+                args.mode)
+        return align1, align2, score, region, None
+    if engine == "wavefront":
+        with profile_phase(profiler, "wavefront_hirschberg", cells):
+            align1, align2 = wavefront_hirschberg(
+                seq1, seq2, args.match, args.mismatch, args.gap, subst,
+                args.workers, args.tile)
+        score = alignment_score(align1, align2, args.match, args.mismatch,
+                                args.gap, subst)
+        return align1, align2, score, None, None
+    if engine == "pointers":
+        with profile_phase(profiler, "pointer_needleman_wunsch", cells):
+            align1, align2, score = pointer_needleman_wunsch(
+                seq1, seq2, args.match, args.mismatch, args.gap, subst)
+        return align1, align2, score, None, None
+
+    # Cria e preenche matriz
+    if backend == "numpy":
+        with profile_phase(profiler, "fill_score_matrix_numpy", cells):
+            score_matrix = fill_score_matrix_numpy(seq1, seq2, args.match,
+                                                   args.mismatch, args.gap,
+                                                   subst, args.mode)
+    else:
+        with profile_phase(profiler, "create_score_matrix", cells):
+            score_matrix = create_score_matrix(seq1, seq2, args.gap, args.mode)
+        with profile_phase(profiler, "fill_score_matrix", cells):
+            score_matrix = fill_score_matrix(score_matrix, seq1, seq2, 
+                                             args.match, args.mismatch,
+                                             args.gap, subst, args.mode)
 
     # Reconstrói alinhamento
-    align1, align2 = traceback(score_matrix, seq1, seq2, args.match, args.mismatch, args.gap)
+    with profile_phase(profiler, "traceback"):
+        align1, align2, region = traceback_region(
+            score_matrix, seq1, seq2, args.match, args.mismatch, args.gap,
+            subst, args.mode)
+
+    # Calcula score (na célula final do modo escolhido)
+    score = int(score_matrix[region[1]][region[3]])
+    return align1, align2, score, region, score_matrix
+
+
+def solve_pair(args: argparse.Namespace, seq1: str, seq2: str, subst=None,
+               cache=None, keep_matrix: bool = False, profiler=None) -> dict:
+    """
+    Calcula o resultado do par da CLI, consultando o cache antes.
+
+    Args:
+        args: Argumentos analisados por parse_args
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        subst: SubstitutionMatrix opcional
+        cache: AlignmentCache opcional
+        keep_matrix: Se True, o motor full sempre roda (a matriz é exibida)
+        profiler: PhaseProfiler opcional
+
+    Returns:
+        dict: engine, score, align1 e align2 (None no score-only), region
+        (início1, fim1, início2, fim2; 0-based semiabertas, com os inícios
+        None no score-only dos modos local e semi-global), score_matrix,
+        cached (se o resultado veio do cache) e rejected (se a triagem de
+        --min-score/--xdrop descartou o par; score e região ficam None)
+
+    Raises:
+        ValueError: Se o modo ou os gaps afins não forem suportados pelo
+            motor pedido
+        ImportError: Se o backend numpy for pedido sem o NumPy instalado
+    """
+    m, n = len(seq1), len(seq2)
+    affine = resolve_affine_gaps(args.gap, args.gap_open, args.gap_extend)
+    if affine and args.engine not in AFFINE_ENGINES:
+        raise ValueError(f"o motor {args.engine} não aceita gaps afins; use "
+                         "auto, full, checkpoint ou anchored.")
+    if args.engine == "anchored":
+        # O cache só guarda scores exatos; o motor anchored é heurístico
+        cache = None
+    key = cached = None
+    if cache is not None:
+        with profile_phase(profiler, "cache_lookup"):
+            key = cache_key(seq1, seq2, args.match, args.mismatch, args.gap,
+                            args.gap_open, args.gap_extend, subst, args.mode,
+                            args.engine, args.band)
+            cached = cache.get(key)
+    extra = cached[1] if cached and cached[1] else {}
+    result = {"engine": None, "score": None, "align1": None, "align2": None,
+              "region": (0, m, 0, n), "score_matrix": None,
+              "cached": False, "rejected": False}
+
+    if args.min_score is not None or args.xdrop is not None:
+        # Triagem: interrompe o preenchimento assim que o par é descartado
+        if cached and args.xdrop is None:
+            score = cached[0]
+            if score < args.min_score:
+                score = None
+        else:
+            with profile_phase(profiler, "screen_score", m * n):
+                score = screen_score(seq1, seq2, args.match, args.mismatch,
+                                     args.gap, subst, args.min_score,
+                                     args.xdrop)
+            if score is not None and cache is not None and args.xdrop is None:
+                cache.put(key, score)
+        result["cached"] = bool(cached) and args.xdrop is None
+        if score is None:
+            result.update(rejected=True, region=(None,) * 4)
+            return result
+        if args.score_only:
+            result["score"] = score
+            return result
+
+    if args.score_only:
+        # Modo de triagem: nenhuma matriz, traceback ou formatação
+        if args.mode == "global":
+            if cached:
+                score = cached[0]
+            else:
+                if args.engine == "anchored":
+                    # Heurística: mesmo score do alinhamento por âncoras
+                    score = run_engine("anchored", seq1, seq2, args, subst,
+                                       profiler=profiler)[2]
+                elif args.engine == "wavefront":
+                    with profile_phase(profiler, "wavefront_last_row", m * n):
+                        score = wavefront_last_row(
+                            seq1, seq2, args.match, args.mismatch, args.gap,
+                            subst, args.workers, args.tile)[-1]
+                else:
+                    with profile_phase(profiler, "score_pair", m * n):
+                        score = score_pair(seq1, seq2, args.match,
+                                           args.mismatch, args.gap,
+                                           args.gap_open, args.gap_extend,
+                                           subst)
+                if cache is not None:
+                    cache.put(key, score)
+        else:
+            end = extra.get("end")
+            if end is None:
+                with profile_phase(profiler, "best_alignment_end", m * n):
+                    score, end1, end2 = best_alignment_end(
+                        seq1, seq2, args.match, args.mismatch, args.gap, subst,
+                        args.mode)
+                if cache is not None:
+                    cache.put(key, score, dict(extra, end=[end1, end2]))
+            else:
+                score, (end1, end2) = cached[0], end
+            result["region"] = (None, end1, None, end2)
+        result.update(score=score, cached=bool(cached))
+        return result
+
+    if args.mode != "global":
+        # Local e semi-global precisam da matriz (completa ou por checkpoints)
+        if args.engine not in LOCAL_ENGINES:
+            raise ValueError(f"o modo {args.mode} só é suportado pelos motores "
+                             "full e checkpoint.")
+        engine = args.engine
+        if engine == "auto":
+            too_big = (m + 1) * (n + 1) > args.max_cells
+            engine = "checkpoint" if too_big and not keep_matrix else "full"
+    elif affine and args.engine != "anchored":
+        # Gotoh completo ou, acima de --max-cells, por checkpoints
+        too_big = (m + 1) * (n + 1) > args.max_cells
+        engine = "gotoh"
+        if args.engine == "checkpoint" or (args.engine == "auto" and too_big):
+            engine = "checkpoint"
+    else:
+        engine = select_engine(args.engine, seq1, seq2, args.max_cells)
+    backend = select_backend(args.backend)
+    result["engine"] = engine
+
+    # A matriz só existe se o motor full rodar de fato
+    if "alignment" in extra and not (keep_matrix and engine == "full"):
+        align1, align2 = extra["alignment"]
+        region = tuple(extra["region"]) if extra.get("region") else None
+        score, score_matrix = cached[0], None
+        result["cached"] = True
+    else:
+        align1, align2, score, region, score_matrix = run_engine(
+            engine, seq1, seq2, args, subst, backend, profiler)
+        if cache is not None:
+            stored = {"alignment": [align1, align2],
+                      "region": list(region) if region else None}
+            if region is not None:
+                stored["end"] = [region[1], region[3]]
+            cache.put(key, score, stored)
+
+    result.update(score=score, align1=align1, align2=align2,
+                  score_matrix=score_matrix)
+    if region is not None:
+        result["region"] = region
+    return result
+
+
+def report_text(result: dict, args: argparse.Namespace, seq1: str, seq2: str,
+                profiler=None):
+    """
+    Exibe o resultado de solve_pair no formato de texto legível.
+
+    Args:
+        result: Dicionário retornado por solve_pair
+        args: Argumentos analisados por parse_args
+        seq1: Primeira sequência
+        seq2: Segunda sequência
+        profiler: PhaseProfiler opcional
+    """
+    score = result["score"]
+    if result["rejected"]:
+        if args.min_score is not None:
+            print("\nPar rejeitado: o score não alcança o mínimo de "
+                  f"{args.min_score} (cálculo interrompido)")
+        else:
+            print(f"\nPar rejeitado: nenhuma célula restou dentro do X-drop "
+                  f"de {args.xdrop}")
+        print("\nAlinhamento concluído!")
+        return
+    if args.score_only:
+        print(f"\nScore de Alinhamento: {score}")
+        if args.mode != "global":
+            _, end1, _, end2 = result["region"]
+            print(f"Fim do alinhamento: seq1 {end1}, seq2 {end2}")
+        print("\nAlinhamento concluído!")
+        return
+
+    engine = result["engine"]
+    affine = resolve_affine_gaps(args.gap, args.gap_open, args.gap_extend)
+    label = engine_label(engine, affine)
+    if label:
+        print(label)
+    if result["cached"]:
+        print("Resultado recuperado do cache")
+
+    print(f"\nScore de Alinhamento: {score}")
+    if args.mode != "global":
+        # Coordenadas 1-based inclusivas, como em seq1/seq2 do FASTA
+        start1, end1, start2, end2 = result["region"]
+        print(f"Região: seq1 {start1 + 1}-{end1}, seq2 {start2 + 1}-{end2}")
     print("\nAlinhamento Reconstruído:")
-    print(format_alignment(align1, align2))
+    with profile_phase(profiler, "format_alignment"):
+        print(format_alignment(result["align1"], result["align2"]))
 
     # Mostra matriz (opcional)
-    if not args.quiet:
-        print_matrix(score_matrix, seq1, seq2)
+    if args.show_matrix and not args.quiet:
+        if result["score_matrix"] is None:
+            print(f"\nMatriz de pontuação indisponível no motor {engine}.")
+        else:
+            with profile_phase(profiler, "print_matrix"):
+                print_matrix(result["score_matrix"], seq1, seq2,
+                             args.matrix_window)
 
     print("\nAlinhamento concluído!")
 
 
+def pair_record(name1: str, name2: str, result: dict,
+                length2: int = None) -> dict:
+    """
+    Converte o resultado de solve_pair em um registro de saída.
+
+    Args:
+        name1: Nome do registro de seq1
+        name2: Nome do registro de seq2
+        result: Dicionário retornado por solve_pair
+        length2: Tamanho de seq2, para o soft clip final do CIGAR (padrão:
+            o fim da região, sem clip)
+
+    Returns:
+        dict: Campos de RECORD_FIELDS (CIGAR None no score-only)
+    """
+    start1, end1, start2, end2 = result["region"]
+    cigar = None
+    if result["align1"] is not None:
+        clip_end = 0 if length2 is None else length2 - end2
+        cigar = alignment_cigar(result["align1"], result["align2"], start2,
+                                clip_end)
+    return {"seq1": name1, "seq2": name2, "score": result["score"],
+            "start1": start1, "end1": end1, "start2": start2, "end2": end2,
+            "cigar": cigar}
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+SeqAlignX - Servidor de Alinhamento
+
+Processo de longa duração que recebe pedidos de alinhamento em JSONL por
+um socket Unix ou TCP local, evitando pagar a inicialização do
+interpretador e do módulo a cada pedido. Os pedidos entram em uma fila
+limitada, são agrupados em micro-lotes e despachados para um pool de
+processos; cada resposta é escrita na conexão assim que o lote dela
+termina (a ordem entre lotes não é garantida, use o campo "id").
+
+Pedido (uma linha JSON):
+    {"id": 1, "seq1": "GATTACA", "seq2": "GCATGCU", "align": true,
+     "match": 1, "mismatch": -1, "gap": -1, "mode": "global"}
+
+Resposta (uma linha JSON; coordenadas 0-based semiabertas, como na CLI):
+    {"id": 1, "score": 0, "align1": "...", "align2": "...", "start1": 0,
+     "end1": 7, "start2": 0, "end2": 7, "cigar": "..."}
+    {"id": 1, "error": "mensagem"}
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import main
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Pedidos por micro-lote e espera máxima para completar um lote
+DEFAULT_BATCH_SIZE = 32
+DEFAULT_BATCH_WAIT = 0.005
+
+# Pedidos aceitos e ainda não despachados; acima disso a leitura das
+# conexões é suspensa (backpressure) até a fila esvaziar
+DEFAULT_QUEUE_SIZE = 1024
+
+# Pares acima deste número de células são recusados, para que um pedido
+# gigante não segure um processo do pool e a latência da cauda
+DEFAULT_MAX_CELLS = main.DEFAULT_MAX_CELLS
+
+# Tamanho máximo de uma linha de pedido (bytes)
+LINE_LIMIT = 64 << 20
+
+# Campos do pedido -> argumentos do Aligner
+OPTION_FIELDS = {
+    "match": "match_val",
+    "mismatch": "mismatch_val",
+    "gap": "gap_val",
+    "gap_open": "gap_open",
+    "gap_extend": "gap_extend",
+    "mode": "mode",
+    "engine": "engine",
+}
+
+# Aligners mantidos por processo do pool (um por esquema de pontuação)
+MAX_CACHED_ALIGNERS = 64
+_ALIGNERS = {}
+
+
+def parse_args(args: list) -> argparse.Namespace:
+    """
+    Analisa os argumentos de linha de comando do servidor.
+
+    Args:
+        args: Lista de argumentos
+
+    Returns:
+        argparse.Namespace: Argumentos analisados
+    """
+    parser = argparse.ArgumentParser(
+        description="SeqAlignX - Servidor de alinhamento JSONL"
+    )
+    parser.add_argument(
+        "--socket", default=None, metavar="CAMINHO",
+        help="Escuta em um socket Unix (em vez de TCP)"
+    )
+    parser.add_argument(
+        "--host", default=DEFAULT_HOST,
+        help=f"Endereço TCP (Padrão: {DEFAULT_HOST})"
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT,
+        help=f"Porta TCP (Padrão: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Processos do pool (Padrão: número de CPUs)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help=f"Pedidos por micro-lote (Padrão: {DEFAULT_BATCH_SIZE})"
+    )
+    parser.add_argument(
+        "--batch-wait", type=float, default=DEFAULT_BATCH_WAIT * 1000,
+        metavar="MS",
+        help="Espera máxima, em milissegundos, para completar um lote "
+             f"(Padrão: {DEFAULT_BATCH_WAIT * 1000:g})"
+    )
+    parser.add_argument(
+        "--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+        help="Pedidos pendentes antes de suspender a leitura das conexões "
+             f"(Padrão: {DEFAULT_QUEUE_SIZE})"
+    )
+    parser.add_argument(
+        "--max-cells", type=int, default=DEFAULT_MAX_CELLS,
+        help="Recusa pares com mais células (m * n) que este limite "
+             f"(Padrão: {DEFAULT_MAX_CELLS})"
+    )
+
+    args = parser.parse_args(args)
+    for name in ("batch_size", "queue_size", "max_cells"):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} deve ser positivo")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers deve ser positivo")
+    if args.batch_wait < 0:
+        parser.error("--batch-wait não pode ser negativo")
+    return args
+
+
+def parse_request(line: bytes, max_cells: int = DEFAULT_MAX_CELLS) -> dict:
+    """
+    Valida uma linha de pedido.
+
+    Args:
+        line: Linha JSON recebida
+        max_cells: Limite de células do par
+
+    Returns:
+        dict: id, seq1, seq2, align e options (argumentos do Aligner, em
+            ordem estável para servir de chave)
+
+    Raises:
+        ValueError: Se o pedido for inválido; o atributo `request_id`
+            guarda o id, quando ele pôde ser lido
+    """
+    try:
+        payload = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"JSON inválido: {e}") from None
+    if not isinstance(payload, dict):
+        raise ValueError("o pedido deve ser um objeto JSON")
+
+    request_id = payload.get("id")
+    try:
+        seq1, seq2 = payload.get("seq1"), payload.get("seq2")
+        if not isinstance(seq1, str) or not isinstance(seq2, str):
+            raise ValueError("seq1 e seq2 são obrigatórias (texto)")
+        if len(seq1) * len(seq2) > max_cells:
+            raise ValueError(f"par grande demais ({len(seq1)} x {len(seq2)} "
+                             f"células, limite {max_cells})")
+        options = []
+        for field, option in OPTION_FIELDS.items():
+            value = payload.get(field)
+            if value is None:
+                continue
+            expected = str if field in ("mode", "engine") else int
+            if not isinstance(value, expected) or isinstance(value, bool):
+                raise ValueError(f"valor inválido para {field}: {value!r}")
+            options.append((option, value))
+        if payload.get("matrix") is not None:
+            if not isinstance(payload["matrix"], str):
+                raise ValueError("matrix deve ser o nome de uma matriz")
+            options.append(("matrix", payload["matrix"]))
+    except ValueError as e:
+        e.request_id = request_id
+        raise
+
+    # Sem normalizar a caixa: o mesmo par tem o mesmo score que na CLI
+    return {"id": request_id, "seq1": seq1, "seq2": seq2,
+            "align": bool(payload.get("align")), "options": tuple(options)}
+
+
+@functools.lru_cache(maxsize=None)
+def _substitution_matrix(name: str):
+    """Carrega (uma vez por processo) uma matriz de substituição."""
+    return main.load_substitution_matrix(name)
+
+
+def _aligner(options: tuple):
+    """
+    Retorna o Aligner do esquema de pontuação, reaproveitado no processo.
+
+    Args:
+        options: Pares (argumento, valor) de parse_request
+
+    Returns:
+        main.Aligner: Aligner com a área de trabalho do processo
+    """
+    aligner = _ALIGNERS.get(options)
+    if aligner is None:
+        kwargs = dict(options)
+        if "matrix" in kwargs:
+            kwargs["subst"] = _substitution_matrix(kwargs.pop("matrix"))
+        aligner = main.Aligner(**kwargs)
+        if len(_ALIGNERS) >= MAX_CACHED_ALIGNERS:
+            _ALIGNERS.clear()
+        _ALIGNERS[options] = aligner
+    return aligner
+
+
+def solve_requests(requests: list) -> list:
+    """
+    Resolve um micro-lote de pedidos (executado nos processos do pool).
+
+    Args:
+        requests: Pedidos retornados por parse_request
+
+    Returns:
+        list: Uma resposta (dict) por pedido, na mesma ordem; um pedido que
+        falhe recebe uma resposta com "error" sem afetar os demais do lote.
+        Com "align", a região e o CIGAR (com soft clips nas pontas de seq2
+        fora do alinhamento) seguem main.pair_record
+    """
+    responses = []
+    for request in requests:
+        response = {"id": request["id"]}
+        try:
+            aligner = _aligner(request["options"])
+            if request["align"]:
+                align1, align2, score, region = aligner.align_region(
+                    request["seq1"], request["seq2"])
+                start1, end1, start2, end2 = region
+                cigar = main.alignment_cigar(align1, align2, start2,
+                                             len(request["seq2"]) - end2)
+                response.update(score=score, align1=align1, align2=align2,
+                                start1=start1, end1=end1, start2=start2,
+                                end2=end2, cigar=cigar)
+            else:
+                response["score"] = aligner.score(request["seq1"],
+                                                  request["seq2"])
+        except Exception as e:  # Um pedido com erro não derruba o lote
+            response = {"id": request["id"],
+                        "error": str(e) or type(e).__name__}
+        responses.append(response)
+    return responses
+
+
+def _encode(response: dict) -> bytes:
+    """Serializa uma resposta como uma linha JSON."""
+    return json.dumps(response).encode() + b"\n"
+
+
+class AlignmentServer:
+    """
+    Fila limitada, micro-lotes e pool de processos atrás das conexões.
+
+    Cada conexão lê um pedido por linha e o coloca na fila; com a fila
+    cheia, `put` espera e a leitura da conexão para (o cliente sente a
+    pressão pelo próprio socket). Uma única tarefa de despacho monta lotes
+    de até `batch_size` pedidos, esperando no máximo `batch_wait` segundos
+    para completá-los, e mantém no máximo 2 lotes por processo em execução,
+    como run_batch.
+    """
+
+    def __init__(self, workers: int = None,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 batch_wait: float = DEFAULT_BATCH_WAIT,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 max_cells: int = DEFAULT_MAX_CELLS):
+        """
+        Args:
+            workers: Processos do pool (padrão: número de CPUs)
+            batch_size: Pedidos por micro-lote
+            batch_wait: Espera máxima, em segundos, para completar um lote
+            queue_size: Pedidos pendentes antes do backpressure
+            max_cells: Limite de células (m * n) de um par
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.queue_size = queue_size
+        self.max_cells = max_cells
+        self._queue = None
+        self._slots = None
+        self._executor = None
+        self._dispatcher = None
+        self._running = set()
+
+    async def start(self):
+        """
+        Cria a fila, o pool de processos e a tarefa de despacho.
+
+        Deve ser chamado antes de aceitar conexões.
+        """
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._slots = asyncio.Semaphore(2 * self.workers)
+        self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        loop = asyncio.get_running_loop()
+        # Cria os processos já aqui: com fork, um processo criado depois de
+        # aceitar conexões herdaria os sockets delas e o cliente não veria
+        # o fim da resposta
+        await loop.run_in_executor(self._executor, int)
+        self._dispatcher = loop.create_task(self._dispatch())
+
+    async def close(self):
+        """
+        Para o despacho e encerra o pool de processos.
+
+        O pool é encerrado mesmo se a espera pelos lotes for cancelada, de
+        modo que ele nunca sobrevive ao laço de eventos.
+        """
+        try:
+            if self._dispatcher is not None:
+                self._dispatcher.cancel()
+                try:
+                    await self._dispatcher
+                except asyncio.CancelledError:
+                    pass
+            if self._running:
+                await asyncio.wait(self._running)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _next_batch(self) -> list:
+        """Espera um pedido e completa o lote até o tamanho ou o prazo."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.batch_wait
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _dispatch(self):
+        """Monta lotes e os envia ao pool, limitando os lotes em execução."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            await self._slots.acquire()
+            task = loop.create_task(self._run_batch(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, batch: list):
+        """Executa um lote no pool e entrega cada resposta ao seu pedido."""
+        loop = asyncio.get_running_loop()
+        try:
+            responses = await loop.run_in_executor(
+                self._executor, solve_requests,
+                [request for request, _ in batch])
+        except Exception as e:  # Ex.: processo do pool encerrado
+            responses = [{"id": request["id"], "error": f"falha interna: {e}"}
+                         for request, _ in batch]
+        finally:
+            self._slots.release()
+        for (_, future), response in zip(batch, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter):
+        """
+        Atende uma conexão: um pedido por linha, uma resposta por linha.
+
+        A conexão é fechada depois que o cliente encerra o envio e todas
+        as respostas pendentes foram escritas.
+        """
+        loop = asyncio.get_running_loop()
+        pending = set()
+
+        def reply(future):
+            if not future.cancelled() and not writer.is_closing():
+                writer.write(_encode(future.result()))
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    writer.write(_encode({"id": None,
+                                          "error": "linha longa demais"}))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = parse_request(line, self.max_cells)
+                except ValueError as e:
+                    writer.write(_encode({"id": getattr(e, "request_id", None),
+                                          "error": str(e)}))
+                    continue
+                future = loop.create_future()
+                future.add_done_callback(reply)
+                future.add_done_callback(pending.discard)
+                pending.add(future)
+                # Com a fila cheia, o próximo pedido só é lido quando houver
+                # vaga
+                await self._queue.put((request, future))
+                await writer.drain()
+            if pending:
+                await asyncio.wait(pending)
+            await writer.drain()
+        except ConnectionError:
+            for future in list(pending):
+                future.cancel()
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def serve(args: argparse.Namespace):
+    """
+    Inicia o servidor e atende até ser interrompido.
+
+    Args:
+        args: Argumentos analisados por parse_args
+    """
+    loop = asyncio.get_running_loop()
+    async with AlignmentServer(args.workers, args.batch_size,
+                               args.batch_wait / 1000, args.queue_size,
+                               args.max_cells) as server:
+        if args.socket:
+            listener = await asyncio.start_unix_server(
+                server.handle, args.socket, limit=LINE_LIMIT)
+            where = args.socket
+        else:
+            listener = await asyncio.start_server(
+                server.handle, args.host, args.port, limit=LINE_LIMIT)
+            where = f"{args.host}:{args.port}"
+        try:
+            # SIGTERM encerra como Ctrl+C: o pool e o socket são liberados
+            loop.add_signal_handler(signal.SIGTERM,
+                                    asyncio.current_task().cancel)
+        except NotImplementedError:  # Indisponível no Windows
+            pass
+        try:
+            print(f"[OK] SeqAlignX servindo em {where} "
+                  f"({server.workers} processos)", file=sys.stderr)
+            async with listener:
+                await listener.serve_forever()
+        finally:
+            # Remove o handler antes de encerrar o pool e o laço: ao fechar,
+            # o laço descarta o pipe de despertar antes dos handlers, e um
+            # SIGTERM nesse intervalo seria escrito em um pipe já fechado
+            try:
+                loop.remove_signal_handler(signal.SIGTERM)
+            except NotImplementedError:
+                pass
+
+
+def main_server(argv: list = None) -> int:
+    """Ponto de entrada do servidor."""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        asyncio.run(serve(args))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+    finally:
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main_server())
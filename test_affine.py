@@ -0,0 +1,117 @@
+import unittest
+import random
+from unittest import mock
+import main
+from main import (gotoh, gotoh_score, checkpoint_gotoh, needleman_wunsch,
+                  resolve_affine_gaps, score_pair, parse_args, run_batch,
+                  iter_batch_pairs, solve_pair, Aligner, load_substitution_matrix)
+
+def affine_alignment_score(align1, align2, match, mismatch, gap_open, gap_extend):
+    score = 0
+    prev = None
+    for c1, c2 in zip(align1, align2):
+        if c1 == "-" or c2 == "-":
+            state = "X" if c2 == "-" else "Y"
+            score += gap_extend if state == prev else gap_open
+        else:
+            state = "M"
+            score += match if c1 == c2 else mismatch
+        prev = state
+    return score
+
+class TestGotoh(unittest.TestCase):
+    def test_linear_equivalence(self):
+        rng = random.Random(8)
+        for _ in range(20):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            expected = needleman_wunsch(seq1, seq2, 1, -1, -2)
+            self.assertEqual(gotoh(seq1, seq2, 1, -1, -2, -2)[2], expected)
+            self.assertEqual(gotoh_score(seq1, seq2, 1, -1, -2, -2), expected)
+
+    def test_alignment_consistent_with_score(self):
+        rng = random.Random(9)
+        for _ in range(30):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            align1, align2, score = gotoh(seq1, seq2, 2, -1, -5, -1)
+            self.assertEqual(align1.replace("-", ""), seq1)
+            self.assertEqual(align2.replace("-", ""), seq2)
+            self.assertEqual(affine_alignment_score(align1, align2, 2, -1, -5, -1), score)
+            self.assertEqual(gotoh_score(seq1, seq2, 2, -1, -5, -1), score)
+
+    def test_prefers_single_long_gap(self):
+        align1, align2, score = gotoh("AAACCCGGG", "AAAGGG", 1, -1, -4, -1)
+        self.assertEqual(align1, "AAACCCGGG")
+        self.assertEqual(align2, "AAA---GGG")
+        self.assertEqual(score, 6 - 4 - 2)
+
+    def test_empty(self):
+        self.assertEqual(gotoh("", ""), ("", "", 0))
+        self.assertEqual(gotoh("ACG", "", 1, -1, -3, -1), ("ACG", "---", -5))
+        self.assertEqual(gotoh_score("", "AC", 1, -1, -3, -1), -4)
+
+    def test_checkpoint_matches_full(self):
+        rng = random.Random(10)
+        blosum = load_substitution_matrix("BLOSUM62")
+        for _ in range(60):
+            seq1 = "".join(rng.choice("ACG") for _ in range(rng.randint(0, 50)))
+            seq2 = "".join(rng.choice("ACG") for _ in range(rng.randint(0, 50)))
+            interval = rng.choice([None, 1, 3, 7])
+            for scheme in [(1, -1, -3, -1), (2, -1, -5, -1), (1, 0, 0, 0)]:
+                self.assertEqual(checkpoint_gotoh(seq1, seq2, *scheme, interval=interval),
+                                 gotoh(seq1, seq2, *scheme))
+            self.assertEqual(
+                checkpoint_gotoh(seq1, seq2, gap_open=-10, gap_extend=-1, subst=blosum),
+                gotoh(seq1, seq2, gap_open=-10, gap_extend=-1, subst=blosum))
+
+    def test_over_max_cells_avoids_full_matrix(self):
+        rng = random.Random(11)
+        seq1 = "".join(rng.choice("ACGT") for _ in range(120))
+        seq2 = "".join(rng.choice("ACGT") for _ in range(100))
+        expected = gotoh(seq1, seq2, 1, -1, -3, -1)
+        fill = main._fill_gotoh
+
+        def small_fill(part1, *args, **kwargs):
+            # Só blocos de √m linhas, nunca as três matrizes completas
+            self.assertLessEqual(len(part1), 11)
+            return fill(part1, *args, **kwargs)
+
+        with mock.patch.object(main, "_fill_gotoh", small_fill):
+            aligner = Aligner(gap_open=-3, gap_extend=-1, max_cells=1000)
+            self.assertEqual(aligner.align(seq1, seq2), expected)
+            args = parse_args(["--seq1", "a", "--seq2", "b", "--gap-open", "-3",
+                               "--max-cells", "1000"])
+            result = solve_pair(args, seq1, seq2)
+        self.assertEqual(result["engine"], "checkpoint")
+        self.assertEqual((result["align1"], result["align2"], result["score"]), expected)
+        args = parse_args(["--seq1", "a", "--seq2", "b", "--gap-open", "-3"])
+        self.assertEqual(solve_pair(args, seq1, seq2)["engine"], "gotoh")
+
+    def test_unsupported_engine_is_rejected(self):
+        for engine in ("hirschberg", "banded", "pointers", "wavefront"):
+            with self.assertRaises(ValueError):
+                Aligner(gap_open=-3, engine=engine)
+            args = parse_args(["--seq1", "a", "--seq2", "b", "--gap-open", "-3",
+                               "--engine", engine])
+            with self.assertRaises(ValueError):
+                solve_pair(args, "ACGT", "AGT")
+
+    def test_resolve_and_dispatch(self):
+        self.assertIsNone(resolve_affine_gaps(-1))
+        self.assertEqual(resolve_affine_gaps(-1, gap_open=-5), (-5, -1))
+        self.assertEqual(score_pair("AAACCCGGG", "AAAGGG", 1, -1, -1, -4, -1), 0)
+        results = list(run_batch(iter_batch_pairs("pairwise", ["AAACCCGGG"], ["AAAGGG"]),
+                                 workers=1, gap_open=-4, gap_extend=-1))
+        self.assertEqual(results, [(0, 0, 0)])
+
+    def test_cli_args(self):
+        args = parse_args(["--seq1", "a.fasta", "--seq2", "b.fasta",
+                           "--gap-open", "-10", "--gap-extend", "-1"])
+        self.assertEqual((args.gap_open, args.gap_extend), (-10, -1))
+        args = parse_args(["--seq1", "a.fasta", "--seq2", "b.fasta"])
+        self.assertIsNone(args.gap_open)
+        self.assertIsNone(args.gap_extend)
+
+if __name__ == "__main__":
+    unittest.main()
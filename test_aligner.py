@@ -0,0 +1,94 @@
+import unittest
+import random
+from main import (Aligner, needleman_wunsch, score_pair, gotoh_score, hirschberg,
+                  best_alignment_end, load_substitution_matrix, _dp_last_row,
+                  _fill_pointers)
+
+def _random_pairs(seed, count, max_len=40):
+    rng = random.Random(seed)
+    return [("".join(rng.choice("ACGT") for _ in range(rng.randint(0, max_len))),
+             "".join(rng.choice("ACGT") for _ in range(rng.randint(0, max_len))))
+            for _ in range(count)]
+
+class TestAligner(unittest.TestCase):
+    def test_score_matches_free_functions(self):
+        blosum = load_substitution_matrix("BLOSUM62")
+        schemes = [Aligner(), Aligner(2, -1, -2), Aligner(0, -1, -1),
+                   Aligner(gap_val=-8, subst=blosum), Aligner(mode="local"),
+                   Aligner(mode="semiglobal")]
+        for seq1, seq2 in _random_pairs(3, 40):
+            for aligner in schemes:
+                expected = _dp_last_row(seq1, seq2, aligner.match_val,
+                                        aligner.mismatch_val, aligner.gap_val,
+                                        aligner.subst, aligner.mode)[1]
+                self.assertEqual(aligner.score(seq1, seq2), expected)
+
+    def test_affine(self):
+        aligner = Aligner(gap_open=-3, gap_extend=-1)
+        self.assertEqual(aligner.score("GATTACA", "GCATGCU"),
+                         gotoh_score("GATTACA", "GCATGCU", 1, -1, -3, -1))
+        self.assertEqual(aligner.align("GATTACA", "GCATGCU")[2],
+                         aligner.score("GATTACA", "GCATGCU"))
+        with self.assertRaises(ValueError):
+            Aligner(gap_open=-3, mode="local")
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            Aligner(mode="circular")
+        with self.assertRaises(ValueError):
+            Aligner(engine="quantum")
+        for engine in ("hirschberg", "banded", "pointers", "wavefront"):
+            for mode in ("local", "semiglobal"):
+                with self.assertRaises(ValueError):
+                    Aligner(mode=mode, engine=engine)
+
+    def test_engines_agree(self):
+        results = {}
+        for engine in ("full", "pointers", "hirschberg", "banded"):
+            results[engine] = Aligner(engine=engine).align("GATTACA", "GCATGCU")
+        self.assertEqual(results["full"], results["pointers"])
+        for engine in ("hirschberg", "banded"):
+            self.assertEqual(results[engine][2], results["full"][2])
+        self.assertEqual(results["hirschberg"][:2],
+                         hirschberg("GATTACA", "GCATGCU"))
+
+    def test_local_align_returns_region_score(self):
+        aligner = Aligner(mode="local")
+        align1, align2, score = aligner.align("TTTGATTACATTT", "CCGATTACACC")
+        self.assertEqual(score, best_alignment_end("TTTGATTACATTT", "CCGATTACACC")[0])
+        self.assertEqual(align1, "GATTACA")
+        self.assertEqual(align1, align2)
+        self.assertEqual(aligner.align_region("TTTGATTACATTT", "CCGATTACACC"),
+                         (align1, align2, score, (3, 10, 2, 9)))
+        self.assertEqual(Aligner(engine="hirschberg").align_region("GATTACA", "GCATGCU")[3],
+                         (0, 7, 0, 7))
+
+    def test_align_many_reuses_workspace(self):
+        pairs = _random_pairs(5, 30)
+        aligner = Aligner(engine="pointers")
+        self.assertEqual(list(aligner.align_many(pairs)),
+                         [needleman_wunsch(a, b) for a, b in pairs])
+        row, pointers = aligner._row, aligner._pointers
+        alignments = list(aligner.align_many(pairs, alignments=True))
+        self.assertIs(aligner._row, row)
+        self.assertIs(aligner._pointers, pointers)
+        self.assertEqual(alignments, [Aligner(engine="full").align(a, b) for a, b in pairs])
+
+    def test_workspace_shrinks_and_grows(self):
+        row = [99] * 50
+        self.assertEqual(_dp_last_row("ACGT", "AGT", row=row)[0],
+                         _dp_last_row("ACGT", "AGT")[0])
+        self.assertEqual(len(row), 4)
+        buffer = bytearray(b"\xff" * 3)
+        pointers, stride, score = _fill_pointers("ACGT", "AGT", 1, -1, -1, None, buffer)
+        self.assertIs(pointers, buffer)
+        self.assertEqual(len(buffer), stride * 5)
+        self.assertEqual(score, _fill_pointers("ACGT", "AGT", 1, -1, -1)[2])
+
+    def test_wrappers(self):
+        self.assertEqual(needleman_wunsch("GATTACA", "GCATGCU"), 0)
+        self.assertEqual(score_pair("GATTACA", "GCATGCU", gap_open=-3, gap_extend=-1),
+                         gotoh_score("GATTACA", "GCATGCU", 1, -1, -3, -1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+import random
+import subprocess
+from main import (find_anchors, chain_anchors, anchored_alignment, alignment_score,
+                  needleman_wunsch, gotoh_score, Aligner, load_substitution_matrix)
+
+def _mutate(rng, seq, rate):
+    out = []
+    for c in seq:
+        roll = rng.random()
+        if roll < rate / 3:
+            continue
+        out.append(rng.choice("ACGT") if roll < 2 * rate / 3 else c)
+        if rate * 2 / 3 <= roll < rate:
+            out.append(rng.choice("ACGT"))
+    return "".join(out)
+
+class TestAnchors(unittest.TestCase):
+    def test_unique_seeds_merged(self):
+        seq = "ACGTTGCATGCAAGTC"
+        self.assertEqual(find_anchors(seq, seq, 6), [(0, 0, len(seq))])
+        self.assertEqual(find_anchors("TTACGTAA", "GGGACGTCC", 4), [(2, 3, 4)])
+        # k-mers repetidos em uma das sequências não viram sementes
+        self.assertEqual(find_anchors("ACGTACGT", "ACGT", 4), [])
+        self.assertEqual(find_anchors("ACG", "ACG", 4), [])
+
+    def test_chain(self):
+        anchors = [(0, 0, 5), (2, 20, 10), (6, 6, 4), (12, 12, 3), (13, 1, 2)]
+        self.assertEqual(chain_anchors(anchors), [(0, 0, 5), (6, 6, 4), (12, 12, 3)])
+        self.assertEqual(len(chain_anchors([(0, 0, 5), (3, 3, 5)])), 1)
+        self.assertEqual(chain_anchors([]), [])
+
+    def test_chain_is_optimal(self):
+        rng = random.Random(2)
+        for _ in range(100):
+            anchors = sorted((rng.randint(0, 50), rng.randint(0, 50), rng.randint(1, 8))
+                             for _ in range(rng.randint(1, 8)))
+            best = {}
+            for n, (i, j, length) in enumerate(anchors):
+                best[n] = length + max([best[p] for p, (pi, pj, pl) in enumerate(anchors[:n])
+                                        if pi + pl <= i and pj + pl <= j], default=0)
+            chain = chain_anchors(anchors)
+            self.assertEqual(sum(length for _, _, length in chain), max(best.values()))
+            for (i, j, length), (ni, nj, _) in zip(chain, chain[1:]):
+                self.assertLessEqual(i + length, ni)
+                self.assertLessEqual(j + length, nj)
+
+class TestAnchoredAlignment(unittest.TestCase):
+    def test_valid_global_alignment(self):
+        rng = random.Random(7)
+        for _ in range(60):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 300)))
+            seq2 = _mutate(rng, seq1, rng.random() * 0.2)
+            align1, align2, score = anchored_alignment(seq1, seq2, k=rng.choice([6, 10, 15]))
+            self.assertEqual(align1.replace("-", ""), seq1)
+            self.assertEqual(align2.replace("-", ""), seq2)
+            self.assertEqual(score, alignment_score(align1, align2))
+            self.assertLessEqual(score, needleman_wunsch(seq1, seq2))
+
+    def test_exact_on_identical_flanks(self):
+        rng = random.Random(8)
+        flank = "".join(rng.choice("ACGT") for _ in range(200))
+        seq1, seq2 = flank + "GATTACA" + flank[::-1], flank + "GCATGCT" + flank[::-1]
+        self.assertEqual(anchored_alignment(seq1, seq2)[2], needleman_wunsch(seq1, seq2))
+        blosum = load_substitution_matrix("BLOSUM62")
+        protein = "MKTAYIAKQRQISFVKSHFSRQLEERLGLIEVQAPILSRVGDGTQDNLSGAEKAVQVKVKALPDAQ"
+        variant = protein[:30] + "W" + protein[31:]
+        self.assertEqual(anchored_alignment(protein, variant, gap_val=-8, subst=blosum, k=5)[2],
+                         needleman_wunsch(protein, variant, gap_val=-8, subst=blosum))
+
+    def test_aligner_affine(self):
+        rng = random.Random(9)
+        seq1 = "".join(rng.choice("ACGT") for _ in range(400))
+        seq2 = _mutate(rng, seq1, 0.05)
+        align1, align2, score = Aligner(gap_open=-3, gap_extend=-1, engine="anchored",
+                                        seed=8).align(seq1, seq2)
+        self.assertEqual(align1.replace("-", ""), seq1)
+        self.assertLessEqual(score, gotoh_score(seq1, seq2, 1, -1, -3, -1))
+        with self.assertRaises(ValueError):
+            Aligner(mode="local", engine="anchored")
+
+    def test_cli(self):
+        fasta = "test_data/seqalignx_test_47_very_long.fasta"
+        cmd = ["python", "main.py", "--seq1", fasta, "--seq2", fasta, "--no-cache",
+               "--quiet", "--engine", "anchored"]
+        output = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(output.returncode, 0)
+        self.assertIn("âncoras", output.stdout)
+        score_only = subprocess.run(cmd + ["--score-only"], capture_output=True, text=True)
+        self.assertEqual(output.stdout.split("Score de Alinhamento:")[1].split()[0],
+                         score_only.stdout.split("Score de Alinhamento:")[1].split()[0])
+        local = subprocess.run(cmd + ["--mode", "local"], capture_output=True, text=True)
+        self.assertNotEqual(local.returncode, 0)
+
+if __name__ == "__main__":
+    unittest.main()
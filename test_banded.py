@@ -0,0 +1,57 @@
+import unittest
+import random
+from main import (banded_needleman_wunsch, needleman_wunsch, alignment_score,
+                  parse_args)
+
+def _mutate(rng, seq, rate):
+    out = []
+    for base in seq:
+        r = rng.random()
+        if r < rate / 3:
+            continue  # deleção
+        if r < 2 * rate / 3:
+            out.append(rng.choice("ACGT"))  # inserção
+        out.append(rng.choice("ACGT") if r < rate else base)
+    return "".join(out)
+
+class TestBanded(unittest.TestCase):
+    def _check(self, seq1, seq2, match=1, mismatch=-1, gap=-1, band=2):
+        align1, align2, score = banded_needleman_wunsch(
+            seq1, seq2, match, mismatch, gap, band)
+        self.assertEqual(align1.replace("-", ""), seq1)
+        self.assertEqual(align2.replace("-", ""), seq2)
+        self.assertEqual(score, needleman_wunsch(seq1, seq2, match, mismatch, gap))
+        self.assertEqual(alignment_score(align1, align2, match, mismatch, gap), score)
+
+    def test_identical(self):
+        align1, align2, score = banded_needleman_wunsch("GATTACA", "GATTACA", band=1)
+        self.assertEqual((align1, align2, score), ("GATTACA", "GATTACA", 7))
+
+    def test_near_identical_pairs(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(50, 200)))
+            self._check(seq1, _mutate(rng, seq1, 0.1))
+            self._check(seq1, _mutate(rng, seq1, 0.1), 2, -1, -2)
+
+    def test_unrelated_pairs_widen_to_exact(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            self._check(seq1, seq2, band=1)
+            self._check(seq1, seq2, 1, -3, -1, band=1)
+
+    def test_substring(self):
+        seq1 = "ACGTTGCAACGGTACCATGA" * 3
+        self._check(seq1, seq1[10:40])
+        self._check(seq1[10:40], seq1)
+
+    def test_cli_args(self):
+        args = parse_args(["--seq1", "a.fasta", "--seq2", "b.fasta",
+                           "--engine", "banded", "--band", "4"])
+        self.assertEqual(args.engine, "banded")
+        self.assertEqual(args.band, 4)
+
+if __name__ == "__main__":
+    unittest.main()
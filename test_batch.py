@@ -0,0 +1,89 @@
+import unittest
+import os
+import subprocess
+import tempfile
+from main import iter_batch_pairs, run_batch, needleman_wunsch, parse_args
+
+SEQS = ["GATTACA", "GCATGCU", "ACGTACGT", "TTTT"]
+
+class TestBatchPairs(unittest.TestCase):
+    def test_pairwise(self):
+        pairs = list(iter_batch_pairs("pairwise", SEQS[:2], SEQS[2:]))
+        self.assertEqual([(i, j) for i, j, _, _ in pairs], [(0, 0), (1, 1)])
+        self.assertEqual(pairs[1][2:], ("GCATGCU", "TTTT"))
+
+    def test_query_vs_database(self):
+        pairs = list(iter_batch_pairs("query", SEQS[:2], SEQS))
+        self.assertEqual(len(pairs), 8)
+        self.assertEqual(pairs[5][:2], (1, 1))
+
+    def test_all_vs_all_upper_triangle(self):
+        pairs = list(iter_batch_pairs("all", SEQS))
+        self.assertEqual([(i, j) for i, j, _, _ in pairs],
+                         [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)])
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            list(iter_batch_pairs("other", SEQS))
+
+
+class TestRunBatch(unittest.TestCase):
+    def _expected(self):
+        return {(i, j): needleman_wunsch(s1, s2)
+                for i, j, s1, s2 in iter_batch_pairs("all", SEQS)}
+
+    def test_inline_worker(self):
+        results = run_batch(iter_batch_pairs("all", SEQS), workers=1, chunk_size=4)
+        self.assertEqual({(i, j): s for i, j, s in results}, self._expected())
+
+    def test_process_pool(self):
+        results = run_batch(iter_batch_pairs("all", SEQS), workers=2, chunk_size=1)
+        self.assertEqual({(i, j): s for i, j, s in results}, self._expected())
+
+    def test_cli_args(self):
+        args = parse_args(["--seq1", "a.fasta", "--batch", "all",
+                           "--workers", "3", "--chunk-size", "8"])
+        self.assertEqual(args.batch, "all")
+        self.assertIsNone(args.seq2)
+        self.assertEqual(args.workers, 3)
+        self.assertEqual(args.chunk_size, 8)
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a.fasta", "--batch", "query"])
+
+    def test_cli_batch_run(self):
+        cmd = [
+            "python", "main.py",
+            "--seq1", "test_data/seqalignx_test_11_high_similarity.fasta",
+            "--seq2", "test_data/seqalignx_test_12_high_similarity.fasta",
+            "--batch", "query", "--workers", "2"
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        lines = result.stdout.strip().split("\n")
+        self.assertEqual(lines[0], "seq1\tseq2\tscore")
+        self.assertEqual(len(lines), 5)
+        names = {tuple(line.split("\t")[:2]) for line in lines[1:]}
+        self.assertIn(("seqalignx_test_11_high_similarity_seq1",
+                       "seqalignx_test_12_high_similarity_seq2"), names)
+
+    def test_cli_closed_pipe_exits_quietly(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "many.fasta")
+            with open(path, "w") as f:
+                for k in range(200):
+                    f.write(f">s{k}\nACGTACGT\n")
+            cmd = ["python", "main.py", "--seq1", path, "--batch", "all",
+                   "--workers", "1", "--no-cache"]
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    text=True)
+            # O leitor fecha o pipe depois da primeira linha, como `| head -n 1`
+            proc.stdout.readline()
+            proc.stdout.close()
+            stderr = proc.stderr.read()
+            proc.wait()
+        self.assertNotIn("Traceback", stderr)
+        self.assertNotIn("Exception ignored", stderr)
+        self.assertEqual(proc.returncode, 1)
+
+if __name__ == "__main__":
+    unittest.main()
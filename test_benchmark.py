@@ -0,0 +1,60 @@
+import unittest
+import os
+import json
+from benchmark import (parse_args, generate_pair, run_benchmark,
+                       find_regressions, main_benchmark, should_skip)
+
+class TestBenchmark(unittest.TestCase):
+    def setUp(self):
+        self.output = "test_temp_benchmark.json"
+
+    def tearDown(self):
+        if os.path.exists(self.output):
+            os.remove(self.output)
+
+    def test_pairs_are_deterministic(self):
+        self.assertEqual(generate_pair(50, 0.8, 1), generate_pair(50, 0.8, 1))
+        self.assertNotEqual(generate_pair(50, 0.8, 1), generate_pair(50, 0.8, 2))
+        seq1, seq2 = generate_pair(50, 1.0, 1)
+        self.assertEqual(seq1, seq2)
+
+    def test_run_records_each_phase(self):
+        args = parse_args(["--lengths", "30", "--similarities", "0.5",
+                           "--engines", "full", "needleman_wunsch",
+                           "--repeat", "1"])
+        report = run_benchmark(args)
+        phases = [r["phase"] for r in report["results"]]
+        self.assertEqual(phases, ["create_score_matrix", "fill_score_matrix",
+                                  "traceback", "needleman_wunsch"])
+        self.assertTrue(all(r["peak_bytes"] > 0 for r in report["results"]))
+        self.assertEqual(report["meta"]["seed"], 42)
+
+    def test_budget(self):
+        args = parse_args(["--max-cells", "100", "--max-matrix-cells", "10"])
+        self.assertTrue(should_skip("full", 50, 1.0, args))
+        self.assertFalse(should_skip("hirschberg", 50, 0.5, args))
+        self.assertTrue(should_skip("hirschberg", 500, 0.5, args))
+        self.assertFalse(should_skip("banded", 500, 0.95, args))
+
+    def test_regression_threshold(self):
+        base = {"results": [{"engine": "e", "phase": "p", "length": 1,
+                             "similarity": 1.0, "seconds": 1.0}]}
+        slow = {"results": [dict(base["results"][0], seconds=1.5)]}
+        self.assertEqual(len(find_regressions(base, slow, 10)), 1)
+        self.assertEqual(find_regressions(base, slow, 60), [])
+
+    def test_cli_fails_on_regression(self):
+        argv = ["--lengths", "20", "--similarities", "1.0", "--engines",
+                "needleman_wunsch", "--repeat", "1", "--no-memory",
+                "--output", self.output]
+        self.assertEqual(main_benchmark(argv), 0)
+        with open(self.output) as f:
+            report = json.load(f)
+        for result in report["results"]:
+            result["seconds"] /= 1000
+        with open(self.output, "w") as f:
+            json.dump(report, f)
+        self.assertEqual(main_benchmark(argv + ["--baseline", self.output]), 1)
+
+if __name__ == "__main__":
+    unittest.main()
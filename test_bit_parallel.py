@@ -0,0 +1,47 @@
+import unittest
+import random
+from main import (bit_parallel_kind, bit_parallel_score, myers_edit_distance,
+                  lcs_length, needleman_wunsch, _nw_last_row)
+
+def _levenshtein(a, b):
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        diag, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            diag, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, diag + (ca != cb))
+    return row[-1]
+
+class TestBitParallel(unittest.TestCase):
+    def test_kind(self):
+        self.assertEqual(bit_parallel_kind(0, -1, -1), "edit")
+        self.assertEqual(bit_parallel_kind(2, -1, -2), "edit")
+        self.assertEqual(bit_parallel_kind(1, -3, -1), "lcs")
+        self.assertIsNone(bit_parallel_kind(1, -1, -1))
+        self.assertIsNone(bit_parallel_score("ACGT", "AGT"))
+
+    def test_known_values(self):
+        self.assertEqual(myers_edit_distance("kitten", "sitting"), 3)
+        self.assertEqual(myers_edit_distance("", "ACGT"), 4)
+        self.assertEqual(myers_edit_distance("ACGT", ""), 4)
+        self.assertEqual(lcs_length("AGGTAB", "GXTXAYB"), 4)
+        self.assertEqual(lcs_length("", "ACGT"), 0)
+
+    def test_edit_distance_random(self):
+        rng = random.Random(4)
+        for _ in range(200):
+            a = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 90)))
+            b = "".join(rng.choice("ACGTN") for _ in range(rng.randint(0, 90)))
+            self.assertEqual(myers_edit_distance(a, b), _levenshtein(a, b))
+
+    def test_matches_dynamic_programming(self):
+        rng = random.Random(9)
+        schemes = [(0, -1, -1), (2, -1, -2), (4, 0, -2), (1, -3, -1), (3, -7, -2)]
+        for _ in range(100):
+            a = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 80)))
+            b = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 80)))
+            for scheme in schemes:
+                self.assertEqual(needleman_wunsch(a, b, *scheme),
+                                 _nw_last_row(a, b, *scheme)[-1])
+
+if __name__ == "__main__":
+    unittest.main()
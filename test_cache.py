@@ -0,0 +1,140 @@
+import unittest
+import os
+import shutil
+import subprocess
+import tempfile
+from main import (AlignmentCache, open_cache, cache_key, run_batch, iter_batch_pairs,
+                  needleman_wunsch, load_substitution_matrix, parse_args,
+                  CACHE_FILE_NAME)
+
+class TestCacheKey(unittest.TestCase):
+    def test_depends_on_sequences_and_params(self):
+        base = cache_key("ACGT", "AGT")
+        self.assertEqual(base, cache_key("ACGT", "AGT", 1, -1, -1))
+        self.assertNotEqual(base, cache_key("AGT", "ACGT"))
+        self.assertNotEqual(base, cache_key("ACGT", "AGT", gap_val=-2))
+        self.assertNotEqual(base, cache_key("ACGT", "AGT", mode="local"))
+        self.assertNotEqual(base, cache_key("ACGT", "AGT", gap_open=-3))
+        blosum = load_substitution_matrix("BLOSUM62")
+        self.assertNotEqual(base, cache_key("ACGT", "AGT", subst=blosum))
+        self.assertNotEqual(base, cache_key("ACGT", "AGT", engine="banded"))
+        self.assertNotEqual(cache_key("ACGT", "AGT", engine="banded", band=4),
+                            cache_key("ACGT", "AGT", engine="banded", band=8))
+
+class TestAlignmentCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_persists_across_instances(self):
+        with AlignmentCache(self.dir) as cache:
+            cache.put("k", 7, {"alignment": ["AC-GT", "ACCGT"]})
+            self.assertEqual(cache.get("k"), (7, {"alignment": ["AC-GT", "ACCGT"]}))
+            self.assertIsNone(cache.get("outra"))
+        with AlignmentCache(self.dir) as cache:
+            self.assertEqual(cache.get("k"), (7, {"alignment": ["AC-GT", "ACCGT"]}))
+
+    def test_score_only_put_keeps_extra(self):
+        with AlignmentCache(self.dir) as cache:
+            cache.put("k", 3, {"end": [1, 2]})
+            cache.put("k", 3)
+            self.assertEqual(cache.get("k"), (3, {"end": [1, 2]}))
+        with AlignmentCache(self.dir, memory_entries=0) as cache:
+            cache.put("k", 3)
+            self.assertEqual(cache.get("k"), (3, {"end": [1, 2]}))
+
+    def test_memory_layer_is_bounded(self):
+        with AlignmentCache(self.dir, memory_entries=2) as cache:
+            for n in range(5):
+                cache.put(f"k{n}", n)
+            self.assertEqual(list(cache._memory), ["k3", "k4"])
+            self.assertEqual(cache.get("k0"), (0, None))
+
+    def test_evicts_least_recently_used(self):
+        with AlignmentCache(self.dir, max_entries=3, memory_entries=0) as cache:
+            for n in range(3):
+                cache.put(f"k{n}", n)
+            cache.get("k0")
+            cache.put("k3", 3)
+            cache.flush()
+            self.assertIsNone(cache.get("k1"))
+            self.assertEqual(cache.get("k0"), (0, None))
+
+    def test_unwritable_dir_degrades(self):
+        path = os.path.join(self.dir, "arquivo")
+        with open(path, "w") as f:
+            f.write("x")
+        self.assertIsNone(open_cache(path))
+
+    def test_batch_uses_cache(self):
+        seqs = ["GATTACA", "GCATGCU", "ACGT"]
+        with AlignmentCache(self.dir) as cache:
+            # Entrada forjada: prova que o par não foi recalculado
+            cache.put(cache_key("GATTACA", "GCATGCU"), 99)
+            results = {(i, j): s for i, j, s in
+                       run_batch(iter_batch_pairs("all", seqs), workers=1, cache=cache)}
+            self.assertEqual(results[0, 1], 99)
+            self.assertEqual(results[1, 2], needleman_wunsch("GCATGCU", "ACGT"))
+            self.assertEqual(cache.get(cache_key("GCATGCU", "ACGT"))[0], results[1, 2])
+
+    def test_batch_streams_hits(self):
+        seqs = ["GATTACA", "GCATGCU", "ACGT", "TTGA"]
+        with AlignmentCache(self.dir) as cache:
+            list(run_batch(iter_batch_pairs("all", seqs), workers=1, cache=cache))
+            consumed = []
+
+            def pairs():
+                for pair in iter_batch_pairs("all", seqs):
+                    consumed.append(pair[:2])
+                    yield pair
+
+            for workers in (1, 2):
+                consumed.clear()
+                results = run_batch(pairs(), workers=workers, cache=cache)
+                # Cada acerto sai assim que é consultado, sem reter a entrada
+                for n, (i, j, score) in enumerate(results, 1):
+                    self.assertEqual(len(consumed), n)
+                    self.assertEqual(score, needleman_wunsch(seqs[i], seqs[j]))
+                self.assertEqual(len(consumed), 6)
+
+    def test_cli_second_run_hits(self):
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_36_with_gaps.fasta",
+               "--seq2", "test_data/seqalignx_test_37_with_gaps.fasta",
+               "--quiet", "--cache-dir", self.dir]
+        first = subprocess.run(cmd, capture_output=True, text=True)
+        second = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(second.returncode, 0)
+        self.assertNotIn("recuperado do cache", first.stdout)
+        self.assertIn("recuperado do cache", second.stdout)
+        self.assertEqual(first.stdout.split("Score de Alinhamento:")[1],
+                         second.stdout.split("Score de Alinhamento:")[1])
+
+    def test_cli_engine_is_part_of_key(self):
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_36_with_gaps.fasta",
+               "--seq2", "test_data/seqalignx_test_37_with_gaps.fasta",
+               "--quiet", "--cache-dir", self.dir]
+        subprocess.run(cmd, capture_output=True, text=True)
+        banded = subprocess.run(cmd + ["--engine", "banded"], capture_output=True,
+                                text=True)
+        self.assertNotIn("recuperado do cache", banded.stdout)
+        self.assertIn("banded", banded.stdout)
+
+    def test_cli_no_cache(self):
+        subdir = os.path.join(self.dir, "novo")
+        args = parse_args(["--seq1", "a", "--seq2", "b", "--no-cache",
+                           "--cache-dir", subdir])
+        self.assertTrue(args.no_cache)
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_01_identical.fasta",
+               "--seq2", "test_data/seqalignx_test_01_identical.fasta",
+               "--score-only", "--no-cache", "--cache-dir", subdir]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertFalse(os.path.exists(os.path.join(subdir, CACHE_FILE_NAME)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import random
+import subprocess
+from main import (CheckpointedMatrix, checkpoint_alignment, create_score_matrix,
+                  fill_score_matrix, traceback_region, find_alignment_end, Aligner,
+                  load_substitution_matrix, MODES)
+
+def _reference(seq1, seq2, match=1, mismatch=-1, gap=-1, subst=None, mode="global"):
+    matrix = create_score_matrix(seq1, seq2, gap, mode)
+    fill_score_matrix(matrix, seq1, seq2, match, mismatch, gap, subst, mode)
+    align1, align2, region = traceback_region(matrix, seq1, seq2, match, mismatch,
+                                              gap, subst, mode)
+    end_i, end_j = find_alignment_end(matrix, mode)
+    return align1, align2, matrix[end_i][end_j], region
+
+class TestCheckpointedMatrix(unittest.TestCase):
+    def test_rows_match_full_matrix(self):
+        seq1, seq2 = "GATTACAGATTACA", "GCATGCUAGT"
+        expected = fill_score_matrix(create_score_matrix(seq1, seq2), seq1, seq2)
+        matrix = CheckpointedMatrix(seq1, seq2, interval=4)
+        self.assertEqual(sorted(matrix.checkpoints), [0, 4, 8, 12])
+        self.assertEqual(len(matrix), len(expected))
+        for i in reversed(range(len(expected))):
+            self.assertEqual(matrix[i], expected[i])
+        self.assertLessEqual(len(matrix._block), 5)
+
+    def test_default_interval_is_sqrt(self):
+        matrix = CheckpointedMatrix("A" * 100, "ACGT")
+        self.assertEqual(matrix.interval, 10)
+        self.assertEqual(len(matrix.checkpoints), 11)
+
+class TestCheckpointAlignment(unittest.TestCase):
+    def test_identical_to_traceback(self):
+        rng = random.Random(22)
+        for _ in range(60):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 45)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 45)))
+            for mode in MODES:
+                for scheme in [(1, -1, -1), (2, -1, -2), (1, 0, 0)]:
+                    expected = _reference(seq1, seq2, *scheme, mode=mode)
+                    for interval in (None, 1, 5):
+                        self.assertEqual(
+                            checkpoint_alignment(seq1, seq2, *scheme, mode=mode,
+                                                 interval=interval),
+                            expected)
+
+    def test_substitution_matrix(self):
+        blosum = load_substitution_matrix("BLOSUM62")
+        seq1, seq2 = "HEAGAWGHEE" * 3, "PAWHEAE" * 3
+        self.assertEqual(checkpoint_alignment(seq1, seq2, gap_val=-8, subst=blosum),
+                         _reference(seq1, seq2, gap=-8, subst=blosum))
+
+    def test_aligner_engine(self):
+        aligner = Aligner(mode="local", engine="checkpoint")
+        self.assertEqual(aligner.align("TTTGATTACATTT", "CCGATTACACC"),
+                         Aligner(mode="local").align("TTTGATTACATTT", "CCGATTACACC"))
+
+    def test_cli_engine(self):
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_36_with_gaps.fasta",
+               "--seq2", "test_data/seqalignx_test_37_with_gaps.fasta",
+               "--quiet", "--no-cache", "--mode", "local"]
+        full = subprocess.run(cmd + ["--engine", "full"], capture_output=True, text=True)
+        checkpoint = subprocess.run(cmd + ["--engine", "checkpoint"],
+                                    capture_output=True, text=True)
+        self.assertEqual(checkpoint.returncode, 0)
+        self.assertIn("checkpoints", checkpoint.stdout)
+        self.assertEqual(full.stdout.split("Score de Alinhamento:")[1],
+                         checkpoint.stdout.split("Score de Alinhamento:")[1])
+        auto = subprocess.run(cmd + ["--max-cells", "100"], capture_output=True, text=True)
+        self.assertIn("checkpoints", auto.stdout)
+
+if __name__ == "__main__":
+    unittest.main()
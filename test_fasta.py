@@ -1,6 +1,7 @@
 import unittest
 import os
-from main import read_fasta
+import gzip
+from main import read_fasta, iter_fasta, fasta_record_name
 
 class TestFastaParsing(unittest.TestCase):
     def setUp(self):
@@ -43,5 +44,51 @@ class TestFastaParsing(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             read_fasta("non_existent.fasta")
 
+class TestIterFasta(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_temp_iter.fasta"
+
+    def tearDown(self):
+        if os.path.exists(self.test_file):
+            os.remove(self.test_file)
+
+    def test_yields_headers_and_sequences(self):
+        content = ">seq1 primeira\nACGT\nAC\n\n>seq2\nTGCA\n"
+        with open(self.test_file, "w") as f:
+            f.write(content)
+
+        records = list(iter_fasta(self.test_file))
+        self.assertEqual(records, [("seq1 primeira", "ACGTAC"), ("seq2", "TGCA")])
+
+    def test_is_lazy(self):
+        with open(self.test_file, "w") as f:
+            f.write(">a\nAC\n>b\nGT\n")
+
+        records = iter_fasta(self.test_file)
+        self.assertEqual(next(records), ("a", "AC"))
+        records.close()
+
+    def test_skips_empty_records(self):
+        with open(self.test_file, "w") as f:
+            f.write(">vazio\n>cheio\nAC\n")
+
+        self.assertEqual(list(iter_fasta(self.test_file)), [("cheio", "AC")])
+
+    def test_gzip_input(self):
+        with gzip.open(self.test_file, "wt") as f:
+            f.write(">seq1\nACGT\n>seq2\nTT\n")
+
+        self.assertEqual(list(iter_fasta(self.test_file)),
+                         [("seq1", "ACGT"), ("seq2", "TT")])
+        self.assertEqual(read_fasta(self.test_file), ["ACGT", "TT"])
+
+    def test_record_name(self):
+        self.assertEqual(fasta_record_name("chr1 Homo sapiens"), "chr1")
+        self.assertEqual(fasta_record_name(""), "")
+
+    def test_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            list(iter_fasta("non_existent.fasta"))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import os
+import subprocess
+from main import (build_fasta_index, load_fasta_index, IndexedFasta,
+                  parse_sequence_spec, load_records)
+
+CONTENT = ">chr1 primeiro\nACGTA\nCGTAC\nGT\n>chr2\nTTTTGGGG\nCC\n>chr3\nA\n"
+
+class TestFastaIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_file = "test_temp_index.fasta"
+        with open(self.test_file, "w") as f:
+            f.write(CONTENT)
+
+    def tearDown(self):
+        for path in (self.test_file, self.test_file + ".fai"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_build_index(self):
+        entries = build_fasta_index(self.test_file)
+        self.assertEqual(entries, [
+            ("chr1", 12, 15, 5, 6),
+            ("chr2", 10, 36, 8, 9),
+            ("chr3", 1, 54, 1, 2),
+        ])
+        self.assertTrue(os.path.exists(self.test_file + ".fai"))
+        self.assertEqual(load_fasta_index(self.test_file), entries)
+
+    def test_irregular_lines(self):
+        with open(self.test_file, "w") as f:
+            f.write(">a\nAC\nACGT\nAC\n")
+        with self.assertRaises(ValueError):
+            build_fasta_index(self.test_file)
+
+    def test_fetch(self):
+        with IndexedFasta(self.test_file) as fasta:
+            self.assertEqual(fasta.names(), ["chr1", "chr2", "chr3"])
+            self.assertEqual(fasta.fetch("chr1"), "ACGTACGTACGT")
+            self.assertEqual(fasta.fetch("chr1", 4, 8), "TACGT")
+            self.assertEqual(fasta.fetch("chr2", 8, 100), "GCC")
+            self.assertEqual(fasta.fetch("chr3"), "A")
+            with self.assertRaises(KeyError):
+                fasta.fetch("chrX")
+            with self.assertRaises(ValueError):
+                fasta.fetch("chr1", 0, 3)
+
+    def test_parse_sequence_spec(self):
+        self.assertEqual(parse_sequence_spec(self.test_file),
+                         (self.test_file, None, None, None))
+        self.assertEqual(parse_sequence_spec(self.test_file + ":chr2"),
+                         (self.test_file, "chr2", None, None))
+        self.assertEqual(parse_sequence_spec(self.test_file + ":chr2:3-6"),
+                         (self.test_file, "chr2", 3, 6))
+
+    def test_load_records(self):
+        self.assertEqual(list(load_records(self.test_file + ":chr2:3-6")),
+                         [("chr2:3-6", "TTGG")])
+        self.assertEqual(len(list(load_records(self.test_file))), 3)
+
+    def test_cli_record_spec(self):
+        cmd = [
+            "python", "main.py",
+            "--seq1", self.test_file + ":chr1:1-5",
+            "--seq2", self.test_file + ":chr2",
+            "--score-only"
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("(Tamanho: 5)", result.stdout)
+        self.assertIn("(Tamanho: 10)", result.stdout)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import random
+from main import (create_score_matrix, fill_score_matrix, traceback,
+                  needleman_wunsch, hirschberg, alignment_score,
+                  select_engine, parse_args, Aligner, load_substitution_matrix)
+
+class TestHirschberg(unittest.TestCase):
+    def _check(self, seq1, seq2, match=1, mismatch=-1, gap=-1):
+        align1, align2 = hirschberg(seq1, seq2, match, mismatch, gap)
+        self.assertEqual(len(align1), len(align2))
+        self.assertEqual(align1.replace("-", ""), seq1)
+        self.assertEqual(align2.replace("-", ""), seq2)
+        expected = needleman_wunsch(seq1, seq2, match, mismatch, gap)
+        self.assertEqual(alignment_score(align1, align2, match, mismatch, gap),
+                         expected)
+
+    def test_identical_sequences(self):
+        align1, align2 = hirschberg("GATTACA", "GATTACA")
+        self.assertEqual(align1, "GATTACA")
+        self.assertEqual(align2, "GATTACA")
+
+    def test_empty_sequences(self):
+        self.assertEqual(hirschberg("", ""), ("", ""))
+        self.assertEqual(hirschberg("ACG", ""), ("ACG", "---"))
+        self.assertEqual(hirschberg("", "ACG"), ("---", "ACG"))
+
+    def test_matches_full_matrix_score(self):
+        rng = random.Random(42)
+        for _ in range(20):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(1, 120)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(1, 120)))
+            self._check(seq1, seq2)
+            self._check(seq1, seq2, 2, -3, -2)
+
+    def test_same_alignment_as_traceback_for_small_pairs(self):
+        seq1, seq2 = "GATTACA", "GCATGCU"
+        matrix = fill_score_matrix(create_score_matrix(seq1, seq2), seq1, seq2)
+        self.assertEqual(hirschberg(seq1, seq2), traceback(matrix, seq1, seq2))
+
+    def test_same_alignment_as_traceback_randomized(self):
+        rng = random.Random(7)
+        blosum = load_substitution_matrix("BLOSUM62")
+        # Alfabetos pequenos e pontuações com zeros geram muitos empates
+        for _ in range(150):
+            seq1 = "".join(rng.choice("ACG") for _ in range(rng.randint(0, 140)))
+            seq2 = "".join(rng.choice("ACG") for _ in range(rng.randint(0, 140)))
+            for match, mismatch, gap in [(1, -1, -1), (2, -1, -2), (1, 0, 0), (0, -1, -1)]:
+                expected = Aligner(match, mismatch, gap, engine="full").align(seq1, seq2)
+                self.assertEqual(hirschberg(seq1, seq2, match, mismatch, gap),
+                                 expected[:2])
+            expected = Aligner(gap_val=-4, subst=blosum, engine="full").align(seq1, seq2)
+            self.assertEqual(hirschberg(seq1, seq2, gap_val=-4, subst=blosum), expected[:2])
+
+    def test_select_engine(self):
+        self.assertEqual(select_engine("auto", "A" * 10, "A" * 10, 1000), "full")
+        self.assertEqual(select_engine("auto", "A" * 100, "A" * 100, 1000),
+                         "hirschberg")
+        self.assertEqual(select_engine("full", "A" * 100, "A" * 100, 1000), "full")
+
+    def test_cli_engine_args(self):
+        args = parse_args(["--seq1", "a.fasta", "--seq2", "b.fasta",
+                           "--engine", "hirschberg", "--max-cells", "500"])
+        self.assertEqual(args.engine, "hirschberg")
+        self.assertEqual(args.max_cells, 500)
+
+if __name__ == "__main__":
+    unittest.main()
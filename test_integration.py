@@ -27,6 +27,31 @@ class TestIntegration(unittest.TestCase):
         self.assertIn("Score de Alinhamento:", result.stdout)
         self.assertIn("Alinhamento concluído!", result.stdout)
 
+    def test_run_with_hirschberg_engine(self):
+        cmd = [
+            "python", "main.py",
+            "--seq1", "test_data/seqalignx_test_01_identical.fasta",
+            "--seq2", "test_data/seqalignx_test_01_identical.fasta",
+            "--engine", "hirschberg"
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Score de Alinhamento: 120", result.stdout)
+        self.assertIn("Alinhamento concluído!", result.stdout)
+
+    def test_run_score_only(self):
+        cmd = [
+            "python", "main.py",
+            "--seq1", "test_data/seqalignx_test_01_identical.fasta",
+            "--seq2", "test_data/seqalignx_test_01_identical.fasta",
+            "--score-only"
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Score de Alinhamento: 120", result.stdout)
+        self.assertNotIn("Alinhamento Reconstruído", result.stdout)
+        self.assertNotIn("Matriz de Pontuação", result.stdout)
+
     def test_invalid_file(self):
         cmd = [
             "python", "main.py",
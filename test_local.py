@@ -0,0 +1,96 @@
+import unittest
+import random
+from main import (create_score_matrix, fill_score_matrix, fill_score_matrix_numpy,
+                  traceback, traceback_region, best_alignment_end, score_pair,
+                  needleman_wunsch, alignment_score, parse_args, np)
+
+def _full(seq1, seq2, mode, match=1, mismatch=-1, gap=-1):
+    matrix = create_score_matrix(seq1, seq2, gap, mode)
+    return fill_score_matrix(matrix, seq1, seq2, match, mismatch, gap, mode=mode)
+
+def _brute_local(seq1, seq2, match=1, mismatch=-1, gap=-1):
+    # Melhor alinhamento global entre quaisquer substrings (inclusive vazias)
+    return max(needleman_wunsch(seq1[a:b], seq2[c:d], match, mismatch, gap)
+               for a in range(len(seq1) + 1) for b in range(a, len(seq1) + 1)
+               for c in range(len(seq2) + 1) for d in range(c, len(seq2) + 1))
+
+class TestLocal(unittest.TestCase):
+    def test_embedded_motif(self):
+        seq1, seq2 = "TTTTGATTACATTTT", "CCGATTACACC"
+        matrix = _full(seq1, seq2, "local")
+        align1, align2, region = traceback_region(matrix, seq1, seq2, mode="local")
+        self.assertEqual((align1, align2), ("GATTACA", "GATTACA"))
+        self.assertEqual(region, (4, 11, 2, 9))
+        self.assertEqual(best_alignment_end(seq1, seq2, mode="local"), (7, 11, 9))
+
+    def test_no_similarity_is_empty(self):
+        matrix = _full("AAAA", "CCCC", "local")
+        self.assertEqual(traceback(matrix, "AAAA", "CCCC", mode="local"), ("", ""))
+        self.assertEqual(score_pair("AAAA", "CCCC", mode="local"), 0)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(15):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 9)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 9)))
+            expected = _brute_local(seq1, seq2, 2, -1, -2)
+            self.assertEqual(score_pair(seq1, seq2, 2, -1, -2, mode="local"), expected)
+
+    def test_region_and_score_consistent(self):
+        rng = random.Random(8)
+        for _ in range(20):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(1, 60)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(1, 60)))
+            for mode in ("local", "semiglobal"):
+                matrix = _full(seq1, seq2, mode, 2, -1, -2)
+                align1, align2, (s1, e1, s2, e2) = traceback_region(
+                    matrix, seq1, seq2, 2, -1, -2, mode=mode)
+                self.assertEqual(align1.replace("-", ""), seq1[s1:e1])
+                self.assertEqual(align2.replace("-", ""), seq2[s2:e2])
+                score, end1, end2 = best_alignment_end(seq1, seq2, 2, -1, -2,
+                                                       mode=mode)
+                self.assertEqual((end1, end2), (e1, e2))
+                self.assertEqual(matrix[e1][e2], score)
+                self.assertEqual(alignment_score(align1, align2, 2, -1, -2), score)
+
+class TestSemiglobal(unittest.TestCase):
+    def test_free_end_gaps(self):
+        seq1, seq2 = "GATTACA", "TTTGATTACATTT"
+        matrix = _full(seq1, seq2, "semiglobal")
+        align1, align2, region = traceback_region(matrix, seq1, seq2,
+                                                  mode="semiglobal")
+        self.assertEqual((align1, align2), ("GATTACA", "GATTACA"))
+        self.assertEqual(region, (0, 7, 3, 10))
+        self.assertEqual(score_pair(seq1, seq2, mode="semiglobal"), 7)
+        self.assertLess(needleman_wunsch(seq1, seq2), 7)
+
+    def test_global_default_unchanged(self):
+        matrix = _full("GATTACA", "GCATGCU", "global")
+        self.assertEqual(traceback(matrix, "GATTACA", "GCATGCU"),
+                         traceback(matrix, "GATTACA", "GCATGCU", mode="global"))
+        self.assertEqual(best_alignment_end("GATTACA", "GCATGCU", mode="global"),
+                         (needleman_wunsch("GATTACA", "GCATGCU"), 7, 7))
+
+@unittest.skipIf(np is None, "NumPy não instalado")
+class TestModesNumpy(unittest.TestCase):
+    def test_numpy_matches_python(self):
+        rng = random.Random(21)
+        for _ in range(10):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            for mode in ("local", "semiglobal"):
+                expected = _full(seq1, seq2, mode, 2, -1, -2)
+                result = fill_score_matrix_numpy(seq1, seq2, 2, -1, -2, mode=mode)
+                self.assertEqual(result.tolist(), expected)
+
+class TestModeArgs(unittest.TestCase):
+    def test_default_global(self):
+        self.assertEqual(parse_args(["--seq1", "a", "--seq2", "b"]).mode, "global")
+
+    def test_affine_requires_global(self):
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--seq2", "b", "--mode", "local",
+                        "--gap-open", "-5"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import io
+import os
+import ast
+import subprocess
+from array import array
+from contextlib import redirect_stdout
+from main import (create_score_matrix, fill_score_matrix, print_matrix,
+                  write_matrix_npy, parse_matrix_window, parse_args,
+                  MAX_PRINT_CELLS, np)
+
+def _matrix(seq1, seq2):
+    return fill_score_matrix(create_score_matrix(seq1, seq2), seq1, seq2)
+
+def _read_npy(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    header_len = int.from_bytes(data[8:10], "little")
+    header = ast.literal_eval(data[10:10 + header_len].decode("latin-1"))
+    values = array("i", data[10 + header_len:])
+    rows, cols = header["shape"]
+    return header, [list(values[r * cols:(r + 1) * cols]) for r in range(rows)]
+
+class TestMatrixWindow(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(parse_matrix_window("1:5,2:3"), (1, 5, 2, 3))
+        self.assertEqual(parse_matrix_window(":10,5:"), (None, 10, 5, None))
+        with self.assertRaises(Exception):
+            parse_matrix_window("1-5")
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--seq2", "b", "--matrix-window", "x"])
+
+    def test_print_window(self):
+        matrix = _matrix("GATTACA", "GCATGCU")
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_matrix(matrix, "GATTACA", "GCATGCU", (1, 3, 0, 2))
+        lines = output.getvalue().strip().splitlines()
+        self.assertEqual(lines[0], "Matriz de Pontuação:")
+        self.assertEqual(lines[2:], ["G  -1   1", "A  -2   0"])
+
+    def test_size_guard(self):
+        side = int(MAX_PRINT_CELLS ** 0.5) + 1
+        matrix = _matrix("A" * side, "A" * side)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            print_matrix(matrix, "A" * side, "A" * side)
+        self.assertIn("--matrix-window", output.getvalue())
+        self.assertEqual(len(output.getvalue().strip().splitlines()), 1)
+
+class TestMatrixDump(unittest.TestCase):
+    def setUp(self):
+        self.path = "test_temp_matrix.npy"
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def test_npy_roundtrip(self):
+        matrix = _matrix("GATTACA", "GCATGCU")
+        self.assertEqual(write_matrix_npy(matrix, self.path), (8, 8))
+        header, values = _read_npy(self.path)
+        self.assertEqual(header["descr"], "<i4")
+        self.assertEqual(values, matrix)
+        with open(self.path, "rb") as f:
+            self.assertEqual(f.read(6), b"\x93NUMPY")
+
+    def test_npy_window(self):
+        matrix = _matrix("GATTACA", "GCATGCU")
+        self.assertEqual(write_matrix_npy(matrix, self.path, (2, 5, None, 3)), (3, 3))
+        self.assertEqual(_read_npy(self.path)[1], [row[:3] for row in matrix[2:5]])
+
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    def test_numpy_load(self):
+        matrix = _matrix("GATTACA", "GCATGCU")
+        write_matrix_npy(np.array(matrix, dtype=np.int32), self.path, (None, None, 1, None))
+        self.assertEqual(np.load(self.path).tolist(), [row[1:] for row in matrix])
+
+    def test_cli_matrix_is_opt_in(self):
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_46_very_short.fasta",
+               "--seq2", "test_data/seqalignx_test_46_very_short.fasta",
+               "--engine", "full", "--no-cache"]
+        default = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertNotIn("Matriz de Pontuação", default.stdout)
+        shown = subprocess.run(cmd + ["--show-matrix", "--dump-matrix", self.path],
+                               capture_output=True, text=True)
+        self.assertIn("Matriz de Pontuação", shown.stdout)
+        self.assertTrue(os.path.exists(self.path))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import random
+from unittest import mock
+import main
+from main import (create_score_matrix, fill_score_matrix, traceback,
+                  fill_score_matrix_numpy, select_backend, get_alignment_score)
+
+@unittest.skipIf(main.np is None, "NumPy não instalado")
+class TestNumpyBackend(unittest.TestCase):
+    def test_matches_python_matrix(self):
+        rng = random.Random(3)
+        for _ in range(25):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 40)))
+            for match, mismatch, gap in [(1, -1, -1), (2, -3, -2)]:
+                expected = create_score_matrix(seq1, seq2, gap)
+                expected = fill_score_matrix(expected, seq1, seq2, match, mismatch, gap)
+                matrix = fill_score_matrix_numpy(seq1, seq2, match, mismatch, gap)
+                self.assertEqual(matrix.dtype, main.np.int32)
+                self.assertTrue(matrix.flags["C_CONTIGUOUS"])
+                self.assertEqual(matrix.tolist(), expected)
+
+    def test_traceback_accepts_ndarray(self):
+        seq1, seq2 = "GATTACA", "GCATGCU"
+        expected = fill_score_matrix(create_score_matrix(seq1, seq2), seq1, seq2)
+        matrix = fill_score_matrix_numpy(seq1, seq2)
+        self.assertEqual(traceback(matrix, seq1, seq2),
+                         traceback(expected, seq1, seq2))
+        self.assertEqual(get_alignment_score(matrix), 0)
+
+    def test_auto_prefers_numpy(self):
+        self.assertEqual(select_backend("auto"), "numpy")
+
+
+class TestBackendFallback(unittest.TestCase):
+    def test_auto_falls_back_to_python(self):
+        with mock.patch.object(main, "np", None):
+            self.assertEqual(select_backend("auto"), "python")
+            self.assertEqual(select_backend("python"), "python")
+
+    def test_numpy_requested_without_numpy(self):
+        with mock.patch.object(main, "np", None):
+            with self.assertRaises(ImportError):
+                select_backend("numpy")
+            with self.assertRaises(ImportError):
+                fill_score_matrix_numpy("ACGT", "ACGT")
+
+if __name__ == "__main__":
+    unittest.main()
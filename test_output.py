@@ -0,0 +1,108 @@
+import unittest
+import io
+import os
+import json
+import subprocess
+import re
+import shutil
+import tempfile
+from main import alignment_cigar, RecordWriter, BATCH_RECORD_FIELDS, parse_args
+
+RECORD = {"seq1": "ref", "seq2": "qry", "score": 3, "start1": 0, "end1": 7,
+          "start2": 0, "end2": 6, "cigar": "2=1D1X3="}
+
+class TestCigar(unittest.TestCase):
+    def test_operations(self):
+        self.assertEqual(alignment_cigar("GATTACA", "GAT-ACA"), "3=1D3=")
+        self.assertEqual(alignment_cigar("GA--CA", "GATTCG"), "2=2I1=1X")
+        self.assertEqual(alignment_cigar("", ""), "")
+        self.assertEqual(alignment_cigar("ACG", "ACG", 2, 1), "2S3=1S")
+
+    def test_lengths_add_up(self):
+        cigar = alignment_cigar("AC-GTTA", "ACCG-TG")
+        self.assertEqual(cigar, "2=1I1=1D1=1X")
+
+class TestRecordWriter(unittest.TestCase):
+    def test_tsv_header_and_missing_fields(self):
+        stream = io.StringIO()
+        writer = RecordWriter(stream, "tsv")
+        writer.write(dict(RECORD, start1=None, cigar=None))
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(lines[0].split("\t")[:3], ["seq1", "seq2", "score"])
+        self.assertEqual(lines[1], "ref\tqry\t3\t*\t7\t0\t6\t*")
+
+    def test_jsonl(self):
+        stream = io.StringIO()
+        writer = RecordWriter(stream, "jsonl", BATCH_RECORD_FIELDS)
+        writer.write(RECORD)
+        writer.write(dict(RECORD, score=5))
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(records, [{"seq1": "ref", "seq2": "qry", "score": 3},
+                                   {"seq1": "ref", "seq2": "qry", "score": 5}])
+
+    def test_cigar_sam_like(self):
+        stream = io.StringIO()
+        RecordWriter(stream, "cigar").write(dict(RECORD, start1=4))
+        self.assertEqual(stream.getvalue(), "qry\tref\t5\t2=1D1X3=\tAS:i:3\n")
+
+class TestOutputCli(unittest.TestCase):
+    def setUp(self):
+        self.output = "test_temp_output.jsonl"
+
+    def tearDown(self):
+        if os.path.exists(self.output):
+            os.remove(self.output)
+
+    def test_args(self):
+        self.assertEqual(parse_args(["--seq1", "a", "--seq2", "b"]).format, "text")
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--seq2", "b", "--output", "x.tsv"])
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--batch", "all", "--format", "cigar"])
+
+    def test_jsonl_to_file(self):
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_01_identical.fasta",
+               "--seq2", "test_data/seqalignx_test_01_identical.fasta",
+               "--format", "jsonl", "--output", self.output, "--no-cache"]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, "")
+        with open(self.output) as f:
+            record = json.loads(f.read())
+        self.assertEqual(record["score"], 120)
+        self.assertEqual(record["cigar"], "120=")
+        self.assertEqual((record["start1"], record["end1"]), (0, 120))
+
+    def test_local_cigar_soft_clips(self):
+        directory = tempfile.mkdtemp()
+        ref, query = os.path.join(directory, "ref.fasta"), os.path.join(directory, "qry.fasta")
+        with open(ref, "w") as f:
+            f.write(">ref\nGGGGGGGGACGTACGTACGTGGGGGG\n")
+        with open(query, "w") as f:
+            f.write(">qry\nTTTACGTACGTACGTTT\n")
+        try:
+            cmd = ["python", "main.py", "--seq1", ref, "--seq2", query,
+                   "--mode", "local", "--format", "cigar", "--no-cache"]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(result.stdout, "qry\tref\t9\t3S12=2S\tAS:i:12\n")
+        # As operações que consomem a consulta somam o tamanho dela
+        ops = re.findall(r"(\d+)([=XIDS])", result.stdout.split("\t")[3])
+        self.assertEqual(sum(int(n) for n, op in ops if op in "=XIS"), 17)
+
+    def test_batch_jsonl_stream(self):
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_11_high_similarity.fasta",
+               "--seq2", "test_data/seqalignx_test_12_high_similarity.fasta",
+               "--batch", "query", "--workers", "1", "--format", "jsonl",
+               "--no-cache"]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        records = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual(len(records), 4)
+        self.assertEqual(set(records[0]), {"seq1", "seq2", "score"})
+
+if __name__ == "__main__":
+    unittest.main()
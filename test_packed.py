@@ -0,0 +1,90 @@
+import unittest
+import pickle
+import random
+import subprocess
+from main import PackedSequence, iter_batch_pairs, run_batch, needleman_wunsch, np
+
+class TestPackedSequence(unittest.TestCase):
+    def test_roundtrip(self):
+        for seq in ["", "A", "ACGT", "GATTACA", "ACGTNNNNNNACGT", "acgtRYKM", "NNNN",
+                    "ACGTacgtnnNNryRYacgt", "aÁçgt"]:
+            packed = PackedSequence(seq)
+            self.assertEqual(str(packed), seq)
+            self.assertEqual(len(packed), len(seq))
+            self.assertEqual(packed.encode(), seq.encode("latin-1"))
+
+    def test_quarter_memory(self):
+        packed = PackedSequence("ACGT" * 1000)
+        self.assertEqual(packed.nbytes, 1000)
+        # Uma corrida de N ocupa um único caractere de exceção
+        self.assertEqual(PackedSequence("ACGT" + "N" * 996).nbytes, 250 + 1)
+
+    def test_soft_masked_bases_stay_packed(self):
+        seq = "ACGT" * 100 + "acgtn" * 100 + "ACGT" * 100
+        packed = PackedSequence(seq)
+        self.assertEqual(str(packed), seq)
+        # Só a corrida de n (um caractere por trecho) fica fora dos 2 bits
+        self.assertLess(packed.nbytes, len(seq) // 4 + 101)
+        part = packed[395:520]
+        self.assertEqual(str(part), seq[395:520])
+        self.assertEqual([part[i] for i in range(len(part))], list(seq[395:520]))
+        self.assertEqual(pickle.loads(pickle.dumps(part)), seq[395:520])
+        self.assertEqual(needleman_wunsch(str(packed[390:410]), "acgt"),
+                         needleman_wunsch(seq[390:410], "acgt"))
+
+    def test_indexing(self):
+        seq = "ACGTNNRYACGTACGTanNrryACgt"
+        packed = PackedSequence(seq)
+        for i in range(-len(seq), len(seq)):
+            self.assertEqual(packed[i], seq[i])
+        with self.assertRaises(IndexError):
+            packed[len(seq)]
+
+    def test_slices_share_buffer(self):
+        rng = random.Random(6)
+        seq = "".join(rng.choice("ACGTACGTN") for _ in range(200))
+        packed = PackedSequence(seq)
+        for _ in range(100):
+            a, b = rng.randint(-10, 210), rng.randint(-10, 210)
+            part = packed[a:b]
+            self.assertEqual(str(part), seq[a:b])
+            self.assertEqual(str(part[2:-3]), seq[a:b][2:-3])
+            self.assertIs(part._buffer.obj, packed._buffer.obj)
+        self.assertEqual(packed[::3], seq[::3])
+
+    def test_pickle_is_compact(self):
+        seq = "ACGT" * 2500
+        packed = PackedSequence(seq)[3:9000]
+        data = pickle.dumps(packed)
+        self.assertEqual(pickle.loads(data), seq[3:9000])
+        self.assertLess(len(data), len(pickle.dumps(seq[3:9000])) // 3)
+
+    @unittest.skipIf(np is None, "NumPy não instalado")
+    def test_numpy_backend_accepts_packed(self):
+        from main import fill_score_matrix_numpy
+        expected = fill_score_matrix_numpy("GATTACA", "GCATGCN")
+        result = fill_score_matrix_numpy(PackedSequence("GATTACA"),
+                                         PackedSequence("GCATGCN"))
+        self.assertEqual(result.tolist(), expected.tolist())
+
+class TestPackedBatch(unittest.TestCase):
+    def test_run_batch_with_packed(self):
+        seqs = ["GATTACA", "GCATGCNN", "ACGTACGT", "TTTT"]
+        packed = [PackedSequence(s) for s in seqs]
+        results = run_batch(iter_batch_pairs("all", packed), workers=2, chunk_size=2)
+        self.assertEqual({(i, j): s for i, j, s in results},
+                         {(i, j): needleman_wunsch(s1, s2)
+                          for i, j, s1, s2 in iter_batch_pairs("all", seqs)})
+
+    def test_cli_packed_matches_plain(self):
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_11_high_similarity.fasta",
+               "--seq2", "test_data/seqalignx_test_12_high_similarity.fasta",
+               "--batch", "query", "--workers", "1"]
+        plain = subprocess.run(cmd, capture_output=True, text=True)
+        packed = subprocess.run(cmd + ["--packed"], capture_output=True, text=True)
+        self.assertEqual(packed.returncode, 0)
+        self.assertEqual(packed.stdout, plain.stdout)
+
+if __name__ == "__main__":
+    unittest.main()
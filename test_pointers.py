@@ -0,0 +1,58 @@
+import unittest
+import random
+import subprocess
+from main import (pointer_needleman_wunsch, create_score_matrix, fill_score_matrix,
+                  traceback, load_substitution_matrix, _fill_pointers, parse_args)
+
+def _reference(seq1, seq2, match=1, mismatch=-1, gap=-1, subst=None):
+    matrix = create_score_matrix(seq1, seq2, gap)
+    fill_score_matrix(matrix, seq1, seq2, match, mismatch, gap, subst)
+    align1, align2 = traceback(matrix, seq1, seq2, match, mismatch, gap, subst)
+    return align1, align2, matrix[-1][-1]
+
+class TestPointers(unittest.TestCase):
+    def test_classic_example(self):
+        self.assertEqual(pointer_needleman_wunsch("GATTACA", "GCATGCU"),
+                         _reference("GATTACA", "GCATGCU"))
+
+    def test_empty_sequences(self):
+        self.assertEqual(pointer_needleman_wunsch("", ""), ("", "", 0))
+        self.assertEqual(pointer_needleman_wunsch("ACG", ""), ("ACG", "---", -3))
+        self.assertEqual(pointer_needleman_wunsch("", "AC"), ("--", "AC", -2))
+
+    def test_identical_to_traceback(self):
+        rng = random.Random(12)
+        for _ in range(100):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 50)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 50)))
+            for scheme in [(1, -1, -1), (2, -1, -2), (1, 0, 0)]:
+                self.assertEqual(pointer_needleman_wunsch(seq1, seq2, *scheme),
+                                 _reference(seq1, seq2, *scheme))
+
+    def test_substitution_matrix(self):
+        blosum = load_substitution_matrix("BLOSUM62")
+        seq1, seq2 = "HEAGAWGHEE", "PAWHEAE"
+        self.assertEqual(pointer_needleman_wunsch(seq1, seq2, gap_val=-8, subst=blosum),
+                         _reference(seq1, seq2, gap=-8, subst=blosum))
+
+    def test_quarter_byte_per_cell(self):
+        pointers, stride, _ = _fill_pointers("A" * 99, "C" * 199, 1, -1, -1)
+        self.assertEqual(stride, 50)
+        self.assertEqual(len(pointers), 100 * 50)
+
+    def test_cli_engine(self):
+        self.assertEqual(parse_args(["--seq1", "a", "--seq2", "b",
+                                     "--engine", "pointers"]).engine, "pointers")
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_36_with_gaps.fasta",
+               "--seq2", "test_data/seqalignx_test_37_with_gaps.fasta", "--quiet"]
+        full = subprocess.run(cmd + ["--engine", "full"], capture_output=True, text=True)
+        packed = subprocess.run(cmd + ["--engine", "pointers"], capture_output=True,
+                                text=True)
+        self.assertEqual(packed.returncode, 0)
+        self.assertIn("ponteiros de 2 bits", packed.stdout)
+        self.assertEqual(full.stdout.split("Score de Alinhamento:")[1].split("Matriz")[0],
+                         packed.stdout.split("Score de Alinhamento:")[1].split("Matriz")[0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+import os
+import random
+import subprocess
+import tempfile
+from main import (minhash_sketch, jaccard_estimate, KmerIndex, open_kmer_index,
+                  prefilter_pairs, needleman_wunsch, parse_args)
+
+def _mutate(rng, seq, rate):
+    return "".join(c if rng.random() > rate else rng.choice("ACGT") for c in seq)
+
+class TestSketch(unittest.TestCase):
+    def test_sketch(self):
+        sketch = minhash_sketch("ACGTACGTTT" * 30, k=5, size=16)
+        self.assertEqual(sketch.typecode, "I")
+        self.assertEqual(list(sketch), sorted(sketch))
+        self.assertLessEqual(len(sketch), 16)
+        self.assertEqual(len(minhash_sketch("ACG", k=5)), 0)
+
+    def test_estimate_close_to_exact(self):
+        rng = random.Random(4)
+        for rate in (0.01, 0.05, 0.2):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(3000))
+            seq2 = _mutate(rng, seq1, rate)
+            kmers1 = {seq1[i:i + 11] for i in range(len(seq1) - 10)}
+            kmers2 = {seq2[i:i + 11] for i in range(len(seq2) - 10)}
+            exact = len(kmers1 & kmers2) / len(kmers1 | kmers2)
+            estimate = jaccard_estimate(minhash_sketch(seq1, 11, 256),
+                                        minhash_sketch(seq2, 11, 256), 256)
+            self.assertAlmostEqual(estimate, exact, delta=0.1)
+        sketch = minhash_sketch(seq1)
+        self.assertEqual(jaccard_estimate(sketch, sketch), 1.0)
+        self.assertIsNone(jaccard_estimate(sketch, minhash_sketch("ACG")))
+
+class TestKmerIndex(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "ref.kmi")
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rmdir(os.path.dirname(self.path))
+
+    def test_roundtrip(self):
+        rng = random.Random(5)
+        seqs = ["".join(rng.choice("ACGT") for _ in range(rng.randint(0, 400)))
+                for _ in range(20)]
+        index = KmerIndex(k=7, sketch_size=32)
+        sketches = [index.sketch(seq) for seq in seqs]
+        self.assertEqual(sketches[3], minhash_sketch(seqs[3], 7, 32))
+        self.assertTrue(index.modified)
+        index.save(self.path)
+        self.assertFalse(index.modified)
+
+        loaded = open_kmer_index(self.path, 7, 32)
+        self.assertEqual(len(loaded), len(set(seqs)))
+        self.assertEqual([loaded.sketch(seq) for seq in seqs], sketches)
+        self.assertFalse(loaded.modified)
+        with self.assertRaises(ValueError):
+            open_kmer_index(self.path, 11, 32)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 4)
+        with self.assertRaises(ValueError):
+            KmerIndex.load(self.path)
+
+    def test_prefilter_pairs(self):
+        sketches = [minhash_sketch(seq, 5) for seq in
+                    ("ACGTTGCAAGGT" * 5, "ACGTTGCAAGGT" * 5, "CCCCCCCCCC", "AC")]
+        pairs = [(0, j, None, None) for j in range(4)]
+        estimates, filtered = {}, []
+        kept = list(prefilter_pairs(pairs, sketches, sketches, 0.5, 128,
+                                    estimates, filtered))
+        self.assertEqual([pair[1] for pair in kept], [0, 1, 3])
+        self.assertEqual(filtered, [(0, 2, 0.0)])
+        self.assertEqual(estimates, {(0, 0): 1.0, (0, 1): 1.0, (0, 3): None})
+
+class TestPrefilterCli(unittest.TestCase):
+    def test_args(self):
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--seq2", "b", "--prefilter", "0.1"])
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--batch", "all", "--prefilter", "2"])
+
+    def test_all_vs_all(self):
+        rng = random.Random(6)
+        base = "".join(rng.choice("ACGT") for _ in range(300))
+        seqs = [base, _mutate(rng, base, 0.02),
+                "".join(rng.choice("ACGT") for _ in range(300))]
+        directory = tempfile.mkdtemp()
+        fasta = os.path.join(directory, "multi.fasta")
+        index = os.path.join(directory, "multi.kmi")
+        with open(fasta, "w") as f:
+            for n, seq in enumerate(seqs):
+                f.write(f">s{n}\n{seq}\n")
+        try:
+            cmd = ["python", "main.py", "--seq1", fasta, "--batch", "all", "--no-cache",
+                   "--workers", "1", "--prefilter", "0.2", "--kmer-index", index]
+            for _ in range(2):
+                output = subprocess.run(cmd, capture_output=True, text=True)
+                rows = {tuple(line.split("\t")[:2]): line.split("\t")[2:]
+                        for line in output.stdout.splitlines()[1:]}
+                self.assertEqual(rows["s0", "s1"][0],
+                                 str(needleman_wunsch(seqs[0], seqs[1])))
+                self.assertEqual(rows["s0", "s2"][0], "*")
+                self.assertEqual(rows["s1", "s2"][0], "*")
+                self.assertIn("2 par(es) descartado(s)", output.stderr)
+                self.assertTrue(os.path.exists(index))
+        finally:
+            for path in (fasta, index):
+                if os.path.exists(path):
+                    os.remove(path)
+            os.rmdir(directory)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import os
+import json
+import pstats
+import subprocess
+import tempfile
+from main import PhaseProfiler, profile_phase, parse_args
+
+class TestPhaseProfiler(unittest.TestCase):
+    def test_records_phase(self):
+        profiler = PhaseProfiler()
+        with profiler.phase("fill", cells=1000) as record:
+            data = [0] * 10000
+        self.assertIs(profiler.phases[0], record)
+        self.assertEqual(record["name"], "fill")
+        self.assertGreater(record["seconds"], 0)
+        self.assertGreater(record["gcups"], 0)
+        self.assertGreaterEqual(record["peak_bytes"], 8 * len(data))
+
+    def test_without_memory(self):
+        profiler = PhaseProfiler(memory=False)
+        with profiler.phase("read"):
+            pass
+        self.assertIsNone(profiler.phases[0]["peak_bytes"])
+        self.assertIsNone(profiler.phases[0]["gcups"])
+        self.assertIsInstance(profiler.phases[0]["allocated_blocks"], int)
+
+    def test_phase_without_profiler(self):
+        with profile_phase(None, "nada") as record:
+            record["cells"] = 10
+        summary = PhaseProfiler().summary()
+        self.assertEqual(summary["phases"], [])
+        self.assertIn("python", summary)
+
+class TestProfileCli(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for name in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir, name))
+        os.rmdir(self.dir)
+
+    def test_args(self):
+        args = parse_args(["--seq1", "a", "--seq2", "b"])
+        self.assertIsNone(args.profile)
+        self.assertIsNone(args.cprofile)
+
+    def test_json_and_prof_files(self):
+        summary_path = os.path.join(self.dir, "perfil.json")
+        prof_path = os.path.join(self.dir, "perfil.prof")
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_36_with_gaps.fasta",
+               "--seq2", "test_data/seqalignx_test_37_with_gaps.fasta",
+               "--engine", "full", "--no-cache", "--quiet",
+               "--profile", summary_path, "--cprofile", prof_path]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        with open(summary_path) as f:
+            summary = json.load(f)
+        names = [phase["name"] for phase in summary["phases"]]
+        self.assertEqual(names[0], "read_fasta")
+        self.assertIn("traceback", names)
+        fill = [p for p in summary["phases"] if p["name"].startswith("fill_score_matrix")]
+        self.assertGreater(fill[0]["cells"], 0)
+        self.assertGreater(pstats.Stats(prof_path).total_calls, 0)
+
+    def test_batch_counts_cells(self):
+        summary_path = os.path.join(self.dir, "batch.json")
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_11_high_similarity.fasta",
+               "--batch", "all", "--workers", "1", "--no-cache",
+               "--profile", summary_path]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        with open(summary_path) as f:
+            phase = json.load(f)["phases"][0]
+        self.assertEqual(phase["name"], "run_batch")
+        self.assertGreater(phase["cells"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
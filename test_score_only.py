@@ -0,0 +1,31 @@
+import unittest
+import random
+from main import (create_score_matrix, fill_score_matrix, get_alignment_score,
+                  needleman_wunsch, parse_args)
+
+class TestScoreOnly(unittest.TestCase):
+    def test_matches_full_matrix(self):
+        rng = random.Random(7)
+        for _ in range(30):
+            seq1 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 60)))
+            seq2 = "".join(rng.choice("ACGT") for _ in range(rng.randint(0, 60)))
+            for match, mismatch, gap in [(1, -1, -1), (2, -1, -2), (5, -4, -3)]:
+                matrix = create_score_matrix(seq1, seq2, gap)
+                matrix = fill_score_matrix(matrix, seq1, seq2, match, mismatch, gap)
+                self.assertEqual(
+                    needleman_wunsch(seq1, seq2, match, mismatch, gap),
+                    get_alignment_score(matrix))
+
+    def test_empty_sequences(self):
+        self.assertEqual(needleman_wunsch("", ""), 0)
+        self.assertEqual(needleman_wunsch("ACGT", ""), -4)
+        self.assertEqual(needleman_wunsch("", "AC", gap_val=-2), -4)
+
+    def test_cli_flag(self):
+        args = parse_args(["--seq1", "a.fasta", "--seq2", "b.fasta"])
+        self.assertFalse(args.score_only)
+        args = parse_args(["--seq1", "a.fasta", "--seq2", "b.fasta", "--score-only"])
+        self.assertTrue(args.score_only)
+
+if __name__ == "__main__":
+    unittest.main()
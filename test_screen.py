@@ -0,0 +1,104 @@
+import unittest
+import random
+import shutil
+import subprocess
+import tempfile
+from main import (screen_score, needleman_wunsch, score_pair, Aligner, run_batch,
+                  open_cache, load_substitution_matrix, parse_args)
+
+UNRELATED = "test_data/seqalignx_test_50_unrelated.fasta"
+
+def _random_pairs(seed, count, max_len=40):
+    rng = random.Random(seed)
+    return [("".join(rng.choice("ACGT") for _ in range(rng.randint(0, max_len))),
+             "".join(rng.choice("ACGT") for _ in range(rng.randint(0, max_len))))
+            for _ in range(count)]
+
+class TestScreenScore(unittest.TestCase):
+    def test_exact_above_threshold(self):
+        for seq1, seq2 in _random_pairs(5, 60):
+            for scheme in [(1, -1, -1), (2, -1, -2), (0, -1, -1), (5, -4, -10)]:
+                score = needleman_wunsch(seq1, seq2, *scheme)
+                for min_score in (score - 3, score, score + 1, None):
+                    screened = screen_score(seq1, seq2, *scheme, min_score=min_score)
+                    if min_score is not None and score < min_score:
+                        self.assertIsNone(screened)
+                    else:
+                        self.assertEqual(screened, score)
+
+    def test_substitution_matrix(self):
+        blosum = load_substitution_matrix("BLOSUM62")
+        score = score_pair("HEAGAWGHEE", "PAWHEAE", gap_val=-8, subst=blosum)
+        self.assertEqual(screen_score("HEAGAWGHEE", "PAWHEAE", gap_val=-8, subst=blosum,
+                                      min_score=score), score)
+        self.assertIsNone(screen_score("HEAGAWGHEE", "PAWHEAE", gap_val=-8,
+                                       subst=blosum, min_score=score + 1))
+
+    def test_xdrop_is_lower_bound(self):
+        for seq1, seq2 in _random_pairs(8, 60):
+            score = needleman_wunsch(seq1, seq2)
+            self.assertEqual(screen_score(seq1, seq2, xdrop=len(seq1) + len(seq2) + 2),
+                             score)
+            pruned = screen_score(seq1, seq2, xdrop=2)
+            if pruned is not None:
+                self.assertLessEqual(pruned, score)
+
+    def test_xdrop_keeps_similar_pairs(self):
+        seq = "ACGTTGCA" * 20
+        self.assertEqual(screen_score(seq, seq[:80] + "T" + seq[80:], xdrop=5),
+                         needleman_wunsch(seq, seq[:80] + "T" + seq[80:]))
+        self.assertIsNone(screen_score("A" * 50, "C" * 50, xdrop=0))
+
+    def test_xdrop_follows_previous_row(self):
+        # O score global só cai, mas nenhum caminho se afasta do máximo da linha
+        self.assertEqual(screen_score("A" * 100, "A" * 50, xdrop=10), 0)
+        self.assertEqual(screen_score("A" * 50, "A" * 100, xdrop=10), 0)
+        self.assertEqual(screen_score("A" * 50, "C" * 50, xdrop=5), -50)
+
+class TestScreenAligner(unittest.TestCase):
+    def test_aligner(self):
+        aligner = Aligner(min_score=0)
+        self.assertIsNone(aligner.score("AAAA", "CCCC"))
+        self.assertIsNone(aligner.align("AAAA", "CCCC"))
+        self.assertEqual(aligner.align("GATTACA", "GATTACA")[2], 7)
+        self.assertEqual(list(Aligner(2, -1, -1, min_score=5).align_many(
+            [("ACGT", "ACGT"), ("ACGT", "TTTT")])), [8, None])
+        with self.assertRaises(ValueError):
+            Aligner(mode="local", min_score=3)
+        with self.assertRaises(ValueError):
+            Aligner(gap_open=-3, gap_extend=-1, xdrop=5)
+
+    def test_batch_and_cache(self):
+        pairs = [(0, n, seq1, seq2) for n, (seq1, seq2) in enumerate(_random_pairs(9, 30))]
+        expected = {n: needleman_wunsch(seq1, seq2) for _, n, seq1, seq2 in pairs}
+        directory = tempfile.mkdtemp()
+        try:
+            cache = open_cache(directory)
+            for _ in range(2):
+                results = {j: score for _, j, score in run_batch(
+                    pairs, workers=1, cache=cache, min_score=-5)}
+                self.assertEqual(results, {n: score if score >= -5 else None
+                                           for n, score in expected.items()})
+            cache.close()
+        finally:
+            shutil.rmtree(directory)
+
+class TestScreenCli(unittest.TestCase):
+    def test_args(self):
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--seq2", "b", "--min-score", "3",
+                        "--mode", "local"])
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--seq2", "b", "--xdrop", "-1"])
+
+    def test_unrelated_pair_rejected(self):
+        cmd = ["python", "main.py", "--seq1", UNRELATED, "--batch", "all",
+               "--no-cache", "--workers", "1"]
+        rejected = subprocess.run(cmd + ["--min-score", "20"],
+                                  capture_output=True, text=True)
+        self.assertEqual(rejected.stdout.splitlines()[1].split("\t")[2], "*")
+        kept = subprocess.run(cmd + ["--min-score", "0"], capture_output=True, text=True)
+        self.assertEqual(kept.stdout.splitlines()[1].split("\t")[2], "0")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+import unittest
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import tempfile
+from unittest import mock
+from server import (parse_args, parse_request, solve_requests, AlignmentServer,
+                    LINE_LIMIT)
+from main import needleman_wunsch, Aligner
+
+class TestRequests(unittest.TestCase):
+    def test_parse_request(self):
+        request = parse_request(b'{"id": 7, "seq1": "gattaca", "seq2": "GCATGCU", '
+                                b'"gap": -2, "mode": "local", "align": true}')
+        self.assertEqual(request["id"], 7)
+        self.assertEqual(request["seq1"], "gattaca")
+        self.assertTrue(request["align"])
+        self.assertEqual(dict(request["options"]), {"gap_val": -2, "mode": "local"})
+
+    def test_invalid_requests_keep_id(self):
+        with self.assertRaises(ValueError):
+            parse_request(b"nao e json")
+        with self.assertRaises(ValueError) as ctx:
+            parse_request(b'{"id": 3, "seq1": "ACGT"}')
+        self.assertEqual(ctx.exception.request_id, 3)
+        with self.assertRaises(ValueError):
+            parse_request(b'{"seq1": "ACGT", "seq2": "ACGT", "gap": "x"}')
+        with self.assertRaises(ValueError):
+            parse_request(b'{"seq1": "ACGT", "seq2": "ACGT"}', max_cells=15)
+
+    def test_solve_requests(self):
+        requests = [parse_request(json.dumps(payload).encode()) for payload in [
+            {"id": 1, "seq1": "GATTACA", "seq2": "GCATGCU"},
+            {"id": 2, "seq1": "GATTACA", "seq2": "GCATGCU", "align": True},
+            {"id": 3, "seq1": "HEAGAWGHEE", "seq2": "PAWHEAE", "matrix": "BLOSUM62",
+             "gap": -8},
+            {"id": 4, "seq1": "ACGT", "seq2": "ACGT", "mode": "circular"},
+        ]]
+        responses = solve_requests(requests)
+        self.assertEqual(responses[0], {"id": 1, "score": needleman_wunsch("GATTACA", "GCATGCU")})
+        align1, align2, score = Aligner().align("GATTACA", "GCATGCU")
+        self.assertEqual((responses[1]["align1"], responses[1]["align2"],
+                          responses[1]["score"]), (align1, align2, score))
+        self.assertIn("cigar", responses[1])
+        self.assertIn("score", responses[2])
+        self.assertEqual(set(responses[3]), {"id", "error"})
+
+    def test_case_matches_cli(self):
+        request = parse_request(b'{"seq1": "gattACA", "seq2": "GATTACA"}')
+        self.assertEqual(solve_requests([request])[0]["score"],
+                         needleman_wunsch("gattACA", "GATTACA"))
+
+    def test_local_region_and_soft_clips(self):
+        request = parse_request(json.dumps({
+            "seq1": "GGGGGGGGACGTACGTACGTGGGGGG", "seq2": "TTTACGTACGTACGTTT",
+            "mode": "local", "align": True}).encode())
+        response = solve_requests([request])[0]
+        # Mesmo registro da CLI (--mode local --format cigar)
+        self.assertEqual(response["cigar"], "3S12=2S")
+        self.assertEqual((response["start1"], response["end1"],
+                          response["start2"], response["end2"]), (8, 20, 3, 15))
+        self.assertEqual(response["score"], 12)
+
+    def test_failure_is_isolated(self):
+        requests = [parse_request(json.dumps({"id": n, "seq1": seq, "seq2": "ACGT"}).encode())
+                    for n, seq in enumerate(["ACGT", "QUEBRA", "AGT"])]
+        score = Aligner.score
+
+        def flaky(aligner, seq1, seq2):
+            if seq1 == "QUEBRA":
+                raise RuntimeError("falha inesperada")
+            return score(aligner, seq1, seq2)
+
+        with mock.patch.object(Aligner, "score", flaky):
+            responses = solve_requests(requests)
+        self.assertEqual(responses[0], {"id": 0, "score": needleman_wunsch("ACGT", "ACGT")})
+        self.assertEqual(responses[1], {"id": 1, "error": "falha inesperada"})
+        self.assertEqual(responses[2], {"id": 2, "score": needleman_wunsch("AGT", "ACGT")})
+
+    def test_args(self):
+        args = parse_args([])
+        self.assertIsNone(args.socket)
+        with self.assertRaises(SystemExit):
+            parse_args(["--queue-size", "0"])
+
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "seqalignx.sock")
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        os.rmdir(self.dir)
+
+    def _exchange(self, lines, **options):
+        async def scenario():
+            async with AlignmentServer(workers=1, **options) as server:
+                listener = await asyncio.start_unix_server(server.handle, self.path,
+                                                           limit=LINE_LIMIT)
+                async with listener:
+                    reader, writer = await asyncio.open_unix_connection(self.path)
+                    writer.write(b"".join(line + b"\n" for line in lines))
+                    await writer.drain()
+                    writer.write_eof()
+                    output = await reader.read()
+                    writer.close()
+            return [json.loads(line) for line in output.splitlines()]
+        return asyncio.run(scenario())
+
+    def test_stream_of_requests(self):
+        pairs = [("GATTACA", "GCATGCU"), ("ACGT", "AGT"), ("", "ACG")]
+        lines = [json.dumps({"id": n, "seq1": a, "seq2": b}).encode()
+                 for n, (a, b) in enumerate(pairs)]
+        responses = self._exchange(lines + [b"{quebrado"], batch_size=2)
+        by_id = {response["id"]: response for response in responses}
+        self.assertEqual(len(responses), 4)
+        for n, (a, b) in enumerate(pairs):
+            self.assertEqual(by_id[n]["score"], needleman_wunsch(a, b))
+        self.assertIn("error", by_id[None])
+
+    def test_backpressure_keeps_every_request(self):
+        lines = [json.dumps({"id": n, "seq1": "ACGT" * 5, "seq2": "AGT" * 5}).encode()
+                 for n in range(50)]
+        responses = self._exchange(lines, batch_size=4, queue_size=2)
+        self.assertEqual(sorted(response["id"] for response in responses), list(range(50)))
+        self.assertEqual({response["score"] for response in responses},
+                         {needleman_wunsch("ACGT" * 5, "AGT" * 5)})
+
+    def test_sigterm_shuts_down_cleanly(self):
+        proc = subprocess.Popen(["python", "server.py", "--socket", self.path,
+                                 "--workers", "2"],
+                                stderr=subprocess.PIPE, text=True)
+        self.assertIn("[OK]", proc.stderr.readline())
+        proc.send_signal(signal.SIGTERM)
+        stderr = proc.stderr.read()
+        self.assertEqual(proc.wait(timeout=30), 0)
+        self.assertNotIn("Exception ignored", stderr)
+        self.assertNotIn("Traceback", stderr)
+        self.assertFalse(os.path.exists(self.path))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+import os
+import random
+import subprocess
+import main
+from main import (SubstitutionMatrix, load_substitution_matrix, build_profile,
+                  create_score_matrix, fill_score_matrix, traceback,
+                  needleman_wunsch, hirschberg, banded_needleman_wunsch,
+                  gotoh, gotoh_score, alignment_score, get_alignment_score,
+                  fill_score_matrix_numpy)
+
+PROTEIN = "ACDEFGHIKLMNPQRSTVWY"
+
+def reference_score(seq1, seq2, subst, gap):
+    """Needleman-Wunsch direto, consultando a matriz por caractere."""
+    m, n = len(seq1), len(seq2)
+    prev = [j * gap for j in range(n + 1)]
+    for i in range(1, m + 1):
+        cur = [i * gap] + [0] * n
+        for j in range(1, n + 1):
+            cur[j] = max(prev[j - 1] + subst.score(seq1[i - 1], seq2[j - 1]),
+                         prev[j] + gap, cur[j - 1] + gap)
+        prev = cur
+    return prev[n]
+
+class TestSubstitutionMatrix(unittest.TestCase):
+    def test_builtin_values(self):
+        blosum = load_substitution_matrix("BLOSUM62")
+        self.assertEqual(blosum.score("W", "W"), 11)
+        self.assertEqual(blosum.score("A", "R"), -1)
+        self.assertEqual(blosum.score("c", "c"), 9)
+        self.assertEqual(blosum.score("J", "A"), 0)  # desconhecido -> X
+        pam = load_substitution_matrix("pam250")
+        self.assertEqual(pam.score("W", "W"), 17)
+        self.assertEqual(pam.score("C", "C"), 12)
+
+    def test_builtins_are_symmetric(self):
+        for name in ("BLOSUM62", "PAM250"):
+            subst = load_substitution_matrix(name)
+            for a in subst.alphabet:
+                for b in subst.alphabet:
+                    self.assertEqual(subst.score(a, b), subst.score(b, a))
+
+    def test_custom_ncbi_file(self):
+        path = "test_temp_matrix.txt"
+        with open(path, "w") as f:
+            f.write("# DNA\n   A  C  G  T\nA  5 -4 -4 -4\nC -4  5 -4 -4\n"
+                    "G -4 -4  5 -4\nT -4 -4 -4  5\n")
+        try:
+            subst = load_substitution_matrix(path)
+            self.assertEqual(subst.score("A", "A"), 5)
+            self.assertEqual(subst.encode("ACGT"), bytes([0, 1, 2, 3]))
+            with self.assertRaises(ValueError):
+                subst.encode("ACGN")
+        finally:
+            os.remove(path)
+
+    def test_invalid_matrix(self):
+        with self.assertRaises(ValueError):
+            SubstitutionMatrix.from_ncbi("   A  C\nA 1 0\n")
+
+    def test_profile(self):
+        profile = build_profile("AAC", "ACG", 2, -1)
+        self.assertEqual(profile[0], [2, -1, -1])
+        self.assertIs(profile[0], profile[1])
+        blosum = load_substitution_matrix("BLOSUM62")
+        self.assertEqual(build_profile("W", "WA", subst=blosum), [[11, -3]])
+
+
+class TestSubstitutionEngines(unittest.TestCase):
+    def setUp(self):
+        self.subst = load_substitution_matrix("BLOSUM62")
+        rng = random.Random(21)
+        self.pairs = [
+            ("".join(rng.choice(PROTEIN) for _ in range(rng.randint(0, 50))),
+             "".join(rng.choice(PROTEIN) for _ in range(rng.randint(0, 50))))
+            for _ in range(15)
+        ]
+
+    def test_engines_agree(self):
+        for seq1, seq2 in self.pairs:
+            expected = reference_score(seq1, seq2, self.subst, -4)
+            self.assertEqual(needleman_wunsch(seq1, seq2, gap_val=-4, subst=self.subst),
+                             expected)
+            matrix = create_score_matrix(seq1, seq2, -4)
+            matrix = fill_score_matrix(matrix, seq1, seq2, gap_val=-4, subst=self.subst)
+            self.assertEqual(get_alignment_score(matrix), expected)
+            align1, align2 = traceback(matrix, seq1, seq2, gap_val=-4, subst=self.subst)
+            self.assertEqual(alignment_score(align1, align2, gap_val=-4, subst=self.subst),
+                             expected)
+            align1, align2 = hirschberg(seq1, seq2, gap_val=-4, subst=self.subst)
+            self.assertEqual(alignment_score(align1, align2, gap_val=-4, subst=self.subst),
+                             expected)
+            self.assertEqual(banded_needleman_wunsch(seq1, seq2, gap_val=-4, band=2,
+                                                     subst=self.subst)[2], expected)
+            self.assertEqual(gotoh(seq1, seq2, gap_open=-4, gap_extend=-4,
+                                   subst=self.subst)[2], expected)
+            self.assertEqual(gotoh_score(seq1, seq2, gap_open=-4, gap_extend=-4,
+                                         subst=self.subst), expected)
+
+    @unittest.skipIf(main.np is None, "NumPy não instalado")
+    def test_numpy_backend(self):
+        for seq1, seq2 in self.pairs:
+            expected = fill_score_matrix(create_score_matrix(seq1, seq2, -4),
+                                         seq1, seq2, gap_val=-4, subst=self.subst)
+            matrix = fill_score_matrix_numpy(seq1, seq2, gap_val=-4, subst=self.subst)
+            self.assertEqual(matrix.tolist(), expected)
+
+    def test_cli_matrix(self):
+        cmd = [
+            "python", "main.py",
+            "--seq1", "test_data/seqalignx_test_51_protein.fasta",
+            "--seq2", "test_data/seqalignx_test_51_protein.fasta",
+            "--matrix", "BLOSUM62", "--quiet"
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("Matriz de substituição: BLOSUM62", result.stdout)
+
+    def test_cli_unknown_matrix(self):
+        cmd = [
+            "python", "main.py",
+            "--seq1", "test_data/seqalignx_test_51_protein.fasta",
+            "--seq2", "test_data/seqalignx_test_51_protein.fasta",
+            "--matrix", "inexistente.txt"
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("Erro", result.stdout)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import random
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from main import (wavefront_last_row, wavefront_hirschberg, _nw_last_row, _fill_tile,
+                  _nw_last_labels,
+                  build_profile, hirschberg, Aligner, load_substitution_matrix,
+                  parse_args, DEFAULT_TILE)
+
+def _random_seq(rng, length):
+    return "".join(rng.choice("ACGT") for _ in range(length))
+
+class TestTiles(unittest.TestCase):
+    def test_tile_matches_rolling_row(self):
+        seq1, seq2 = "GATTACA", "GCATGCU"
+        top = [-j for j in range(len(seq2) + 1)]
+        left = [-i for i in range(len(seq1) + 1)]
+        bottom, right = _fill_tile(top, left, build_profile(seq1, seq2), -1)
+        self.assertEqual(bottom, _nw_last_row(seq1, seq2))
+        self.assertEqual(right[-1], bottom[-1])
+        self.assertEqual(right[0], top[-1])
+
+class TestWavefront(unittest.TestCase):
+    def test_identical_to_sequential(self):
+        rng = random.Random(21)
+        seq1, seq2 = _random_seq(rng, 230), _random_seq(rng, 190)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for tile in (1, 17, 64, 189):
+                self.assertEqual(
+                    wavefront_last_row(seq1, seq2, tile=tile, executor=executor,
+                                       min_cells=0),
+                    _nw_last_row(seq1, seq2))
+            self.assertEqual(
+                wavefront_last_row(seq1, seq2, 2, -1, -2, tile=50, executor=executor,
+                                   min_cells=0),
+                _nw_last_row(seq1, seq2, 2, -1, -2))
+
+    def test_substitution_matrix(self):
+        blosum = load_substitution_matrix("BLOSUM62")
+        seq1, seq2 = "HEAGAWGHEE" * 8, "PAWHEAE" * 9
+        self.assertEqual(
+            wavefront_last_row(seq1, seq2, gap_val=-8, subst=blosum, workers=2,
+                               tile=13, min_cells=0),
+            _nw_last_row(seq1, seq2, gap_val=-8, subst=blosum))
+
+    def test_small_pairs_stay_sequential(self):
+        self.assertEqual(wavefront_last_row("", "ACG"), _nw_last_row("", "ACG"))
+        self.assertEqual(wavefront_last_row("ACGT", "AGT"), _nw_last_row("ACGT", "AGT"))
+
+    def test_hirschberg_with_wavefront(self):
+        rng = random.Random(4)
+        seq1, seq2 = _random_seq(rng, 160), _random_seq(rng, 150)
+        self.assertEqual(wavefront_hirschberg(seq1, seq2, workers=2, tile=40,
+                                              min_cells=0),
+                         hirschberg(seq1, seq2))
+        aligner = Aligner(engine="wavefront", workers=2)
+        self.assertEqual(aligner.align(seq1, seq2), Aligner(engine="hirschberg").align(seq1, seq2))
+
+    def test_same_alignment_as_traceback_on_ties(self):
+        rng = random.Random(9)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            top = _nw_last_row("ACAC", "CACCA" * 20, 1, 0, 0)
+            seq1 = "".join(rng.choice("AC") for _ in range(90))
+            self.assertEqual(
+                wavefront_last_row(seq1, "CACCA" * 20, 1, 0, 0, tile=13,
+                                   executor=executor, min_cells=0, first_row=top),
+                _nw_last_labels(seq1, "CACCA" * 20, 1, 0, 0, first_row=top))
+        for match, mismatch, gap in [(1, -1, -1), (1, 0, 0)]:
+            seq1 = "".join(rng.choice("AC") for _ in range(120))
+            seq2 = "".join(rng.choice("AC") for _ in range(110))
+            expected = Aligner(match, mismatch, gap, engine="full").align(seq1, seq2)
+            self.assertEqual(wavefront_hirschberg(seq1, seq2, match, mismatch, gap,
+                                                  workers=2, tile=17, min_cells=0),
+                             expected[:2])
+
+    def test_cli_engine(self):
+        args = parse_args(["--seq1", "a", "--seq2", "b", "--engine", "wavefront"])
+        self.assertEqual(args.tile, DEFAULT_TILE)
+        with self.assertRaises(SystemExit):
+            parse_args(["--seq1", "a", "--seq2", "b", "--tile", "0"])
+        cmd = ["python", "main.py",
+               "--seq1", "test_data/seqalignx_test_36_with_gaps.fasta",
+               "--seq2", "test_data/seqalignx_test_37_with_gaps.fasta",
+               "--quiet", "--no-cache", "--workers", "2"]
+        wavefront = subprocess.run(cmd + ["--engine", "wavefront"], capture_output=True,
+                                   text=True)
+        linear = subprocess.run(cmd + ["--engine", "hirschberg"], capture_output=True,
+                                text=True)
+        self.assertEqual(wavefront.returncode, 0)
+        self.assertIn("wavefront", wavefront.stdout)
+        self.assertEqual(wavefront.stdout.split("Score de Alinhamento:")[1],
+                         linear.stdout.split("Score de Alinhamento:")[1])
+        score_only = subprocess.run(cmd + ["--engine", "wavefront", "--score-only"],
+                                    capture_output=True, text=True)
+        self.assertEqual(score_only.returncode, 0)
+
+if __name__ == "__main__":
+    unittest.main()